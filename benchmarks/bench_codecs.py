@@ -0,0 +1,122 @@
+"""Compare record codecs on realistic domain search payloads.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_codecs.py [--emails 200] [--repeat 5]
+
+Reports encode and decode throughput and the stored size per record for
+each codec/compression combination whose dependencies are installed.
+"""
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict, Iterator, List, Tuple
+
+from hunter_sdk.exceptions import ConfigurationError
+from hunter_sdk.storage.codecs import (
+    JSONCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    Serializer,
+    ZlibCompressor,
+    ZstdCompressor,
+)
+
+FIRST_NAMES = ['alice', 'bob', 'carol', 'dave', 'erin', 'frank', 'grace', 'heidi', 'ivan', 'judy']
+LAST_NAMES = ['smith', 'jones', 'taylor', 'brown', 'wilson', 'evans', 'thomas', 'roberts']
+DEPARTMENTS = ['executive', 'it', 'finance', 'management', 'sales', 'legal', 'support', 'hr', 'marketing']
+
+
+def domain_search_payload(emails: int, seed: int = 0) -> Dict[str, Any]:
+    """Build a domain search response shaped like the real API's.
+
+    Args:
+        emails: Number of email entries
+        seed: Random seed, so every codec sees the same payload
+
+    Returns:
+        Domain search result data
+    """
+    rng = random.Random(seed)
+    entries: List[Dict[str, Any]] = []
+    for index in range(emails):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        entries.append({
+            'value': f'{first}.{last}{index}@example.com',
+            'type': rng.choice(['personal', 'generic']),
+            'confidence': rng.randint(30, 99),
+            'first_name': first.title(),
+            'last_name': last.title(),
+            'position': 'Head of ' + rng.choice(DEPARTMENTS).title(),
+            'seniority': rng.choice(['junior', 'senior', 'executive', None]),
+            'department': rng.choice(DEPARTMENTS),
+            'linkedin': None,
+            'twitter': None,
+            'phone_number': None,
+            'verification': {'date': '2024-03-01', 'status': rng.choice(['valid', 'accept_all'])},
+            'sources': [
+                {
+                    'domain': 'example.com',
+                    'uri': f'https://example.com/team/{first}-{last}-{source}',
+                    'extracted_on': '2023-06-12',
+                    'last_seen_on': '2024-02-27',
+                    'still_on_page': True,
+                }
+                for source in range(rng.randint(1, 3))
+            ],
+        })
+    return {
+        'domain': 'example.com',
+        'disposable': False,
+        'webmail': False,
+        'accept_all': False,
+        'pattern': '{first}.{last}',
+        'organization': 'Example Inc',
+        'description': 'Example Inc builds examples for documentation.',
+        'industry': 'Technology',
+        'country': 'US',
+        'emails': entries,
+        'linked_domains': [],
+        'meta': {'results': emails, 'limit': emails, 'offset': 0, 'params': {'domain': 'example.com'}},
+    }
+
+
+def serializers() -> Iterator[Tuple[str, Serializer]]:
+    """Yield labelled serializers for every installed codec and compressor."""
+    codecs = [('json', JSONCodec), ('orjson', OrjsonCodec), ('msgpack', MsgpackCodec)]
+    compressors = [('none', None), ('zlib', ZlibCompressor), ('zstd', ZstdCompressor)]
+    for codec_name, codec_class in codecs:
+        for compressor_name, compressor_class in compressors:
+            try:
+                codec = codec_class()
+                compressor = None if compressor_class is None else compressor_class()
+            except ConfigurationError:
+                continue
+            yield f'{codec_name}+{compressor_name}', Serializer(codec, compressor, compress_threshold=0)
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--emails', type=int, default=200, help='email entries per payload')
+    parser.add_argument('--repeat', type=int, default=5, help='timing rounds; the best is reported')
+    args = parser.parse_args()
+
+    payload = domain_search_payload(args.emails)
+    print(f'domain_search payload with {args.emails} emails')
+    print(f"{'codec':<18}{'bytes':>10}{'bytes/email':>13}{'encode/s':>12}{'decode/s':>12}")
+    for label, serializer in serializers():
+        data = serializer.dumps(payload)
+        assert serializer.loads(data) == payload
+        number = max(1, 20000 // args.emails)
+        encode = min(timeit.repeat(lambda: serializer.dumps(payload), number=number, repeat=args.repeat))
+        decode = min(timeit.repeat(lambda: serializer.loads(data), number=number, repeat=args.repeat))
+        print(
+            f'{label:<18}{len(data):>10}{len(data) / args.emails:>13.1f}'
+            f'{number / encode:>12.0f}{number / decode:>12.0f}',
+        )
+
+
+if __name__ == '__main__':
+    main()
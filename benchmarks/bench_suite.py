@@ -0,0 +1,453 @@
+"""Offline benchmark suite for clients, services, storage and rate limiters.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_suite.py [--quick] [--output results.json] [--compare baseline.json]
+
+Networked benchmarks run against ``mock_api.MockHunterAPI`` on localhost,
+so no API key or network access is needed. Every benchmark reports
+operations per second and, where operations are timed individually, p50
+and p99 latency in milliseconds. Storage benchmarks add the memory (or
+disk) used per cached entry and rate limiter benchmarks how closely the
+achieved rate matches the configured one.
+
+Results are written as JSON together with the settings and environment of
+the run; pass an earlier file to ``--compare`` to print the change of
+every metric.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from mock_api import MockAPIOptions, MockHunterAPI
+
+from hunter_sdk import AsyncHunterClient, HunterClient, HunterConfig, InMemoryMetrics
+from hunter_sdk.exceptions import HunterSDKError
+from hunter_sdk.metrics import RETRIES
+from hunter_sdk.services import DomainSearchService, EmailVerificationService
+from hunter_sdk.storage import BaseStorage, LRUStorage, MemoryStorage, SQLiteStorage, TieredStorage
+from hunter_sdk.utils.rate_limiter import RateLimiter, TokenBucketRateLimiter
+
+SCHEMA_VERSION = 1
+GROUPS = ('client', 'service', 'storage', 'rate_limiter')
+
+# Metrics compared by --compare, and whether a higher value is better
+COMPARED_METRICS = {
+    'ops_per_sec': True,
+    'p50_ms': False,
+    'p99_ms': False,
+    'bytes_per_entry': False,
+    'rate_error_pct': False,
+}
+
+Result = Dict[str, Any]
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of samples.
+
+    Args:
+        samples: Measured values
+        fraction: Percentile between 0 and 1
+
+    Returns:
+        The smallest sample with at least fraction of samples at or below it
+    """
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(ops: int, seconds: float, latencies: Optional[Sequence[float]] = None, **extra: Any) -> Result:
+    """Build a result record.
+
+    Args:
+        ops: Operations performed
+        seconds: Wall time of all operations
+        latencies: Seconds per operation, if operations were timed individually
+        **extra: Additional metrics of the benchmark
+
+    Returns:
+        Result with throughput and, given latencies, p50 and p99 in milliseconds
+    """
+    result: Result = {'ops': ops, 'seconds': round(seconds, 6), 'ops_per_sec': round(ops / seconds, 2)}
+    if latencies:
+        result['p50_ms'] = round(percentile(latencies, 0.5) * 1000, 4)
+        result['p99_ms'] = round(percentile(latencies, 0.99) * 1000, 4)
+    result.update(extra)
+    return result
+
+
+def timed_calls(calls: Sequence[Callable[[], Any]], workers: int = 1) -> Result:
+    """Run calls, timing each of them, on up to workers threads.
+
+    Args:
+        calls: Operations to run
+        workers: Number of threads
+
+    Returns:
+        Result of the run; ``errors`` counts calls raising HunterSDKError
+    """
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def run(call: Callable[[], Any]) -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            call()
+        except HunterSDKError:
+            with lock:
+                errors += 1
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    if workers == 1:
+        for call in calls:
+            run(call)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, calls))
+    return summarize(len(calls), time.perf_counter() - started, latencies, errors=errors)
+
+
+def emails(count: int, prefix: str = 'user') -> List[str]:
+    """Return count distinct addresses."""
+    return [f'{prefix}{index}@bench{index % 50}.example.com' for index in range(count)]
+
+
+def bench_config(api: MockHunterAPI, **options: Any) -> HunterConfig:
+    """Return a configuration pointing at the mock API without rate limiting."""
+    return HunterConfig(api_key='bench', base_url=api.base_url, rate_limit=None, **options)
+
+
+def bench_client(args: argparse.Namespace) -> Iterator[Result]:
+    """Benchmark raw client calls, sequential, concurrent, async and with injected faults."""
+    with MockHunterAPI(MockAPIOptions(latency=args.latency, seed=args.seed)) as api:
+        client = HunterClient(bench_config(api, pool_maxsize=args.pool_maxsize))
+        client.verify_email('warmup@example.com')
+        addresses = emails(args.requests)
+        yield {'name': 'client.verify_email.sequential', **timed_calls(
+            [lambda email=email: client.verify_email(email) for email in addresses],
+        )}
+        result = timed_calls([lambda email=email: client.verify_email(email) for email in addresses], args.workers)
+        pool = client.pool_stats()
+        yield {
+            'name': 'client.verify_email.threads',
+            'workers': args.workers,
+            'connections_opened': pool.opened,
+            'connections_discarded': pool.discarded,
+            **result,
+        }
+        yield {'name': 'client.verify_email.async', 'concurrency': args.workers, **run_async_client(
+            api, addresses, args.workers,
+        )}
+
+    options = MockAPIOptions(
+        latency=args.latency,
+        rate_limited_rate=args.rate_limited_rate,
+        error_rate=args.error_rate,
+        retry_after=0,
+        seed=args.seed,
+    )
+    with MockHunterAPI(options) as api:
+        metrics = InMemoryMetrics()
+        client = HunterClient(bench_config(
+            api,
+            metrics=metrics,
+            pool_maxsize=args.pool_maxsize,
+            retry_delay=0.001,
+            retry_max_delay=0.01,
+            max_retries=5,
+            retry_budget_ratio=None,
+        ))
+        result = timed_calls([lambda email=email: client.verify_email(email) for email in addresses], args.workers)
+        yield {
+            'name': 'client.verify_email.faults',
+            'workers': args.workers,
+            'retries': int(metrics.counter(RETRIES, endpoint='email-verifier')),
+            'statuses': {str(status): count for status, count in sorted(api.statuses.items())},
+            **result,
+        }
+
+
+def run_async_client(api: MockHunterAPI, addresses: Sequence[str], concurrency: int) -> Result:
+    """Verify addresses with the async client, at most concurrency at a time."""
+    latencies: List[float] = []
+
+    async def run() -> float:
+        async with AsyncHunterClient(bench_config(api), max_connections=concurrency) as client:
+            await client.verify_email('warmup@example.com')
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def verify(email: str) -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    await client.verify_email(email)
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(verify(email) for email in addresses))
+            return time.perf_counter() - started
+
+    return summarize(len(addresses), asyncio.run(run()), latencies)
+
+
+def bench_service(args: argparse.Namespace) -> Iterator[Result]:
+    """Benchmark cached services: cold and warm bulk verification and paginated crawls."""
+    with MockHunterAPI(MockAPIOptions(latency=args.latency, results_per_domain=args.results, seed=args.seed)) as api:
+        metrics = InMemoryMetrics()
+        client = HunterClient(bench_config(api, metrics=metrics, pool_maxsize=args.pool_maxsize))
+        service = EmailVerificationService(client, LRUStorage(max_entries=None))
+        addresses = emails(args.requests, prefix='service')
+        for phase in ('cold', 'warm'):
+            started = time.perf_counter()
+            verified = sum(1 for _ in service.verify_many(addresses, max_workers=args.workers))
+            yield {
+                'name': f'service.verify_many.{phase}',
+                'workers': args.workers,
+                **summarize(verified, time.perf_counter() - started),
+            }
+        yield {'name': 'service.verify_email.cached', **timed_calls(
+            [lambda email=email: service.verify_email(email) for email in addresses],
+        ), 'hit_ratio': metrics.cache_hit_ratio('email')}
+
+        search = DomainSearchService(client, MemoryStorage())
+        domains = [f'company{index}.example.com' for index in range(args.domains)]
+        started = time.perf_counter()
+        pages = sum(1 for domain in domains for _ in search.iter_all_results(domain, batch_size=100))
+        yield {
+            'name': 'service.iter_all_results.pages',
+            'results_per_domain': args.results,
+            'domains': len(domains),
+            **summarize(pages, time.perf_counter() - started),
+        }
+
+
+def verification_record(index: int) -> Dict[str, Any]:
+    """Build a cached verification record like the services store."""
+    return {
+        'status': 'valid',
+        'result': 'deliverable',
+        'score': index % 100,
+        'email': f'user{index}@example.com',
+        'regexp': True,
+        'gibberish': False,
+        'disposable': False,
+        'webmail': False,
+        'mx_records': True,
+        'smtp_server': True,
+        'smtp_check': True,
+        'accept_all': False,
+        'block': False,
+        'sources': [],
+    }
+
+
+def storage_backends(directory: str) -> Iterator[Any]:
+    """Yield (name, storage, path on disk or None) for every local backend."""
+    yield 'memory', MemoryStorage(), None
+    yield 'lru', LRUStorage(max_entries=None), None
+    sqlite_path = os.path.join(directory, 'bench.db')
+    yield 'sqlite', SQLiteStorage(sqlite_path), sqlite_path
+    tiered_path = os.path.join(directory, 'tiered.db')
+    yield 'tiered', TieredStorage(SQLiteStorage(tiered_path), max_entries=1024), tiered_path
+
+
+def disk_usage(path: str) -> int:
+    """Return the size of a SQLite database including its write-ahead log."""
+    return sum(os.path.getsize(name) for name in (path, f'{path}-wal') if os.path.exists(name))
+
+
+def bench_storage(args: argparse.Namespace) -> Iterator[Result]:
+    """Benchmark writes, hits and misses of every local storage backend."""
+    count = args.entries
+    keys = [f'hunter:v1:email:user{index}@example.com' for index in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, storage, path in storage_backends(directory):
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            write = timed_calls([
+                lambda key=key, index=index: storage.upsert(key, verification_record(index))
+                for index, key in enumerate(keys)
+            ])
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+            footprint = {'bytes_per_entry': round(retained / count, 1), 'memory': 'heap'}
+            if name == 'sqlite':
+                footprint = {'bytes_per_entry': round(disk_usage(path) / count, 1), 'memory': 'disk'}
+
+            yield {'name': f'storage.{name}.upsert', **write, **footprint}
+            yield {'name': f'storage.{name}.read_hit', **timed_calls(
+                [lambda key=key: storage.read(key) for key in keys],
+            )}
+            yield {'name': f'storage.{name}.read_miss', **timed_calls(
+                [lambda key=key: storage.read(f'{key}.missing') for key in keys],
+            )}
+            yield {'name': f'storage.{name}.read_many', **summarize_batch(storage, keys)}
+
+
+def summarize_batch(storage: BaseStorage, keys: Sequence[str], batch_size: int = 100) -> Result:
+    """Time batched reads of keys, reporting throughput per key."""
+    latencies = []
+    started = time.perf_counter()
+    for offset in range(0, len(keys), batch_size):
+        batch_started = time.perf_counter()
+        storage.read_many(keys[offset:offset + batch_size])
+        latencies.append(time.perf_counter() - batch_started)
+    return summarize(len(keys), time.perf_counter() - started, latencies, batch_size=batch_size)
+
+
+def bench_rate_limiter(args: argparse.Namespace) -> Iterator[Result]:
+    """Measure how closely rate limiters hold their configured rate under contention."""
+    rate = args.limiter_rate
+    window = 0.5
+    max_requests = int(rate * window)
+    limiters = [
+        ('sliding_window', RateLimiter(max_requests, time_window=window), max_requests),
+        ('token_bucket', TokenBucketRateLimiter(max_requests, time_window=window, burst=1), 1),
+    ]
+    for name, limiter, initial in limiters:
+        total = int(rate * args.limiter_seconds) + initial
+        stamps: List[float] = []
+        lock = threading.Lock()
+
+        def acquire(_: int, limiter: Any = limiter) -> None:
+            limiter.acquire()
+            now = time.monotonic()
+            with lock:
+                stamps.append(now)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(acquire, range(total)))
+        elapsed = time.monotonic() - started
+
+        # Requests beyond the initial allowance must be spread at the configured rate
+        expected = (total - initial) / rate
+        stamps.sort()
+        busiest = max(bisect_left(stamps, first + window) - index for index, first in enumerate(stamps))
+        yield {
+            'name': f'rate_limiter.{name}',
+            'configured_rate': rate,
+            'achieved_rate': round((total - initial) / elapsed, 2),
+            'rate_error_pct': round((elapsed - expected) / expected * 100, 2),
+            'max_in_window': busiest,
+            'window_limit': max_requests,
+            **summarize(total, elapsed),
+        }
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Iterator[Result]]] = {
+    'client': bench_client,
+    'service': bench_service,
+    'storage': bench_storage,
+    'rate_limiter': bench_rate_limiter,
+}
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and interpreter of the run."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print the change of every compared metric between two runs."""
+    if baseline.get('settings') != current['settings']:
+        print('warning: settings differ from the baseline, results may not be comparable', file=sys.stderr)
+    print(f"{'benchmark':<40}{'metric':<18}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in current['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in result or metric not in previous or not previous[metric]:
+                continue
+            change = (result[metric] - previous[metric]) / abs(previous[metric]) * 100
+            better = change > 0 if higher_is_better else change < 0
+            marker = '+' if better else '-' if change else ' '
+            print(
+                f'{name:<40}{metric:<18}{previous[metric]:>12.4g}{result[metric]:>12.4g}'
+                f'{change:>9.1f}%{marker}',
+            )
+
+
+def main() -> None:
+    """Run the selected benchmarks, print and save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--only', default=','.join(GROUPS), help=f'comma separated groups of {", ".join(GROUPS)}')
+    parser.add_argument('--quick', action='store_true', help='small sizes for a smoke run')
+    parser.add_argument('--requests', type=int, default=2000, help='API calls per client and service benchmark')
+    parser.add_argument('--workers', type=int, default=16, help='threads or concurrent tasks')
+    parser.add_argument('--pool-maxsize', type=int, default=10, help='connections kept by the sync client')
+    parser.add_argument('--latency', type=float, default=0.002, help='seconds the mock API takes per response')
+    parser.add_argument('--rate-limited-rate', type=float, default=0.05, help='share of 429s in the faults run')
+    parser.add_argument('--error-rate', type=float, default=0.05, help='share of 503s in the faults run')
+    parser.add_argument('--results', type=int, default=1000, help='domain search results per domain')
+    parser.add_argument('--domains', type=int, default=5, help='domains crawled by iter_all_results')
+    parser.add_argument('--entries', type=int, default=10000, help='records per storage benchmark')
+    parser.add_argument('--limiter-rate', type=float, default=400, help='requests per second of limiter runs')
+    parser.add_argument('--limiter-seconds', type=float, default=2.0, help='duration of limiter runs')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the mock API fault injection')
+    parser.add_argument('--output', help='file to write the JSON results to')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+    if args.quick:
+        args.requests, args.results, args.domains = 200, 300, 2
+        args.entries, args.limiter_seconds = 1000, 0.5
+
+    groups = [group.strip() for group in args.only.split(',') if group.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f'unknown groups: {", ".join(sorted(unknown))}')
+
+    settings = {name: value for name, value in vars(args).items() if name not in ('output', 'compare', 'only')}
+    report: Dict[str, Any] = {
+        'schema': SCHEMA_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'settings': settings,
+        'results': {},
+    }
+    for group in groups:
+        for result in BENCHMARKS[group](args):
+            name = result.pop('name')
+            report['results'][name] = result
+            latency = f"  p50 {result['p50_ms']:.3f}ms  p99 {result['p99_ms']:.3f}ms" if 'p50_ms' in result else ''
+            print(f"{name:<40}{result['ops_per_sec']:>12.1f} ops/s{latency}", flush=True)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+            output.write('\n')
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline:
+            compare(json.load(baseline), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""In-process stand-in for the Hunter API used by the benchmarks.
+
+Serves ``email-verifier`` and paginated ``domain-search`` responses shaped
+like the real API's over HTTP/1.1 with keep-alive, from a thread of the
+benchmarking process. Latency, 429 and 5xx responses are injected from a
+seeded random generator, so runs with the same options see the same
+sequence of faults::
+
+    with MockHunterAPI(MockAPIOptions(latency=0.005, error_rate=0.05)) as api:
+        client = HunterClient(HunterConfig(api_key='bench', base_url=api.base_url))
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench_codecs import domain_search_payload
+
+API_PREFIX = '/v2'
+
+
+@dataclass
+class MockAPIOptions:
+    """Behaviour of the mock API.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Maximum random seconds added on top of latency
+        rate_limited_rate: Share of requests answered with 429
+        error_rate: Share of requests answered with 503
+        retry_after: Retry-After seconds sent with 429 responses, or None to omit the header
+        results_per_domain: Total domain search results of every domain
+        seed: Seed of the fault and jitter generator
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limited_rate: float = 0.0
+    error_rate: float = 0.0
+    retry_after: Optional[float] = None
+    results_per_domain: int = 250
+    seed: int = 0
+
+
+class MockHunterAPI:
+    """Local HTTP server answering like the Hunter API.
+
+    Usable as a context manager, which starts the server on a free port of
+    127.0.0.1 and stops it on exit. ``statuses`` counts the responses sent
+    by status code.
+    """
+
+    def __init__(self, options: Optional[MockAPIOptions] = None) -> None:
+        """Initialize server.
+
+        Args:
+            options: Latency, fault and pagination settings
+        """
+        self.options = options or MockAPIOptions()
+        self.statuses: 'Counter[int]' = Counter()
+        self._random = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._domain_emails = domain_search_payload(self.options.results_per_domain)['emails']
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to configure clients with."""
+        if self._server is None:
+            raise RuntimeError('The mock API is not running')
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}{API_PREFIX}'
+
+    def start(self) -> None:
+        """Start serving on a background thread."""
+        api = self
+
+        class Handler(_Handler):
+            mock_api = api
+
+        self._server = _Server(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-hunter-api', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MockHunterAPI':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _draw(self) -> Tuple[float, Optional[int]]:
+        """Draw the extra latency and injected fault status of one request."""
+        options = self.options
+        with self._lock:
+            jitter = self._random.uniform(0, options.jitter) if options.jitter else 0.0
+            roll = self._random.random()
+        if roll < options.rate_limited_rate:
+            return jitter, 429
+        if roll < options.rate_limited_rate + options.error_rate:
+            return jitter, 503
+        return jitter, None
+
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        """Build the response to one request.
+
+        Args:
+            path: Request path
+            query: Query parameters
+
+        Returns:
+            Status code, extra headers and JSON body
+        """
+        jitter, fault = self._draw()
+        delay = self.options.latency + jitter
+        if delay:
+            time.sleep(delay)
+
+        if fault == 429:
+            headers = {} if self.options.retry_after is None else {'Retry-After': f'{self.options.retry_after:g}'}
+            return 429, headers, _errors('too_many_requests', 'You have reached the rate limit')
+        if fault is not None:
+            return fault, {}, _errors('service_unavailable', 'The service is temporarily unavailable')
+        if not query.get('api_key'):
+            return 401, {}, _errors('authentication_failed', 'No user found for the API key supplied')
+
+        endpoint = path[len(API_PREFIX):].strip('/') if path.startswith(API_PREFIX) else ''
+        if endpoint == 'email-verifier' and query.get('email'):
+            return 200, {}, _verification(query['email'])
+        if endpoint == 'domain-search' and query.get('domain'):
+            return 200, {}, self._domain_search(query)
+        return 400, {}, _errors('wrong_params', 'Unknown endpoint or missing parameter')
+
+    def _domain_search(self, query: Dict[str, str]) -> Dict[str, Any]:
+        """Build one page of domain search results."""
+        limit = int(query.get('limit') or 10)
+        offset = int(query.get('offset') or 0)
+        domain = query['domain']
+        return {
+            'data': {
+                'domain': domain,
+                'disposable': False,
+                'webmail': False,
+                'accept_all': False,
+                'pattern': '{first}.{last}',
+                'organization': domain.split('.')[0].title(),
+                'emails': self._domain_emails[offset:offset + limit],
+            },
+            'meta': {
+                'results': len(self._domain_emails),
+                'limit': limit,
+                'offset': offset,
+                'params': {'domain': domain, 'type': query.get('type')},
+            },
+        }
+
+
+def _errors(code: str, details: str) -> Dict[str, Any]:
+    """Build an API error body."""
+    return {'errors': [{'id': code, 'code': code, 'details': details}]}
+
+
+def _verification(email: str) -> Dict[str, Any]:
+    """Build a deterministic email verification result for an address."""
+    score = hashlib.sha1(email.encode()).digest()[0] * 100 // 255
+    status = 'valid' if score >= 50 else 'accept_all' if score >= 20 else 'invalid'
+    return {
+        'data': {
+            'status': status,
+            'result': 'undeliverable' if status == 'invalid' else 'deliverable',
+            'score': score,
+            'email': email,
+            'regexp': True,
+            'gibberish': False,
+            'disposable': False,
+            'webmail': False,
+            'mx_records': True,
+            'smtp_server': True,
+            'smtp_check': status == 'valid',
+            'accept_all': status == 'accept_all',
+            'block': False,
+            'sources': [],
+        },
+        'meta': {'params': {'email': email}},
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+    mock_api: MockHunterAPI
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        status, headers, body = self.mock_api.respond(url.path, query)
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        with self.mock_api._lock:
+            self.mock_api.statuses[status] += 1
+
+    def log_message(self, *args: Any) -> None:
+        """Keep benchmark output clean."""
@@ -1,13 +1,53 @@
 """Hunter SDK package."""
 
+from .async_client import AsyncHunterClient
+from .circuit_breaker import CircuitBreaker, CircuitState
 from .client import HunterClient
 from .config import HunterConfig
-from .exceptions import ConfigurationError, HunterAPIError, HunterSDKError
+from .decoders import JSONDecoder, MsgspecDecoder, OrjsonDecoder, ResponseDecoder
+from .exceptions import (
+    CircuitOpenError,
+    ConfigurationError,
+    HunterAPIError,
+    HunterConnectionError,
+    HunterSDKError,
+    ValidationError,
+)
+from .metrics import InMemoryMetrics, Metrics, NoOpMetrics, PrometheusMetrics
+from .retry import RetryBudget, RetryPolicy
+from .tracing import CallTrace, MultiTracer, NoOpTracer, OpenTelemetryTracer, SlowCallLogger, Tracer
+from .transport import HTTPXTransport, PoolStats, RequestsTransport, Transport
 
 __all__ = [
     'HunterClient',
+    'AsyncHunterClient',
     'HunterConfig',
     'HunterSDKError',
     'HunterAPIError',
+    'HunterConnectionError',
     'ConfigurationError',
+    'CircuitOpenError',
+    'ValidationError',
+    'CircuitBreaker',
+    'CircuitState',
+    'Metrics',
+    'NoOpMetrics',
+    'InMemoryMetrics',
+    'PrometheusMetrics',
+    'Tracer',
+    'NoOpTracer',
+    'MultiTracer',
+    'SlowCallLogger',
+    'OpenTelemetryTracer',
+    'CallTrace',
+    'Transport',
+    'RequestsTransport',
+    'HTTPXTransport',
+    'PoolStats',
+    'ResponseDecoder',
+    'JSONDecoder',
+    'OrjsonDecoder',
+    'MsgspecDecoder',
+    'RetryPolicy',
+    'RetryBudget',
 ]
@@ -0,0 +1,426 @@
+"""Asyncio Hunter API client implementation."""
+
+import asyncio
+import time
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, Union
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker, CircuitState, is_outage
+from .client import (
+    attempt_timeout,
+    build_domain_search_params,
+    build_retry_policy,
+    parse_error_details,
+    unpack_envelope,
+)
+from .config import HunterConfig
+from .decoders import default_decoder
+from .exceptions import CircuitOpenError, ConfigurationError, HunterAPIError, HunterConnectionError
+from .metrics import Metrics, NoOpMetrics
+from .retry import RetryState
+from .tracing import CallTrace, NoOpTracer, Tracer, finish_call, start_call
+from .transport import PoolStats, httpx_pool_stats
+from .utils.rate_limiter import AsyncRateLimiter, AsyncTokenBucketRateLimiter
+
+
+# Transport failures worth retrying, matching the sync client's; anything else
+# (unsupported protocol, invalid request, proxy misconfiguration) is a bug
+_RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+    httpx.TimeoutException,
+)
+
+# httpcore trace events marking connection setup: DNS lookup and connect, then TLS
+_CONNECT_EVENTS = ('connection.connect_tcp', 'connection.start_tls')
+
+
+def _connect_tracer(call: CallTrace) -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+    """Build an httpx trace extension adding connection setup time to call.connect.
+
+    Args:
+        call: Trace of the call
+
+    Returns:
+        Callback for the ``trace`` request extension
+    """
+    started: Dict[str, float] = {}
+
+    async def trace(event_name: str, info: Dict[str, Any]) -> None:
+        phase, _, stage = event_name.rpartition('.')
+        if phase not in _CONNECT_EVENTS:
+            return
+        if stage == 'started':
+            started[phase] = time.perf_counter()
+        elif stage in ('complete', 'failed') and phase in started:
+            call.connect += time.perf_counter() - started.pop(phase)
+
+    return trace
+
+
+class AsyncHunterClient:
+    """Asyncio client for interacting with Hunter API.
+
+    All requests share one pooled ``httpx.AsyncClient``, so a single
+    process can keep many requests in flight at once. The keep-alive,
+    compression, HTTP/2 and timeout options of the configuration apply;
+    the pool is sized by ``max_connections`` instead of the sync client's
+    ``pool_*`` options.
+    """
+
+    def __init__(self, config: HunterConfig, max_connections: int = 100) -> None:
+        """Initialize async Hunter client.
+
+        Args:
+            config: Hunter API configuration
+            max_connections: Maximum number of pooled HTTP connections
+
+        Raises:
+            ConfigurationError: If API key is not provided, or HTTP/2 is
+                requested without the h2 package
+        """
+        if not config.api_key:
+            raise ConfigurationError("API key is required")
+        self._config = config
+        self._max_connections = max_connections
+        try:
+            self._http = httpx.AsyncClient(
+                timeout=config.timeout,
+                http2=config.http2,
+                headers={} if config.compression else {'Accept-Encoding': 'identity'},
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections if config.keep_alive else 0,
+                ),
+            )
+        except ImportError as e:
+            raise ConfigurationError('HTTP/2 requires the h2 package (pip install httpx[http2])') from e
+        self._rate_limiter: Optional[Union[AsyncRateLimiter, AsyncTokenBucketRateLimiter]] = None
+        if config.rate_limit and config.rate_limit_burst:
+            self._rate_limiter = AsyncTokenBucketRateLimiter(config.rate_limit, burst=config.rate_limit_burst)
+        elif config.rate_limit:
+            self._rate_limiter = AsyncRateLimiter(config.rate_limit)
+        self._retry_policy = build_retry_policy(config)
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics = config.metrics or NoOpMetrics()
+        self._tracer = config.tracer or NoOpTracer()
+        self._decoder = config.decoder or default_decoder()
+
+    async def __aenter__(self) -> 'AsyncHunterClient':
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Close the connection pool on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    def pool_stats(self) -> PoolStats:
+        """Return the usage of the connection pool, to size max_connections from data.
+
+        Returns:
+            Current pool usage; httpx keeps no totals, so those are unset
+        """
+        return httpx_pool_stats(self._http, self._max_connections)
+
+    def _attempt_timeout(self, retry: RetryState) -> Union[float, httpx.Timeout]:
+        """Return the httpx timeout of the next attempt.
+
+        Args:
+            retry: Retry state of the call
+
+        Returns:
+            Seconds for the whole attempt, or an httpx.Timeout with separate
+            connect and read timeouts when either is configured
+        """
+        timeout = attempt_timeout(self._config, retry)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return timeout
+
+    def _circuit_breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker tracking endpoint, if circuit breaking is enabled.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            The endpoint's circuit breaker, or None
+        """
+        if self._config.circuit_failure_threshold is None:
+            return None
+        breaker = self._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(endpoint, CircuitBreaker(
+                failure_threshold=self._config.circuit_failure_threshold,
+                recovery_timeout=self._config.circuit_recovery_timeout,
+            ))
+        return breaker
+
+    @property
+    def metrics(self) -> Metrics:
+        """Return the metrics sink shared with services using this client."""
+        return self._metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the tracer shared with services using this client."""
+        return self._tracer
+
+    def circuit_state(self, endpoint: str) -> CircuitState:
+        """Return the circuit state of an endpoint.
+
+        Args:
+            endpoint: API endpoint, e.g. ``email-verifier`` or ``domain-search``
+
+        Returns:
+            Current circuit state; always closed when circuit breaking is disabled
+        """
+        breaker = self._circuit_breaker(endpoint)
+        return CircuitState.CLOSED if breaker is None else breaker.state
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        include_meta: bool = False,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make HTTP request with circuit breaking, rate limiting and retries.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            include_meta: If True, add the response ``meta`` object to the data
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            HunterAPIError: If API returns an error or retries are exhausted
+            HunterConnectionError: If the API cannot be reached
+        """
+        breaker = self._circuit_breaker(endpoint)
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+
+        call = start_call(self._tracer, method, endpoint)
+        try:
+            if self._rate_limiter:
+                timed = call is not None or self._metrics.enabled
+                started = time.perf_counter() if timed else 0.0
+                await self._rate_limiter.acquire()
+                if timed:
+                    waited = time.perf_counter() - started
+                    self._metrics.observe_rate_limit_wait(endpoint, waited)
+                    if call is not None:
+                        call.rate_limit_wait = waited
+            result = await self._send(method, endpoint, include_meta, call, **kwargs)
+        except BaseException as e:
+            if breaker is not None:
+                if not isinstance(e, Exception):
+                    # Cancelled or interrupted: no outcome, so hand back a half-open trial slot
+                    breaker.release()
+                elif is_outage(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if call is not None:
+                finish_call(self._tracer, call, e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        if call is not None:
+            finish_call(self._tracer, call)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        include_meta: bool,
+        call: Optional[CallTrace] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying as the retry policy allows.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            include_meta: If True, add the response ``meta`` object to the data
+            call: Trace to record attempts in, or None when tracing is disabled
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+
+        Raises:
+            HunterAPIError: If API returns an error or retries are exhausted
+            HunterConnectionError: If the API cannot be reached
+        """
+        timed = call is not None or self._metrics.enabled
+        if call is not None:
+            kwargs['extensions'] = {'trace': _connect_tracer(call)}
+        retry = self._retry_policy.start()
+        while True:
+            started = time.perf_counter() if timed else 0.0
+            connected = 0.0
+            if call is not None:
+                call.attempts += 1
+                connected = call.connect
+                self._tracer.before_request(call)
+            try:
+                response = await self._http.request(
+                    method=method,
+                    url=f'{self._config.base_url}/{endpoint}',
+                    timeout=self._attempt_timeout(retry),
+                    **kwargs,
+                )
+            except _RETRYABLE_EXCEPTIONS as e:
+                if timed:
+                    self._observe_attempt(endpoint, call, 'error', started, connected)
+                delay = retry.next_delay()
+                if delay is None:
+                    raise HunterConnectionError(f"{retry.exhausted_reason}: {e}") from e
+                if timed:
+                    self._observe_retry(endpoint, call, delay)
+                await asyncio.sleep(delay)
+                if retry.deadline_passed():
+                    raise HunterConnectionError(f"{retry.exhausted_reason}: {e}") from e
+                continue
+            except httpx.HTTPError as e:
+                if timed:
+                    self._observe_attempt(endpoint, call, 'error', started, connected)
+                raise HunterConnectionError(str(e)) from e
+            if timed:
+                self._observe_attempt(endpoint, call, str(response.status_code), started, connected)
+
+            if response.is_success:
+                if call is not None:
+                    decode_started = time.perf_counter()
+                    payload = self._decoder.decode(response.content, endpoint)
+                    call.decode += time.perf_counter() - decode_started
+                else:
+                    payload = self._decoder.decode(response.content, endpoint)
+                return unpack_envelope(payload, include_meta)
+
+            if not self._retry_policy.is_retryable_status(response.status_code):
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=parse_error_details(lambda: self._decoder.loads(response.content)),
+                )
+
+            delay = retry.next_delay(response.headers)
+            if delay is None:
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=retry.exhausted_reason,
+                )
+            if timed:
+                self._observe_retry(endpoint, call, delay)
+            await asyncio.sleep(delay)
+            if retry.deadline_passed():
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=retry.exhausted_reason,
+                )
+
+    def _observe_attempt(
+        self,
+        endpoint: str,
+        call: Optional[CallTrace],
+        status: str,
+        started: float,
+        connected: float,
+    ) -> None:
+        """Report one HTTP attempt to the metrics sink and tracer.
+
+        Args:
+            endpoint: API endpoint
+            call: Trace of the call, or None when tracing is disabled
+            status: HTTP status code, or ``error`` if no response arrived
+            started: perf_counter() value when the attempt started
+            connected: call.connect before the attempt
+        """
+        duration = time.perf_counter() - started
+        self._metrics.observe_request(endpoint, status, duration)
+        if call is not None:
+            call.server += duration - (call.connect - connected)
+            call.status = status
+            self._tracer.after_response(call)
+
+    def _observe_retry(self, endpoint: str, call: Optional[CallTrace], delay: float) -> None:
+        """Report a retry to the metrics sink and tracer.
+
+        Args:
+            endpoint: API endpoint
+            call: Trace of the call, or None when tracing is disabled
+            delay: Seconds about to be slept
+        """
+        self._metrics.observe_retry(endpoint, delay)
+        if call is not None:
+            call.backoff += delay
+            self._tracer.on_retry(call, delay)
+
+    async def verify_email(self, email: str) -> Dict[str, Any]:
+        """Verify email address using Hunter API.
+
+        Args:
+            email: Email address to verify
+
+        Returns:
+            Dict containing verification results
+
+        Raises:
+            HunterAPIError: If API request fails
+        """
+        return await self._make_request(
+            'GET',
+            'email-verifier',
+            params={'email': email, 'api_key': self._config.api_key},
+        )
+
+    async def domain_search(
+        self,
+        domain: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Search for email addresses in a domain.
+
+        Args:
+            domain: Domain to search
+            limit: Maximum number of results per page
+            offset: Number of results to skip
+            type: Type of emails to return (generic or personal)
+
+        Returns:
+            Dict containing search results, with the response ``meta``
+            (total ``results``, ``limit`` and ``offset``) under ``meta``
+
+        Raises:
+            HunterAPIError: If API request fails
+        """
+        params = build_domain_search_params(
+            self._config.api_key,
+            domain,
+            limit=limit,
+            offset=offset,
+            type=type,
+        )
+        return await self._make_request('GET', 'domain-search', include_meta=True, params=params)
@@ -0,0 +1,150 @@
+"""Circuit breaker for shedding load while the API is unhealthy."""
+
+import time
+from enum import Enum
+from threading import Lock
+from typing import Optional
+
+from .exceptions import HunterAPIError, HunterConnectionError
+
+
+def is_outage(error: BaseException) -> bool:
+    """Check whether a request error indicates the API is unhealthy.
+
+    Client errors such as a malformed email say nothing about API health
+    and do not count against the circuit.
+
+    Args:
+        error: Error raised by the request
+
+    Returns:
+        True for connection failures and server errors
+    """
+    if isinstance(error, HunterConnectionError):
+        return True
+    return isinstance(error, HunterAPIError) and error.status_code >= 500
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected without touching the network. Once
+    ``recovery_timeout`` has passed, up to ``half_open_max_calls`` trial
+    requests are let through: a success closes the circuit again, a
+    failure re-opens it. Trials that are cancelled hand their slot back
+    through ``release``, and trials that never report an outcome within
+    ``trial_timeout`` count as failures, so a lost trial cannot keep the
+    circuit half-open forever.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        trial_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before allowing trial requests
+            half_open_max_calls: Trial requests allowed at once while half-open
+            trial_timeout: Seconds after which unanswered trial requests re-open
+                the circuit, defaults to recovery_timeout
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._trial_timeout = recovery_timeout if trial_timeout is None else trial_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_started_at = 0.0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving from open to half-open when due."""
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _refresh_state(self) -> None:
+        """Move an open circuit to half-open once the recovery timeout passed.
+
+        A half-open circuit whose trial slots have been taken for longer than
+        the trial timeout is re-opened, as if the trials had failed.
+        """
+        now = time.monotonic()
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self._recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+        elif (
+            self._state is CircuitState.HALF_OPEN
+            and self._trial_calls >= self._half_open_max_calls
+            and now - self._trial_started_at >= self._trial_timeout
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = now
+
+    def retry_after(self) -> float:
+        """Return seconds until an open circuit allows trial requests.
+
+        Returns:
+            Remaining recovery time, or zero if requests are allowed
+        """
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, claiming a trial slot if half-open.
+
+        Returns:
+            True if the request may proceed
+        """
+        with self._lock:
+            self._refresh_state()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and self._trial_calls < self._half_open_max_calls:
+                self._trial_calls += 1
+                self._trial_started_at = time.monotonic()
+                return True
+            return False
+
+    def release(self) -> None:
+        """Hand back the trial slot of a request that ended without an outcome.
+
+        Call this instead of record_success or record_failure when a request
+        allowed by allow_request was cancelled or interrupted.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def record_success(self) -> None:
+        """Record a healthy response and close the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,109 @@
+"""Command-line interface: ``python -m hunter_sdk verify``."""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import ExitStack, closing
+from dataclasses import asdict
+from typing import List, Optional
+
+from .client import HunterClient
+from .config import HunterConfig
+from .exceptions import HunterSDKError
+from .services import BulkVerificationJob, EmailVerificationService
+from .services.bulk_verification import INPUT_FORMATS, OUTPUT_FORMATS
+from .storage import BaseStorage, LRUStorage, SQLiteStorage
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Returns:
+        Parser for all commands
+    """
+    parser = argparse.ArgumentParser(prog='hunter-sdk', description='Hunter.io API tools.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    verify = commands.add_parser(
+        'verify',
+        help='verify a list of email addresses',
+        description=(
+            'Verify the addresses of a CSV, JSONL or plain text file, streaming results to OUTPUT. '
+            'Progress is checkpointed next to OUTPUT, so an interrupted run resumes where it stopped.'
+        ),
+    )
+    verify.add_argument('input', help="input file, or '-' for stdin")
+    verify.add_argument('-o', '--output', default='-', help="output file, or '-' for stdout (default)")
+    verify.add_argument('--input-format', choices=INPUT_FORMATS, help='default: from the input file name, else txt')
+    verify.add_argument(
+        '--output-format', choices=OUTPUT_FORMATS, help='default: from the output file name, else jsonl',
+    )
+    verify.add_argument('--column', default='email', help='CSV column or JSONL field with the address')
+    verify.add_argument('--api-key', default=os.environ.get('HUNTER_API_KEY'), help='default: $HUNTER_API_KEY')
+    verify.add_argument('--cache', help='SQLite file caching results across runs (default: in-memory)')
+    verify.add_argument('--rate-limit', type=int, default=100, help='maximum requests per minute')
+    verify.add_argument('--batch-size', type=int, default=1000, help='rows per batch and checkpoint')
+    verify.add_argument('--workers', type=int, default=8, help='maximum verifications in flight')
+    verify.add_argument('--no-resume', action='store_true', help='ignore and replace an existing checkpoint')
+    verify.add_argument(
+        '--skip-undeliverable-domains',
+        action='store_true',
+        help='answer addresses at known disposable or MX-less domains without an API call',
+    )
+    return parser
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    """Run the verify command.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Process exit code
+    """
+    checkpoint_path = None if args.output == '-' else f'{args.output}.checkpoint'
+    if checkpoint_path is not None and args.no_resume and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    with ExitStack() as stack:
+        storage: BaseStorage = LRUStorage()
+        if args.cache is not None:
+            storage = stack.enter_context(closing(SQLiteStorage(args.cache)))
+        client = stack.enter_context(HunterClient(HunterConfig(api_key=args.api_key, rate_limit=args.rate_limit)))
+        service = stack.enter_context(
+            EmailVerificationService(client, storage, skip_undeliverable_domains=args.skip_undeliverable_domains),
+        )
+        job = BulkVerificationJob(service, batch_size=args.batch_size, max_workers=args.workers)
+        try:
+            stats = job.run(
+                args.input,
+                args.output,
+                input_format=args.input_format,
+                output_format=args.output_format,
+                column=args.column,
+                checkpoint_path=checkpoint_path,
+            )
+        except HunterSDKError as e:
+            resume = '; rerun the same command to resume' if checkpoint_path else ''
+            print(f'hunter-sdk: error: {e}{resume}', file=sys.stderr)
+            return 1
+    print(json.dumps(asdict(stats)), file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line interface.
+
+    Args:
+        argv: Arguments, defaults to the process arguments
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error('an API key is required: pass --api-key or set HUNTER_API_KEY')
+    return run_verify(args)
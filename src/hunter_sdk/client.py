@@ -1,13 +1,161 @@
 """Hunter API client implementation."""
 
 import time
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 import requests
 
+from .circuit_breaker import CircuitBreaker, CircuitState, is_outage
 from .config import HunterConfig
-from .exceptions import ConfigurationError, HunterAPIError
-from .utils.rate_limiter import RateLimiter
+from .decoders import default_decoder
+from .exceptions import CircuitOpenError, ConfigurationError, HunterAPIError, HunterConnectionError
+from .metrics import Metrics, NoOpMetrics
+from .retry import RetryBudget, RetryPolicy, RetryState
+from .tracing import CallTrace, NoOpTracer, Tracer, finish_call, start_call
+from .transport import HTTPXTransport, PoolStats, RequestsTransport, Transport, connect_seconds
+from .utils.rate_limiter import RateLimiter, TokenBucketRateLimiter
+
+
+# Transport failures worth retrying; anything else is a bug in the request
+_RETRYABLE_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def build_retry_policy(config: HunterConfig) -> RetryPolicy:
+    """Build the retry policy described by the configuration.
+
+    Args:
+        config: Hunter API configuration
+
+    Returns:
+        config.retry_policy if set, otherwise a policy from the retry options
+    """
+    if config.retry_policy is not None:
+        return config.retry_policy
+    return RetryPolicy(
+        max_attempts=config.max_retries,
+        base_delay=config.retry_delay,
+        max_delay=config.retry_max_delay,
+        budget=RetryBudget(config.retry_budget_ratio) if config.retry_budget_ratio is not None else None,
+        total_timeout=config.total_timeout,
+    )
+
+
+def build_transport(config: HunterConfig) -> Transport:
+    """Build the HTTP transport described by the configuration.
+
+    Args:
+        config: Hunter API configuration
+
+    Returns:
+        config.transport if set, an HTTPXTransport for HTTP/2, otherwise a RequestsTransport
+
+    Raises:
+        ConfigurationError: If HTTP/2 is requested without the h2 package
+    """
+    if config.transport is not None:
+        return config.transport
+    if config.http2:
+        return HTTPXTransport(
+            http2=True,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            keep_alive=config.keep_alive,
+            compression=config.compression,
+        )
+    return RequestsTransport(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+        keep_alive=config.keep_alive,
+        compression=config.compression,
+    )
+
+
+def attempt_timeout(config: HunterConfig, retry: RetryState) -> Union[float, Tuple[float, float]]:
+    """Return the timeout of the next attempt, shortened to fit the retry deadline.
+
+    Args:
+        config: Hunter API configuration
+        retry: Retry state of the call
+
+    Returns:
+        config.timeout for the whole attempt, or (connect, read) seconds when
+        connect_timeout or read_timeout is set
+    """
+    if config.connect_timeout is None and config.read_timeout is None:
+        return retry.timeout(config.timeout)
+    connect = config.connect_timeout if config.connect_timeout is not None else config.timeout
+    read = config.read_timeout if config.read_timeout is not None else config.timeout
+    return retry.timeout(connect), retry.timeout(read)
+
+
+def parse_error_details(decode: Callable[[], Any]) -> str:
+    """Extract the error message from an API error body.
+
+    Args:
+        decode: Callable returning the decoded response body
+
+    Returns:
+        The first error's details, or a generic message
+    """
+    try:
+        return decode().get('errors', [{'details': 'Unknown error'}])[0]['details']
+    except (ValueError, AttributeError, IndexError, KeyError):
+        return 'Unknown error'
+
+
+def unpack_envelope(payload: Dict[str, Any], include_meta: bool) -> Any:
+    """Return the data of a decoded response envelope.
+
+    Args:
+        payload: Decoded envelope with ``data`` and optionally ``meta``
+        include_meta: If True, add the envelope's ``meta`` object to dict data
+
+    Returns:
+        The envelope's data
+    """
+    data = payload['data']
+    if include_meta and 'meta' in payload and isinstance(data, dict):
+        # The envelope was decoded for this call only, so its data can be extended in place
+        data['meta'] = payload['meta']
+    return data
+
+
+def build_domain_search_params(
+    api_key: str,
+    domain: str,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build query parameters for the domain search endpoint.
+
+    Args:
+        api_key: Hunter API key
+        domain: Domain to search
+        limit: Maximum number of results per page
+        offset: Number of results to skip
+        type: Type of emails to return (generic or personal)
+
+    Returns:
+        Query parameters with unset options omitted
+    """
+    params: Dict[str, Any] = {
+        'domain': domain,
+        'api_key': api_key,
+    }
+    if limit is not None:
+        params['limit'] = limit
+    if offset is not None:
+        params['offset'] = offset
+    if type is not None:
+        params['type'] = type
+    return params
 
 
 class HunterClient:
@@ -25,69 +173,268 @@ class HunterClient:
         if not config.api_key:
             raise ConfigurationError("API key is required")
         self._config = config
-        self._session = requests.Session()
-        self._rate_limiter = (
-            RateLimiter(config.rate_limit) if config.rate_limit else None
-        )
+        self._session = build_transport(config)
+        self._rate_limiter: Optional[Union[RateLimiter, TokenBucketRateLimiter]] = None
+        if config.rate_limit and config.rate_limit_burst:
+            self._rate_limiter = TokenBucketRateLimiter(config.rate_limit, burst=config.rate_limit_burst)
+        elif config.rate_limit:
+            self._rate_limiter = RateLimiter(config.rate_limit)
+        self._retry_policy = build_retry_policy(config)
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics = config.metrics or NoOpMetrics()
+        self._tracer = config.tracer or NoOpTracer()
+        self._decoder = config.decoder or default_decoder()
+
+    def __enter__(self) -> 'HunterClient':
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Close the connection pool on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._session.close()
+
+    def pool_stats(self) -> PoolStats:
+        """Return the usage of the connection pool, to size pool_maxsize from data.
+
+        Returns:
+            Current pool usage of the transport
+        """
+        return self._session.pool_stats()
+
+    def _circuit_breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker tracking endpoint, if circuit breaking is enabled.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            The endpoint's circuit breaker, or None
+        """
+        if self._config.circuit_failure_threshold is None:
+            return None
+        breaker = self._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(endpoint, CircuitBreaker(
+                failure_threshold=self._config.circuit_failure_threshold,
+                recovery_timeout=self._config.circuit_recovery_timeout,
+            ))
+        return breaker
+
+    @property
+    def metrics(self) -> Metrics:
+        """Return the metrics sink shared with services using this client."""
+        return self._metrics
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the tracer shared with services using this client."""
+        return self._tracer
+
+    def circuit_state(self, endpoint: str) -> CircuitState:
+        """Return the circuit state of an endpoint.
+
+        Args:
+            endpoint: API endpoint, e.g. ``email-verifier`` or ``domain-search``
+
+        Returns:
+            Current circuit state; always closed when circuit breaking is disabled
+        """
+        breaker = self._circuit_breaker(endpoint)
+        return CircuitState.CLOSED if breaker is None else breaker.state
 
     def _make_request(
         self,
         method: str,
         endpoint: str,
+        include_meta: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic and rate limiting.
+        """Make HTTP request with circuit breaking, rate limiting and retries.
 
         Args:
             method: HTTP method
             endpoint: API endpoint
+            include_meta: If True, add the response ``meta`` object to the data
             **kwargs: Additional request parameters
 
         Returns:
             API response data
 
         Raises:
-            HunterAPIError: If API request fails
+            CircuitOpenError: If the endpoint's circuit is open
+            HunterAPIError: If API returns an error or retries are exhausted
+            HunterConnectionError: If the API cannot be reached
         """
-        if self._rate_limiter:
-            self._rate_limiter.acquire()
+        breaker = self._circuit_breaker(endpoint)
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+
+        call = start_call(self._tracer, method, endpoint)
+        try:
+            if self._rate_limiter:
+                timed = call is not None or self._metrics.enabled
+                started = time.perf_counter() if timed else 0.0
+                self._rate_limiter.acquire()
+                if timed:
+                    waited = time.perf_counter() - started
+                    self._metrics.observe_rate_limit_wait(endpoint, waited)
+                    if call is not None:
+                        call.rate_limit_wait = waited
+            result = self._send(method, endpoint, include_meta, call, **kwargs)
+        except BaseException as e:
+            if breaker is not None:
+                if not isinstance(e, Exception):
+                    # Cancelled or interrupted: no outcome, so hand back a half-open trial slot
+                    breaker.release()
+                elif is_outage(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if call is not None:
+                finish_call(self._tracer, call, e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        if call is not None:
+            finish_call(self._tracer, call)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        include_meta: bool,
+        call: Optional[CallTrace] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying as the retry policy allows.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            include_meta: If True, add the response ``meta`` object to the data
+            call: Trace to record attempts in, or None when tracing is disabled
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
 
-        retries = 0
+        Raises:
+            HunterAPIError: If API returns an error or retries are exhausted
+            HunterConnectionError: If the API cannot be reached
+        """
+        timed = call is not None or self._metrics.enabled
+        retry = self._retry_policy.start()
         while True:
+            started = time.perf_counter() if timed else 0.0
+            connected = 0.0
+            if call is not None:
+                call.attempts += 1
+                connected = connect_seconds()
+                self._tracer.before_request(call)
             try:
                 response = self._session.request(
                     method=method,
                     url=f'{self._config.base_url}/{endpoint}',
-                    timeout=self._config.timeout,
+                    timeout=attempt_timeout(self._config, retry),
                     **kwargs,
                 )
+            except _RETRYABLE_EXCEPTIONS as e:
+                if timed:
+                    self._observe_attempt(endpoint, call, 'error', started, connected)
+                delay = retry.next_delay()
+                if delay is None:
+                    raise HunterConnectionError(f"{retry.exhausted_reason}: {e}") from e
+                if timed:
+                    self._observe_retry(endpoint, call, delay)
+                time.sleep(delay)
+                if retry.deadline_passed():
+                    raise HunterConnectionError(f"{retry.exhausted_reason}: {e}") from e
+                continue
+            except requests.RequestException as e:
+                if timed:
+                    self._observe_attempt(endpoint, call, 'error', started, connected)
+                raise HunterConnectionError(str(e)) from e
+            if timed:
+                self._observe_attempt(endpoint, call, str(response.status_code), started, connected)
 
-                if response.ok:
-                    return response.json()['data']
+            if response.ok:
+                if call is not None:
+                    decode_started = time.perf_counter()
+                    payload = self._decoder.decode(response.content, endpoint)
+                    call.decode += time.perf_counter() - decode_started
+                else:
+                    payload = self._decoder.decode(response.content, endpoint)
+                return unpack_envelope(payload, include_meta)
 
-                # Don't retry client errors except 429 (rate limit)
-                if 400 <= response.status_code < 500 and response.status_code != 429:
-                    raise HunterAPIError(
-                        status_code=response.status_code,
-                        message=response.json().get('errors', [{'details': 'Unknown error'}])[0]['details'],
-                    )
+            if not self._retry_policy.is_retryable_status(response.status_code):
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=parse_error_details(lambda: self._decoder.loads(response.content)),
+                )
 
-                retries += 1
-                if retries >= self._config.max_retries:
-                    raise HunterAPIError(
-                        status_code=response.status_code,
-                        message=f"Max retries ({self._config.max_retries}) exceeded",
-                    )
+            delay = retry.next_delay(response.headers)
+            if delay is None:
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=retry.exhausted_reason,
+                )
+            if timed:
+                self._observe_retry(endpoint, call, delay)
+            time.sleep(delay)
+            if retry.deadline_passed():
+                raise HunterAPIError(
+                    status_code=response.status_code,
+                    message=retry.exhausted_reason,
+                )
 
-                # Exponential backoff
-                time.sleep(self._config.retry_delay * (2 ** (retries - 1)))
+    def _observe_attempt(
+        self,
+        endpoint: str,
+        call: Optional[CallTrace],
+        status: str,
+        started: float,
+        connected: float,
+    ) -> None:
+        """Report one HTTP attempt to the metrics sink and tracer.
 
-            except requests.RequestException as e:
-                retries += 1
-                if retries >= self._config.max_retries:
-                    raise
+        Args:
+            endpoint: API endpoint
+            call: Trace of the call, or None when tracing is disabled
+            status: HTTP status code, or ``error`` if no response arrived
+            started: perf_counter() value when the attempt started
+            connected: Connection setup seconds of this thread before the attempt
+        """
+        duration = time.perf_counter() - started
+        self._metrics.observe_request(endpoint, status, duration)
+        if call is not None:
+            connect = connect_seconds() - connected
+            call.connect += connect
+            call.server += duration - connect
+            call.status = status
+            self._tracer.after_response(call)
 
-                time.sleep(self._config.retry_delay * (2 ** (retries - 1)))
+    def _observe_retry(self, endpoint: str, call: Optional[CallTrace], delay: float) -> None:
+        """Report a retry to the metrics sink and tracer.
+
+        Args:
+            endpoint: API endpoint
+            call: Trace of the call, or None when tracing is disabled
+            delay: Seconds about to be slept
+        """
+        self._metrics.observe_retry(endpoint, delay)
+        if call is not None:
+            call.backoff += delay
+            self._tracer.on_retry(call, delay)
 
     def verify_email(self, email: str) -> Dict[str, Any]:
         """Verify email address using Hunter API.
@@ -123,20 +470,17 @@ class HunterClient:
             type: Type of emails to return (generic or personal)
 
         Returns:
-            Dict containing search results
+            Dict containing search results, with the response ``meta``
+            (total ``results``, ``limit`` and ``offset``) under ``meta``
 
         Raises:
             HunterAPIError: If API request fails
         """
-        params = {
-            'domain': domain,
-            'api_key': self._config.api_key,
-        }
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        if type is not None:
-            params['type'] = type
-
-        return self._make_request('GET', 'domain-search', params=params) 
\ No newline at end of file
+        params = build_domain_search_params(
+            self._config.api_key,
+            domain,
+            limit=limit,
+            offset=offset,
+            type=type,
+        )
+        return self._make_request('GET', 'domain-search', include_meta=True, params=params)
@@ -3,6 +3,12 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from .decoders import ResponseDecoder
+from .metrics import Metrics
+from .retry import RetryPolicy
+from .tracing import Tracer
+from .transport import Transport
+
 
 @dataclass
 class HunterConfig:
@@ -11,6 +17,25 @@ class HunterConfig:
     api_key: str
     base_url: str = 'https://api.hunter.io/v2'
     timeout: int = 30
+    connect_timeout: Optional[float] = None  # Seconds to open a connection; None uses timeout
+    read_timeout: Optional[float] = None  # Seconds to wait for response bytes; None uses timeout
     max_retries: int = 3
     retry_delay: float = 1.0
-    rate_limit: Optional[int] = 100  # Requests per minute 
\ No newline at end of file
+    rate_limit: Optional[int] = 100  # Requests per minute
+    rate_limit_burst: Optional[int] = None  # Token bucket capacity; None keeps the sliding window
+    retry_max_delay: float = 30.0
+    retry_budget_ratio: Optional[float] = 0.2  # Retries allowed per request; None disables the budget
+    total_timeout: Optional[float] = None  # Seconds for all attempts of one call, including backoff
+    retry_policy: Optional[RetryPolicy] = None  # Overrides max_retries, retry_delay and the options above
+    circuit_failure_threshold: Optional[int] = 5  # Consecutive failures opening an endpoint's circuit; None disables
+    circuit_recovery_timeout: float = 30.0  # Seconds a circuit stays open before a trial request
+    metrics: Optional[Metrics] = None  # Sink for request, retry, rate limit and cache metrics; None disables them
+    tracer: Optional[Tracer] = None  # Hooks receiving service spans and per-call timing; None disables tracing
+    pool_connections: int = 10  # Per-host connection pools kept by the sync client
+    pool_maxsize: int = 10  # Connections kept per host; match the number of threads sharing the client
+    pool_block: bool = False  # Wait for a free connection instead of opening extra ones that get discarded
+    keep_alive: bool = True  # Reuse connections between requests
+    compression: bool = True  # Accept compressed responses (gzip; br and zstd when their decoders are installed)
+    http2: bool = False  # Use HTTP/2 through httpx; requires the h2 package
+    transport: Optional[Transport] = None  # Custom HTTP transport of the sync client; overrides the options above
+    decoder: Optional[ResponseDecoder] = None  # Parser of response bodies; None picks orjson when installed, else json
@@ -0,0 +1,143 @@
+"""Decoders turning API response bodies into Python objects.
+
+Clients decode every response body exactly once, straight from the raw
+bytes of the response: there is no intermediate decoded text, and error
+bodies are not parsed again to read their message. ``default_decoder``
+picks the fastest JSON library installed.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, Dict, Mapping, Optional
+
+from .exceptions import ConfigurationError
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+msgspec: Optional[ModuleType]
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+class ResponseDecoder(ABC):
+    """Parses response bodies."""
+
+    @abstractmethod
+    def loads(self, body: bytes) -> Any:
+        """Parse a body into dicts, lists and scalars.
+
+        Args:
+            body: Raw response body
+
+        Returns:
+            Parsed body
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+
+    def decode(self, body: bytes, endpoint: str) -> Dict[str, Any]:
+        """Parse the envelope of a successful response.
+
+        Args:
+            body: Raw response body
+            endpoint: API endpoint the body came from
+
+        Returns:
+            Envelope with ``data`` and, if present, ``meta``
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return self.loads(body)
+
+
+class JSONDecoder(ResponseDecoder):
+    """Decoder using the standard library."""
+
+    def loads(self, body: bytes) -> Any:
+        """Parse a JSON body."""
+        return json.loads(body)
+
+
+class OrjsonDecoder(ResponseDecoder):
+    """Decoder using orjson, several times faster than the standard library."""
+
+    def __init__(self) -> None:
+        """Initialize decoder.
+
+        Raises:
+            ConfigurationError: If orjson is not installed
+        """
+        if orjson is None:
+            raise ConfigurationError('OrjsonDecoder requires the orjson package')
+        self._orjson = orjson
+
+    def loads(self, body: bytes) -> Any:
+        """Parse a JSON body."""
+        return self._orjson.loads(body)
+
+
+class MsgspecDecoder(ResponseDecoder):
+    """Decoder using msgspec, optionally into typed structs.
+
+    With ``types``, the ``data`` of the listed endpoints is decoded and
+    validated straight into the given type, such as a ``msgspec.Struct``
+    declaring only the fields the application reads; everything else is
+    skipped without being materialized. Clients return typed data as is,
+    so use typed decoding with clients called directly: services cache and
+    read dicts.
+    """
+
+    def __init__(self, types: Optional[Mapping[str, Any]] = None) -> None:
+        """Initialize decoder.
+
+        Args:
+            types: Type of the ``data`` object per endpoint, e.g.
+                ``{'email-verifier': Verification}``; other endpoints decode to dicts
+
+        Raises:
+            ConfigurationError: If msgspec is not installed
+        """
+        if msgspec is None:
+            raise ConfigurationError('MsgspecDecoder requires the msgspec package')
+        self._decoder = msgspec.json.Decoder()
+        self._typed = {
+            endpoint: msgspec.json.Decoder(msgspec.defstruct(
+                'Envelope',
+                [('data', data_type), ('meta', Optional[Dict[str, Any]], None)],
+            ))
+            for endpoint, data_type in (types or {}).items()
+        }
+
+    def loads(self, body: bytes) -> Any:
+        """Parse a JSON body."""
+        return self._decoder.decode(body)
+
+    def decode(self, body: bytes, endpoint: str) -> Dict[str, Any]:
+        """Parse an envelope, decoding its data into the endpoint's type if one is set."""
+        typed = self._typed.get(endpoint)
+        if typed is None:
+            return self.loads(body)
+        envelope: Any = typed.decode(body)
+        if envelope.meta is None:
+            return {'data': envelope.data}
+        return {'data': envelope.data, 'meta': envelope.meta}
+
+
+def default_decoder() -> ResponseDecoder:
+    """Return the fastest plain decoder available.
+
+    Returns:
+        OrjsonDecoder if orjson is installed, otherwise JSONDecoder
+    """
+    if orjson is not None:
+        return OrjsonDecoder()
+    return JSONDecoder()
@@ -1 +1,47 @@
- 
\ No newline at end of file
+"""Exceptions raised by the Hunter SDK."""
+
+
+class HunterSDKError(Exception):
+    """Base exception for all SDK errors."""
+
+
+class ConfigurationError(HunterSDKError):
+    """Raised when there's a configuration error."""
+
+
+class ValidationError(HunterSDKError, ValueError):
+    """Raised when an email address or domain is malformed, before calling the API."""
+
+
+class HunterAPIError(HunterSDKError):
+    """Raised when the API returns an error response."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        """Initialize API error.
+
+        Args:
+            status_code: HTTP status code returned by the API
+            message: Error details returned by the API
+        """
+        super().__init__(f'{status_code}: {message}')
+        self.status_code = status_code
+        self.message = message
+
+
+class HunterConnectionError(HunterSDKError):
+    """Raised when the API cannot be reached after all retries."""
+
+
+class CircuitOpenError(HunterSDKError):
+    """Raised without sending a request while an endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Initialize circuit open error.
+
+        Args:
+            endpoint: API endpoint whose circuit is open
+            retry_after: Seconds until trial requests are allowed again
+        """
+        super().__init__(f"Circuit open for '{endpoint}', retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
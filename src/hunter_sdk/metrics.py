@@ -0,0 +1,302 @@
+"""Pluggable metrics for clients, services and storage.
+
+Clients and services report to the ``Metrics`` instance of the client's
+configuration. The default ``NoOpMetrics`` is disabled, and callers skip
+taking timestamps entirely, so uninstrumented clients pay for one
+attribute check per hook.
+"""
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds, suited to HTTP calls taking milliseconds to seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUEST_DURATION = 'hunter_request_duration_seconds'
+RETRIES = 'hunter_retries_total'
+RETRY_BACKOFF = 'hunter_retry_backoff_seconds_total'
+RATE_LIMIT_WAIT = 'hunter_rate_limit_wait_seconds'
+CACHE_LOOKUPS = 'hunter_cache_lookups_total'
+
+_METRIC_HELP = {
+    REQUEST_DURATION: ('histogram', 'Time on the wire per HTTP attempt, by endpoint and status code.'),
+    RETRIES: ('counter', 'HTTP attempts retried after a transport error or retryable status.'),
+    RETRY_BACKOFF: ('counter', 'Seconds slept between retries.'),
+    RATE_LIMIT_WAIT: ('histogram', 'Seconds spent waiting for the rate limiter per call.'),
+    CACHE_LOOKUPS: ('counter', 'Service cache lookups by result (hit or miss).'),
+}
+
+# CacheStats fields exported for tracked storages
+_STORAGE_FIELDS = (
+    ('hits', 'counter', 'Storage reads that found a live record.'),
+    ('misses', 'counter', 'Storage reads that found nothing.'),
+    ('evictions', 'counter', 'Records evicted to respect size bounds.'),
+    ('expirations', 'counter', 'Records dropped after their ttl.'),
+    ('entries', 'gauge', 'Records currently stored.'),
+    ('bytes', 'gauge', 'Estimated size of stored records.'),
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """Interface of metrics sinks; every hook is a no-op by default.
+
+    Subclasses override the hooks they record. Set ``enabled`` to False
+    to let callers skip measuring altogether.
+    """
+
+    enabled = True
+
+    def observe_request(self, endpoint: str, status: str, duration: float) -> None:
+        """Record one HTTP attempt.
+
+        Args:
+            endpoint: API endpoint
+            status: HTTP status code, or ``error`` if no response arrived
+            duration: Seconds spent on the wire
+        """
+
+    def observe_retry(self, endpoint: str, delay: float) -> None:
+        """Record a retry and the backoff slept before it.
+
+        Args:
+            endpoint: API endpoint
+            delay: Seconds slept before retrying
+        """
+
+    def observe_rate_limit_wait(self, endpoint: str, duration: float) -> None:
+        """Record the time a call waited for the rate limiter.
+
+        Args:
+            endpoint: API endpoint
+            duration: Seconds spent in ``acquire``
+        """
+
+    def observe_cache(self, cache: str, hit: bool, count: int = 1) -> None:
+        """Record service cache lookups.
+
+        Args:
+            cache: Name of the cache, e.g. ``email`` or ``domain``
+            hit: Whether the lookups found a cached result
+            count: Number of lookups with this outcome
+        """
+
+    def track_storage(self, name: str, storage: Any) -> None:
+        """Export the ``stats`` (CacheStats) of a storage backend.
+
+        Args:
+            name: Label identifying the storage
+            storage: Storage with a ``stats`` property, such as LRUStorage or TieredStorage
+        """
+
+
+class NoOpMetrics(Metrics):
+    """Discards everything; the default."""
+
+    enabled = False
+
+
+@dataclass
+class HistogramSnapshot:
+    """Cumulative bucket counts, sum and count of a histogram."""
+
+    buckets: Tuple[Tuple[float, int], ...]
+    sum: float
+    count: int
+
+
+class _Histogram:
+    """Fixed-bucket histogram; not thread-safe on its own."""
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int) -> None:
+        # One slot per bucket plus the +Inf overflow
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class InMemoryMetrics(Metrics):
+    """Thread-safe in-process counters and histograms.
+
+    Values can be read back with ``counter`` and ``histogram``, which makes
+    this sink handy in tests and as the base of exporters.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            buckets: Sorted histogram upper bounds in seconds
+        """
+        self._buckets = tuple(buckets)
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+        self._storages: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def _increment(self, name: str, labels: Labels, amount: float = 1) -> None:
+        """Add amount to a counter."""
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        """Add a value to a histogram."""
+        key = (name, labels)
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self._buckets))
+            histogram.counts[index] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def observe_request(self, endpoint: str, status: str, duration: float) -> None:
+        """Record one HTTP attempt in the request duration histogram."""
+        self._observe(REQUEST_DURATION, (('endpoint', endpoint), ('status', status)), duration)
+
+    def observe_retry(self, endpoint: str, delay: float) -> None:
+        """Count a retry and its backoff."""
+        labels = (('endpoint', endpoint),)
+        self._increment(RETRIES, labels)
+        self._increment(RETRY_BACKOFF, labels, delay)
+
+    def observe_rate_limit_wait(self, endpoint: str, duration: float) -> None:
+        """Record a rate limiter wait in its histogram."""
+        self._observe(RATE_LIMIT_WAIT, (('endpoint', endpoint),), duration)
+
+    def observe_cache(self, cache: str, hit: bool, count: int = 1) -> None:
+        """Count service cache hits or misses."""
+        if count:
+            self._increment(CACHE_LOOKUPS, (('cache', cache), ('result', 'hit' if hit else 'miss')), count)
+
+    def track_storage(self, name: str, storage: Any) -> None:
+        """Export the stats of a storage backend under name."""
+        with self._lock:
+            self._storages[name] = storage
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Return the value of a counter.
+
+        Args:
+            name: Metric name, e.g. RETRIES
+            **labels: Label values identifying the series
+
+        Returns:
+            Current value, 0 if never incremented
+        """
+        with self._lock:
+            return self._counters.get((name, tuple(labels.items())), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[HistogramSnapshot]:
+        """Return a snapshot of a histogram.
+
+        Args:
+            name: Metric name, e.g. REQUEST_DURATION
+            **labels: Label values identifying the series
+
+        Returns:
+            Snapshot with cumulative bucket counts, or None if nothing was observed
+        """
+        with self._lock:
+            histogram = self._histograms.get((name, tuple(labels.items())))
+            if histogram is None:
+                return None
+            return self._snapshot(histogram)
+
+    def cache_hit_ratio(self, cache: str) -> Optional[float]:
+        """Return the share of service cache lookups that were hits.
+
+        Args:
+            cache: Name of the cache, e.g. ``email`` or ``domain``
+
+        Returns:
+            Hit ratio between 0 and 1, or None before the first lookup
+        """
+        hits = self.counter(CACHE_LOOKUPS, cache=cache, result='hit')
+        total = hits + self.counter(CACHE_LOOKUPS, cache=cache, result='miss')
+        return hits / total if total else None
+
+    def _snapshot(self, histogram: _Histogram) -> HistogramSnapshot:
+        """Convert bucket counts to cumulative (upper bound, count) pairs."""
+        cumulative = 0
+        buckets: List[Tuple[float, int]] = []
+        for bound, count in zip(self._buckets + (math.inf,), histogram.counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return HistogramSnapshot(tuple(buckets), histogram.sum, histogram.count)
+
+
+def _format_labels(labels: Labels) -> str:
+    """Render labels in exposition format, escaping values."""
+    if not labels:
+        return ''
+    rendered = ','.join(
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + rendered + '}'
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value in exposition format."""
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class PrometheusMetrics(InMemoryMetrics):
+    """In-memory metrics rendered in the Prometheus text exposition format.
+
+    Serve ``render()`` from an HTTP endpoint of the application to let
+    Prometheus scrape it.
+    """
+
+    def render(self) -> str:
+        """Render all metrics, including tracked storage stats.
+
+        Returns:
+            Metrics in text exposition format 0.0.4
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: self._snapshot(histogram) for key, histogram in self._histograms.items()}
+            storages = dict(self._storages)
+
+        lines: List[str] = []
+        for name, (kind, help_text) in _METRIC_HELP.items():
+            counter_series = sorted((labels, value) for (metric, labels), value in counters.items() if metric == name)
+            histogram_series = sorted(
+                ((labels, snapshot) for (metric, labels), snapshot in histograms.items() if metric == name),
+                key=lambda series: series[0],
+            )
+            if not counter_series and not histogram_series:
+                continue
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in counter_series:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+            for labels, snapshot in histogram_series:
+                for bound, count in snapshot.buckets:
+                    bucket_labels = labels + (('le', _format_value(bound)),)
+                    lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(snapshot.sum)}')
+                lines.append(f'{name}_count{_format_labels(labels)} {snapshot.count}')
+
+        if storages:
+            stats = {name: storage.stats for name, storage in sorted(storages.items())}
+            for field, kind, help_text in _STORAGE_FIELDS:
+                name = f'hunter_storage_{field}' + ('_total' if kind == 'counter' else '')
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for storage_name, storage_stats in stats.items():
+                    value = getattr(storage_stats, field)
+                    lines.append(f"{name}{_format_labels((('storage', storage_name),))} {value}")
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,228 @@
+"""Compact typed models for Hunter API responses.
+
+Each model stores known response fields in ``__slots__`` instead of a
+per-instance dict, and keeps nested lists (``sources``, ``emails``) as
+frozen raw data that is only turned into models the first time the
+typed property is accessed. Models are read-only and implement ``Mapping``, so existing
+``result['status']`` style access and comparisons with dicts still work.
+"""
+
+from typing import Any, ClassVar, Dict, Iterator, Mapping, NoReturn, Optional, Tuple, Type, TypeVar
+
+from .utils.frozen import Immutable, freeze
+
+RecordT = TypeVar('RecordT', bound='Record')
+
+# Slots holding model state rather than response fields
+_STATE_SLOTS = frozenset(('_extra', '_parsed'))
+
+
+class Record(Mapping[str, Any], Immutable):
+    """Base class for slotted, read-only response models.
+
+    Slot names map to response keys; a leading underscore marks a nested
+    field whose typed view is exposed through a property of the same name.
+    Keys without a slot are kept in ``_extra`` so no data is lost, and the
+    parsed models of the nested field are cached in ``_parsed``.
+    """
+
+    __slots__ = ('_extra', '_parsed')
+
+    _keys: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Map response keys to slot names for each model class."""
+        super().__init_subclass__(**kwargs)
+        cls._keys = {
+            slot.lstrip('_'): slot
+            for klass in reversed(cls.__mro__)
+            for slot in klass.__dict__.get('__slots__', ())
+            if slot not in _STATE_SLOTS
+        }
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        """Build model from a response mapping.
+
+        Args:
+            data: Response data as returned by the API
+        """
+        extra: Optional[Dict[str, Any]] = None
+        for key, value in data.items():
+            slot = self._keys.get(key)
+            if slot is None:
+                extra = {} if extra is None else extra
+                extra[key] = freeze(value)
+            else:
+                object.__setattr__(self, slot, freeze(value))
+        object.__setattr__(self, '_extra', extra)
+        object.__setattr__(self, '_parsed', None)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """Reject attribute assignment."""
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Reject attribute deletion."""
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    def __getattr__(self, name: str) -> Any:
+        """Return None for known fields missing from the response."""
+        if name in self._keys:
+            return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the raw response value for key."""
+        slot = self._keys.get(key)
+        if slot is None:
+            if self._extra is not None and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        try:
+            return object.__getattribute__(self, slot)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys present in the response."""
+        for key in self._keys:
+            if key in self:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether key is present in the response."""
+        slot = self._keys.get(key) if isinstance(key, str) else None
+        if slot is None:
+            return self._extra is not None and key in self._extra
+        try:
+            object.__getattribute__(self, slot)
+        except AttributeError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of keys present in the response."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return f'{type(self).__name__}({dict(self)!r})'
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Dict[str, Any]]]:
+        """Pickle through the constructor, since assignment is disabled."""
+        return (type(self), (self.to_dict(),))
+
+    def _parse_nested(self, key: str, model: Type[RecordT]) -> Tuple[RecordT, ...]:
+        """Parse the nested list under key into models, once per instance.
+
+        Args:
+            key: Response key of the nested list
+            model: Model class of its items
+
+        Returns:
+            Models of the list items
+        """
+        parsed = self._parsed
+        if parsed is None:
+            parsed = tuple(model(item) for item in self.get(key) or ())
+            object.__setattr__(self, '_parsed', parsed)
+        return parsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the response as a plain dict.
+
+        Returns:
+            Dict with the same keys and values as the response
+        """
+        return dict(self)
+
+
+class Source(Record):
+    """Web page where an email address was found."""
+
+    __slots__ = ('domain', 'uri', 'extracted_on', 'last_seen_on', 'still_on_page')
+
+
+class VerificationResult(Record):
+    """Result of the email verifier endpoint."""
+
+    __slots__ = (
+        'email',
+        'status',
+        'result',
+        'score',
+        'regexp',
+        'gibberish',
+        'disposable',
+        'webmail',
+        'mx_records',
+        'smtp_server',
+        'smtp_check',
+        'accept_all',
+        'block',
+        '_sources',
+    )
+
+    @property
+    def sources(self) -> Tuple[Source, ...]:
+        """Parse the sources the address was found on."""
+        return self._parse_nested('sources', Source)
+
+
+class EmailEntry(Record):
+    """Email address found by a domain search."""
+
+    __slots__ = (
+        'value',
+        'type',
+        'confidence',
+        'first_name',
+        'last_name',
+        'position',
+        'seniority',
+        'department',
+        'linkedin',
+        'twitter',
+        'phone_number',
+        'verification',
+        '_sources',
+    )
+
+    @property
+    def sources(self) -> Tuple[Source, ...]:
+        """Parse the sources the address was found on."""
+        return self._parse_nested('sources', Source)
+
+
+class DomainSearchResult(Record):
+    """Result of the domain search endpoint."""
+
+    __slots__ = (
+        'domain',
+        'disposable',
+        'webmail',
+        'accept_all',
+        'pattern',
+        'organization',
+        'description',
+        'industry',
+        'twitter',
+        'facebook',
+        'linkedin',
+        'country',
+        'state',
+        'city',
+        'postal_code',
+        'street',
+        'headcount',
+        'company_type',
+        'linked_domains',
+        '_emails',
+    )
+
+    @property
+    def emails(self) -> Tuple[EmailEntry, ...]:
+        """Parse the email addresses found for the domain."""
+        return self._parse_nested('emails', EmailEntry)
@@ -0,0 +1,210 @@
+"""Retry policies for Hunter API requests."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Collection, Mapping, Optional
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Read the server-requested delay from rate-limit headers.
+
+    Supports ``Retry-After`` as delta-seconds or an HTTP date, and the
+    delta-seconds ``RateLimit-Reset`` header.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the response does not ask for a delay
+    """
+    value = headers.get('Retry-After') or headers.get('RateLimit-Reset')
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Caps retries to a share of overall traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one,
+    so sustained failures can add at most ``ratio`` extra load on top of
+    normal traffic. The budget starts with ``min_retries`` tokens, so a
+    client can retry before its traffic has built up a balance; once they
+    are spent, retries are only allowed as requests deposit new tokens.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request, e.g. 0.2 for 20%
+            min_retries: Retries available before any request has deposited tokens
+        """
+        self._ratio = ratio
+        self._max_tokens = float(min_retries) + 100 * ratio
+        self._tokens = float(min_retries)
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """Record a new request."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Claim permission for one retry.
+
+        Returns:
+            True if the budget allows the retry
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryState:
+    """Retry bookkeeping for a single logical request."""
+
+    def __init__(self, policy: 'RetryPolicy') -> None:
+        """Start tracking a request.
+
+        Args:
+            policy: Policy deciding whether and when to retry
+        """
+        self._policy = policy
+        self._deadline = None if policy.total_timeout is None else time.monotonic() + policy.total_timeout
+        self._delay = policy.base_delay
+        self.attempts = 1
+        self.exhausted_reason = ''
+
+    def timeout(self, default: float) -> float:
+        """Return the per-attempt timeout, shortened to fit the deadline.
+
+        Callers check ``deadline_passed`` first, so the result is only zero
+        if the deadline runs out in between.
+
+        Args:
+            default: Timeout for a single attempt
+
+        Returns:
+            Seconds the next attempt may take
+        """
+        if self._deadline is None:
+            return default
+        return max(0.0, min(default, self._deadline - time.monotonic()))
+
+    def deadline_passed(self) -> bool:
+        """Check whether the total timeout ran out, e.g. while backing off.
+
+        Returns:
+            True if no time is left for another attempt; ``exhausted_reason``
+            then says why
+        """
+        if self._deadline is None or time.monotonic() < self._deadline:
+            return False
+        self.exhausted_reason = f'Total timeout ({self._policy.total_timeout}s) exceeded'
+        return True
+
+    def next_delay(self, headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """Decide whether to retry and how long to wait first.
+
+        Args:
+            headers: Headers of the failed response, if there was one
+
+        Returns:
+            Seconds to sleep before the next attempt, or None to give up;
+            ``exhausted_reason`` then says why
+        """
+        policy = self._policy
+        if self.attempts >= policy.max_attempts:
+            self.exhausted_reason = f'Max retries ({policy.max_attempts}) exceeded'
+            return None
+
+        # Decorrelated jitter: spread retries so clients don't synchronize
+        self._delay = min(policy.max_delay, random.uniform(policy.base_delay, self._delay * 3))
+        delay = self._delay
+        if policy.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers)
+            if retry_after is not None:
+                if retry_after > policy.max_delay:
+                    self.exhausted_reason = f'Retry-After ({retry_after:g}s) exceeds max delay ({policy.max_delay:g}s)'
+                    return None
+                delay = retry_after
+
+        if self._deadline is not None and time.monotonic() + delay >= self._deadline:
+            self.exhausted_reason = f'Total timeout ({policy.total_timeout}s) exceeded'
+            return None
+        if policy.budget is not None and not policy.budget.withdraw():
+            self.exhausted_reason = 'Retry budget exhausted'
+            return None
+
+        self.attempts += 1
+        return delay
+
+
+class RetryPolicy:
+    """Decides which failed requests to retry and how long to back off."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_statuses: Collection[int] = RETRYABLE_STATUS_CODES,
+        respect_retry_after: bool = True,
+        budget: Optional[RetryBudget] = None,
+        total_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first
+            base_delay: Minimum backoff between attempts in seconds
+            max_delay: Maximum backoff between attempts in seconds
+            retry_statuses: HTTP status codes worth retrying
+            respect_retry_after: If True, wait as long as Retry-After asks, giving up
+                when it asks for more than max_delay
+            budget: Shared retry budget, or None for no cap
+            total_timeout: Seconds allowed for all attempts and backoff, or None
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget
+        self.total_timeout = total_timeout
+
+    def start(self) -> RetryState:
+        """Begin a logical request.
+
+        Returns:
+            State tracking attempts and backoff for the request
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        return RetryState(self)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Check whether a response status is worth retrying.
+
+        Args:
+            status_code: HTTP status code
+
+        Returns:
+            True if the request should be retried
+        """
+        return status_code in self.retry_statuses
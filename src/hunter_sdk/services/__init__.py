@@ -1,6 +1,19 @@
 """Service layer implementations."""
 
+from .async_domain_search import AsyncDomainSearchService
+from .async_email_verification import AsyncEmailVerificationService
+from .bulk_verification import BulkVerificationJob, BulkVerificationStats
+from .domain_crawl import CrawlCursor, DomainCrawlJob
 from .domain_search import DomainSearchService
 from .email_verification import EmailVerificationService
 
-__all__ = ['EmailVerificationService', 'DomainSearchService']
+__all__ = [
+    'EmailVerificationService',
+    'DomainSearchService',
+    'AsyncEmailVerificationService',
+    'AsyncDomainSearchService',
+    'BulkVerificationJob',
+    'BulkVerificationStats',
+    'DomainCrawlJob',
+    'CrawlCursor',
+]
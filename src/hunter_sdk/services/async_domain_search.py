@@ -0,0 +1,335 @@
+"""Asyncio domain search service implementation."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+from types import TracebackType
+from typing import Any, AsyncIterator, Deque, Mapping, Optional, Tuple, Type
+
+from ..async_client import AsyncHunterClient
+from ..exceptions import CircuitOpenError
+from ..models import DomainSearchResult
+from ..storage.base import BaseStorage
+from ..tracing import trace_span
+from ..utils.cache_keys import domain_search_cache_key
+from ..utils.frozen import freeze
+from ..utils.normalize import normalize_domain
+from ..utils.refresh import AsyncBackgroundRefresher
+from ..utils.singleflight import AsyncSingleFlight
+from .domain_search import DEFAULT_DOMAIN_SEARCH_TTL
+
+
+class AsyncDomainSearchService:
+    """Asyncio service for domain search with caching."""
+
+    def __init__(
+        self,
+        client: AsyncHunterClient,
+        storage: BaseStorage,
+        ttl: Optional[float] = DEFAULT_DOMAIN_SEARCH_TTL,
+        typed_results: bool = False,
+        stale_ttl: Optional[float] = None,
+        stale_if_error_ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize async domain search service.
+
+        Args:
+            client: Async Hunter API client instance
+            storage: Storage implementation for caching results
+            ttl: Seconds to cache domain search results, or None to keep them indefinitely
+            typed_results: If True, return DomainSearchResult models instead of dicts
+            stale_ttl: Seconds past ttl during which an expired result is still
+                returned while it is refreshed in the background, or None to
+                always refresh expired results in the foreground
+            stale_if_error_ttl: Seconds past ttl and stale_ttl during which an
+                expired result is kept to be returned while the client's circuit
+                is open, or None to only fall back on unexpired results
+        """
+        self._client = client
+        self._storage = storage
+        self._metrics = client.metrics
+        self._tracer = client.tracer
+        self._ttl = ttl
+        self._typed_results = typed_results
+        self._stale_ttl = stale_ttl
+        self._stale_if_error_ttl = stale_if_error_ttl
+        self._inflight: AsyncSingleFlight[Mapping[str, Any]] = AsyncSingleFlight()
+        self._refresher = AsyncBackgroundRefresher()
+
+    async def __aenter__(self) -> 'AsyncDomainSearchService':
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Wait for background refreshes on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Wait for pending background refreshes.
+
+        The client and storage are not closed, since they may be shared.
+        """
+        await self._refresher.join()
+
+    @property
+    def _storage_ttl(self) -> Optional[float]:
+        """Seconds results are kept in storage, including the stale and error periods."""
+        if self._ttl is None:
+            return None
+        return self._ttl + (self._stale_ttl or 0) + (self._stale_if_error_ttl or 0)
+
+    def _read_unexpired(self, cache_key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Read a cached result unless it is only kept for the error period.
+
+        Args:
+            cache_key: Cache key of the result
+
+        Returns:
+            Tuple of the result and its seconds left before the error period
+            (None if it never expires), or None if not found or expired
+        """
+        entry = self._storage.read_with_ttl(cache_key)
+        if entry is None or self._stale_if_error_ttl is None:
+            return entry
+        cached_result, remaining = entry
+        if remaining is None:
+            return entry
+        if remaining <= self._stale_if_error_ttl:
+            return None
+        return cached_result, remaining - self._stale_if_error_ttl
+
+    def _read_cached(self, cache_key: str, **params: Any) -> Optional[Mapping[str, Any]]:
+        """Read a cached result, refreshing it in the background once stale.
+
+        Args:
+            cache_key: Cache key of the search
+            **params: Domain search parameters used to refresh the result
+
+        Returns:
+            Cached search result or None if not found
+        """
+        if self._stale_ttl is None and self._stale_if_error_ttl is None:
+            cached_result = self._storage.read(cache_key)
+        else:
+            entry = self._read_unexpired(cache_key)
+            if entry is None:
+                self._metrics.observe_cache('domain', hit=False)
+                return None
+            cached_result, remaining = entry
+            if self._stale_ttl is not None and remaining is not None and remaining <= self._stale_ttl:
+                self._refresher.submit(
+                    cache_key,
+                    lambda: self._inflight.do(cache_key, lambda: self._search(cache_key, **params)),
+                )
+        self._metrics.observe_cache('domain', hit=cached_result is not None)
+        return None if cached_result is None else self._to_result(cached_result)
+
+    async def _search(self, cache_key: str, **params: Any) -> Mapping[str, Any]:
+        """Call the domain search API and cache the result.
+
+        Args:
+            cache_key: Cache key to store the result under
+            **params: Domain search parameters
+
+        Returns:
+            Mapping containing search results
+        """
+        result = self._to_result(freeze(await self._client.domain_search(**params)))
+        self._storage.upsert(cache_key, result, ttl=self._storage_ttl)
+        return result
+
+    async def search_domain(
+        self,
+        domain: str,
+        force_refresh: bool = False,
+        type: Optional[str] = None,
+    ) -> Mapping[str, Any]:
+        """Search for email addresses in a domain with caching.
+
+        The domain is normalized first (case, trailing dot, punycode), and
+        malformed domains are rejected without an API call. Concurrent cache
+        misses for the same search share a single API call.
+
+        With stale_ttl set, an expired result is returned immediately while one
+        background task refreshes it. While the client's circuit is open, a
+        cached result is returned even when force_refresh is set, including an
+        expired one kept for stale_if_error_ttl.
+
+        Args:
+            domain: Domain to search
+            force_refresh: If True, bypass cache and fetch fresh data
+            type: Type of emails to return (generic or personal)
+
+        Returns:
+            Mapping containing search results
+
+        Raises:
+            ValidationError: If the domain is malformed
+            CircuitOpenError: If the API circuit is open and no result is cached
+        """
+        domain = normalize_domain(domain)
+        with trace_span(self._tracer, 'hunter.search_domain', domain=domain, type=type, force_refresh=force_refresh):
+            cache_key = domain_search_cache_key(domain, type)
+
+            if not force_refresh:
+                cached_result = self._read_cached(cache_key, domain=domain, type=type)
+                if cached_result is not None:
+                    return cached_result
+
+            try:
+                return await self._inflight.do(cache_key, lambda: self._search(cache_key, domain=domain, type=type))
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
+
+    def _to_result(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Wrap data in DomainSearchResult when typed results are enabled.
+
+        Args:
+            data: Result data from the API or the cache
+
+        Returns:
+            The result in the configured representation
+        """
+        if self._typed_results and not isinstance(data, DomainSearchResult):
+            return DomainSearchResult(data)
+        return data
+
+    async def search_page(
+        self,
+        domain: str,
+        type: Optional[str],
+        limit: int,
+        offset: int,
+        force_refresh: bool = False,
+    ) -> Mapping[str, Any]:
+        """Fetch one page of results, caching it under its offset.
+
+        Args:
+            domain: Domain to search
+            type: Type of emails to return (generic or personal)
+            limit: Number of results per page
+            offset: Number of results to skip
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Mapping containing the page of search results
+
+        Raises:
+            ValidationError: If the domain is malformed
+        """
+        domain = normalize_domain(domain)
+        with trace_span(
+            self._tracer,
+            'hunter.search_page',
+            domain=domain,
+            type=type,
+            limit=limit,
+            offset=offset,
+            force_refresh=force_refresh,
+        ):
+            cache_key = domain_search_cache_key(domain, type, limit=limit, offset=offset)
+            params = {'domain': domain, 'type': type, 'limit': limit, 'offset': offset}
+            if not force_refresh:
+                cached_result = self._read_cached(cache_key, **params)
+                if cached_result is not None:
+                    return cached_result
+
+            try:
+                return await self._inflight.do(cache_key, lambda: self._search(cache_key, **params))
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
+
+    async def iter_all_results(
+        self,
+        domain: str,
+        type: Optional[str] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Iterate through all results for a domain search.
+
+        The total reported in the first page's ``meta.results`` is used to
+        fetch up to max_concurrency of the remaining pages at once, while
+        still yielding them in offset order. Each page is cached. Without a
+        reported total, pages are fetched one at a time until a short page
+        is returned.
+
+        Args:
+            domain: Domain to search
+            type: Type of emails to return (generic or personal)
+            batch_size: Number of results to fetch per request
+            max_concurrency: Maximum number of pages fetched concurrently
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            Search result batches
+        """
+        first_page = await self.search_page(domain, type, batch_size, 0, force_refresh)
+        yield first_page
+
+        total = (first_page.get('meta') or {}).get('results')
+        if total is None:
+            offset = 0
+            result = first_page
+            while len(result['emails']) >= batch_size:
+                offset += batch_size
+                result = await self.search_page(domain, type, batch_size, offset, force_refresh)
+                yield result
+            return
+
+        offsets = iter(range(batch_size, total, batch_size))
+        pending: Deque['asyncio.Task[Mapping[str, Any]]'] = deque(
+            asyncio.ensure_future(self.search_page(domain, type, batch_size, offset, force_refresh))
+            for offset in islice(offsets, max_concurrency)
+        )
+        try:
+            while pending:
+                result = await pending.popleft()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(asyncio.ensure_future(
+                        self.search_page(domain, type, batch_size, next_offset, force_refresh),
+                    ))
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_emails(
+        self,
+        domain: str,
+        type: Optional[str] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Stream individual email entries for a domain search.
+
+        Args:
+            domain: Domain to search
+            type: Type of emails to return (generic or personal)
+            batch_size: Number of results to fetch per request
+            max_concurrency: Maximum number of pages fetched concurrently
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            Email entries, as EmailEntry models when typed results are enabled
+        """
+        async for page in self.iter_all_results(domain, type, batch_size, max_concurrency, force_refresh):
+            entries = page.emails if isinstance(page, DomainSearchResult) else page['emails']
+            for entry in entries:
+                yield entry
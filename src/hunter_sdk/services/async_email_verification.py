@@ -0,0 +1,374 @@
+"""Asyncio email verification service implementation."""
+
+import asyncio
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+
+from ..async_client import AsyncHunterClient
+from ..exceptions import CircuitOpenError, ValidationError
+from ..models import VerificationResult
+from ..storage.base import BaseStorage
+from ..tracing import trace_span
+from ..utils.cache_keys import domain_facts_cache_key, email_cache_key
+from ..utils.frozen import freeze
+from ..utils.normalize import email_domain, normalize_domain, normalize_email
+from ..utils.refresh import AsyncBackgroundRefresher
+from ..utils.singleflight import AsyncSingleFlight
+from .email_verification import (
+    DEFAULT_DOMAIN_FACTS_TTL,
+    DEFAULT_VERIFICATION_TTL,
+    extract_domain_facts,
+    undeliverable_result,
+)
+
+
+class AsyncEmailVerificationService:
+    """Asyncio service for email verification with caching."""
+
+    def __init__(
+        self,
+        client: AsyncHunterClient,
+        storage: BaseStorage,
+        ttl: Optional[float] = DEFAULT_VERIFICATION_TTL,
+        typed_results: bool = False,
+        stale_ttl: Optional[float] = None,
+        stale_if_error_ttl: Optional[float] = None,
+        domain_facts_ttl: Optional[float] = DEFAULT_DOMAIN_FACTS_TTL,
+        skip_undeliverable_domains: bool = False,
+    ) -> None:
+        """Initialize async email verification service.
+
+        Args:
+            client: Async Hunter API client instance
+            storage: Storage implementation for caching results
+            ttl: Seconds to cache verification results, or None to keep them indefinitely
+            typed_results: If True, return VerificationResult models instead of dicts
+            stale_ttl: Seconds past ttl during which an expired result is still
+                returned while it is refreshed in the background, or None to
+                always refresh expired results in the foreground
+            stale_if_error_ttl: Seconds past ttl and stale_ttl during which an
+                expired result is kept to be returned while the client's circuit
+                is open, or None to only fall back on unexpired results
+            domain_facts_ttl: Seconds to remember the domain-wide facts (accept-all,
+                disposable, webmail, MX) learned from a verification, or None to
+                keep them indefinitely
+            skip_undeliverable_domains: If True, addresses at domains known to be
+                disposable or without MX records get an inferred result instead of
+                an API call
+        """
+        self._client = client
+        self._storage = storage
+        self._metrics = client.metrics
+        self._tracer = client.tracer
+        self._ttl = ttl
+        self._typed_results = typed_results
+        self._stale_ttl = stale_ttl
+        self._stale_if_error_ttl = stale_if_error_ttl
+        self._domain_facts_ttl = domain_facts_ttl
+        self._skip_undeliverable_domains = skip_undeliverable_domains
+        self._inflight: AsyncSingleFlight[Mapping[str, Any]] = AsyncSingleFlight()
+        self._refresher = AsyncBackgroundRefresher()
+
+    async def __aenter__(self) -> 'AsyncEmailVerificationService':
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Wait for background refreshes on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Wait for pending background refreshes.
+
+        The client and storage are not closed, since they may be shared.
+        """
+        await self._refresher.join()
+
+    @property
+    def _storage_ttl(self) -> Optional[float]:
+        """Seconds results are kept in storage, including the stale and error periods."""
+        if self._ttl is None:
+            return None
+        return self._ttl + (self._stale_ttl or 0) + (self._stale_if_error_ttl or 0)
+
+    def _read_unexpired(self, cache_key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Read a cached result unless it is only kept for the error period.
+
+        Args:
+            cache_key: Cache key of the result
+
+        Returns:
+            Tuple of the result and its seconds left before the error period
+            (None if it never expires), or None if not found or expired
+        """
+        entry = self._storage.read_with_ttl(cache_key)
+        if entry is None or self._stale_if_error_ttl is None:
+            return entry
+        cached_result, remaining = entry
+        if remaining is None:
+            return entry
+        if remaining <= self._stale_if_error_ttl:
+            return None
+        return cached_result, remaining - self._stale_if_error_ttl
+
+    def _read_cached(self, email: str) -> Optional[Mapping[str, Any]]:
+        """Read a cached result, refreshing it in the background once stale.
+
+        Args:
+            email: Normalized email address to look up
+
+        Returns:
+            Cached verification result or None if not found
+        """
+        cache_key = email_cache_key(email)
+        if self._stale_ttl is None and self._stale_if_error_ttl is None:
+            cached_result = self._storage.read(cache_key)
+        else:
+            entry = self._read_unexpired(cache_key)
+            if entry is None:
+                self._metrics.observe_cache('email', hit=False)
+                return None
+            cached_result, remaining = entry
+            if self._stale_ttl is not None and remaining is not None and remaining <= self._stale_ttl:
+                self._refresher.submit(cache_key, lambda: self._inflight.do(cache_key, lambda: self._fetch(email)))
+        self._metrics.observe_cache('email', hit=cached_result is not None)
+        return None if cached_result is None else self._to_result(cached_result)
+
+    async def verify_email(self, email: str, force_refresh: bool = False) -> Mapping[str, Any]:
+        """Verify email address with caching.
+
+        The address is normalized first, so differently cased or spaced
+        spellings share one cache entry, and malformed addresses are rejected
+        without an API call. With skip_undeliverable_domains set, addresses at
+        a domain already known to be disposable or without MX records are
+        answered from the domain facts. Concurrent cache misses for the same
+        email share a single API call.
+
+        With stale_ttl set, an expired result is returned immediately while one
+        background task refreshes it. While the client's circuit is open, a
+        cached result is returned even when force_refresh is set, including an
+        expired one kept for stale_if_error_ttl.
+
+        Args:
+            email: Email address to verify
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Mapping containing verification results
+
+        Raises:
+            ValidationError: If the email address is malformed
+            CircuitOpenError: If the API circuit is open and no result is cached
+        """
+        email = normalize_email(email)
+        return await self._verify_normalized(email, force_refresh)
+
+    async def _verify_normalized(self, email: str, force_refresh: bool) -> Mapping[str, Any]:
+        """Verify an already normalized email address with caching.
+
+        Args:
+            email: Normalized email address
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Mapping containing verification results
+        """
+        with trace_span(self._tracer, 'hunter.verify_email', email=email, force_refresh=force_refresh):
+            if not force_refresh:
+                cached_result = self._read_cached(email)
+                if cached_result is not None:
+                    return cached_result
+                inferred = self._infer_from_domain(email, self._read_domain_facts(email))
+                if inferred is not None:
+                    return inferred
+
+            cache_key = email_cache_key(email)
+            try:
+                return await self._inflight.do(cache_key, lambda: self._fetch(email))
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
+
+    async def _fetch(self, email: str) -> Mapping[str, Any]:
+        """Call the API and overwrite the cached result.
+
+        Args:
+            email: Normalized email address to verify
+
+        Returns:
+            Mapping containing verification results
+        """
+        result = self._to_result(freeze(await self._client.verify_email(email)))
+        self._storage.upsert(email_cache_key(email), result, ttl=self._storage_ttl)
+        facts = extract_domain_facts(result)
+        if facts:
+            self._storage.upsert(domain_facts_cache_key(email_domain(email)), facts, ttl=self._domain_facts_ttl)
+        return result
+
+    def _read_domain_facts(self, email: str) -> Optional[Mapping[str, Any]]:
+        """Read the known facts about the domain of a normalized address."""
+        if not self._skip_undeliverable_domains:
+            return None
+        return self._storage.read(domain_facts_cache_key(email_domain(email)))
+
+    def _infer_from_domain(self, email: str, facts: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """Build an inferred result when skipping is enabled and the domain is undeliverable."""
+        if not self._skip_undeliverable_domains or facts is None:
+            return None
+        inferred = undeliverable_result(email, facts)
+        return None if inferred is None else self._to_result(freeze(inferred))
+
+    def domain_facts(self, domain: str) -> Optional[Mapping[str, Any]]:
+        """Return the domain-wide facts learned from earlier verifications.
+
+        Args:
+            domain: Domain to look up
+
+        Returns:
+            Known values of DOMAIN_FACT_FIELDS, or None if no address at the
+            domain was verified within domain_facts_ttl
+
+        Raises:
+            ValidationError: If the domain is malformed
+        """
+        return self._storage.read(domain_facts_cache_key(normalize_domain(domain)))
+
+    def _to_result(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Wrap data in VerificationResult when typed results are enabled.
+
+        Args:
+            data: Result data from the API or the cache
+
+        Returns:
+            The result in the configured representation
+        """
+        if self._typed_results and not isinstance(data, VerificationResult):
+            return VerificationResult(data)
+        return data
+
+    async def verify_many(
+        self,
+        emails: Iterable[str],
+        max_concurrency: int = 100,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[Tuple[str, Union[Mapping[str, Any], Exception]]]:
+        """Verify many email addresses concurrently.
+
+        Addresses are normalized and duplicates verified once; malformed
+        addresses are yielded with a ValidationError up front. Cached results
+        are yielded next, then cache misses are yielded in completion order.
+
+        With skip_undeliverable_domains set, the first address of a domain with
+        no known facts is verified before the rest of that domain, so a
+        disposable or dead domain costs one API call.
+
+        Args:
+            emails: Email addresses to verify
+            max_concurrency: Maximum number of verifications in flight
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            Tuples of normalized email (or the malformed input) and its
+            verification result or the raised error
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        use_facts = self._skip_undeliverable_domains and not force_refresh
+        # Set once the first verification at a domain with unknown facts is done
+        probes: Dict[str, asyncio.Event] = {}
+
+        async def verify(email: str) -> Tuple[str, Union[Mapping[str, Any], Exception]]:
+            probe = None
+            if use_facts:
+                domain = email_domain(email)
+                if domain in probes:
+                    await probes[domain].wait()
+                facts = self._read_domain_facts(email)
+                inferred = self._infer_from_domain(email, facts)
+                if inferred is not None:
+                    return email, inferred
+                if facts is None and domain not in probes:
+                    probe = probes[domain] = asyncio.Event()
+            try:
+                async with semaphore:
+                    return email, await self._verify_normalized(email, True)
+            except Exception as exc:
+                return email, exc
+            finally:
+                if probe is not None:
+                    probe.set()
+
+        normalized: Dict[str, None] = {}
+        for raw_email in emails:
+            try:
+                normalized[normalize_email(raw_email)] = None
+            except ValidationError as exc:
+                yield raw_email, exc
+        unique_emails = list(normalized)
+
+        cached_results: Dict[str, Mapping[str, Any]] = {}
+        if not force_refresh:
+            if self._stale_ttl is None and self._stale_if_error_ttl is None:
+                keys = {email_cache_key(email): email for email in unique_emails}
+                cached_results = {
+                    keys[cache_key]: self._to_result(cached_result)
+                    for cache_key, cached_result in self._storage.read_many(keys).items()
+                }
+                self._metrics.observe_cache('email', hit=True, count=len(cached_results))
+                self._metrics.observe_cache('email', hit=False, count=len(keys) - len(cached_results))
+            else:
+                # Expiry is checked one by one, so stale entries get refreshed and error-period ones skipped
+                for email in unique_emails:
+                    cached_result = self._read_cached(email)
+                    if cached_result is not None:
+                        cached_results[email] = cached_result
+        for email, cached_result in cached_results.items():
+            yield email, cached_result
+
+        tasks = [
+            asyncio.ensure_future(verify(email))
+            for email in unique_emails
+            if email not in cached_results
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_cached_result(self, email: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve cached verification result.
+
+        Args:
+            email: Email address to look up
+
+        Returns:
+            Cached verification result or None if not found
+
+        Raises:
+            ValidationError: If the email address is malformed
+        """
+        entry = self._read_unexpired(email_cache_key(normalize_email(email)))
+        return None if entry is None else self._to_result(entry[0])
+
+    def clear_cache(self, email: str) -> None:
+        """Clear cached verification result for an email.
+
+        Args:
+            email: Email address to clear from cache
+
+        Raises:
+            ValidationError: If the email address is malformed
+        """
+        try:
+            self._storage.delete(email_cache_key(normalize_email(email)))
+        except KeyError:
+            pass  # Ignore if email not in cache
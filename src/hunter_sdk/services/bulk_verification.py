@@ -0,0 +1,328 @@
+"""Streaming bulk email verification with resumable checkpoints."""
+
+import csv
+import json
+import os
+import sys
+from collections import OrderedDict, deque
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
+
+from ..circuit_breaker import is_outage
+from ..exceptions import CircuitOpenError, ValidationError
+from ..utils.normalize import normalize_email
+from .email_verification import EmailVerificationService
+
+INPUT_FORMATS = ('csv', 'jsonl', 'txt')
+OUTPUT_FORMATS = ('jsonl', 'csv')
+CSV_OUTPUT_FIELDS = ('email', 'status', 'result', 'score', 'error')
+INVALID_EMAIL_ERROR = 'Invalid email address'
+
+
+def detect_format(path: str, formats: Tuple[str, ...], default: str) -> str:
+    """Guess a file format from its extension.
+
+    Args:
+        path: File path, or ``-`` for a standard stream
+        formats: Supported formats
+        default: Format to use when the extension is not recognized
+
+    Returns:
+        Detected format
+    """
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    extension = 'jsonl' if extension == 'ndjson' else extension
+    return extension if extension in formats else default
+
+
+def iter_input(stream: TextIO, format: str, column: str = 'email') -> Iterator[str]:
+    """Stream raw email values from an input file, one per row.
+
+    CSV files are read from ``column`` when the header has it, and from the
+    first column otherwise (the first row then counts as data). JSONL lines
+    may be objects with a ``column`` field or bare strings. Blank lines are
+    skipped; unreadable rows yield an empty string so row counts stay stable.
+
+    Args:
+        stream: Input text stream
+        format: One of INPUT_FORMATS
+        column: CSV column or JSONL field holding the address
+
+    Yields:
+        Raw email values
+    """
+    if format == 'csv':
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is None:
+            return
+        lowered = [name.strip().lower() for name in header]
+        if column.lower() in lowered:
+            index = lowered.index(column.lower())
+        else:
+            index = 0
+            yield header[0] if header else ''
+        for row in reader:
+            yield row[index] if len(row) > index else ''
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if format == 'txt':
+            yield line
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield ''
+            continue
+        if isinstance(record, str):
+            yield record
+        elif isinstance(record, dict):
+            yield str(record.get(column) or '')
+        else:
+            yield ''
+
+
+@dataclass
+class BulkVerificationStats:
+    """Counters of a bulk verification run, carried over when resuming."""
+
+    rows: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    verified: int = 0
+    inferred: int = 0
+    errors: int = 0
+
+
+class _ResultWriter:
+    """Writes verification results as JSONL or CSV rows."""
+
+    def __init__(self, stream: TextIO, format: str, write_header: bool) -> None:
+        """Initialize writer.
+
+        Args:
+            stream: Output text stream
+            format: One of OUTPUT_FORMATS
+            write_header: If True, start a CSV output with its header row
+        """
+        self._stream = stream
+        self._csv: Optional['csv.DictWriter[str]'] = None
+        if format == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=CSV_OUTPUT_FIELDS, extrasaction='ignore')
+            if write_header:
+                self._csv.writeheader()
+
+    def write(self, email: str, result: Optional[Mapping[str, Any]] = None, error: Optional[str] = None) -> None:
+        """Write the outcome of one address.
+
+        Args:
+            email: Address as written to the output
+            result: Verification result, if the address was verified
+            error: Reason the address has no result, if it failed
+        """
+        if self._csv is not None:
+            row: Dict[str, Any] = dict(result or {})
+            row.update(email=email, error=error or '')
+            self._csv.writerow(row)
+        elif error is not None:
+            self._stream.write(json.dumps({'email': email, 'error': error}) + '\n')
+        else:
+            self._stream.write(json.dumps({'email': email, 'result': result}, default=dict) + '\n')
+
+
+class BulkVerificationJob:
+    """Verifies a stream of addresses in constant memory, resumably.
+
+    Input is consumed in batches: each batch is normalized and deduplicated,
+    looked up in the cache with one batch read, and its misses verified
+    concurrently through the service (and so under the client's rate
+    limit). After a batch's results are flushed to the output, a checkpoint
+    records how many input rows and output bytes are done. A rerun with the
+    same checkpoint skips the finished rows and truncates any output written
+    after the checkpoint, so every row appears in the output exactly once.
+
+    Duplicates are detected within a sliding window of recent addresses,
+    saved with the checkpoint so a resumed run still skips them; older
+    repeats are verified again, which costs a cache read, not an API call.
+    With a service created with ``skip_undeliverable_domains``, addresses at
+    known disposable or MX-less domains are answered from the domain facts
+    and counted as ``inferred`` instead of ``verified``.
+    """
+
+    def __init__(
+        self,
+        service: EmailVerificationService,
+        batch_size: int = 1000,
+        max_workers: int = 8,
+        dedupe_window: int = 100_000,
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            service: Email verification service used for lookups and API calls
+            batch_size: Input rows per batch and checkpoint
+            max_workers: Maximum number of verifications in flight
+            dedupe_window: Number of recent addresses remembered for deduplication
+        """
+        self._service = service
+        self._batch_size = batch_size
+        self._max_workers = max_workers
+        self._dedupe_window = dedupe_window
+
+    def run(
+        self,
+        input: Union[str, TextIO],
+        output: Union[str, TextIO],
+        input_format: Optional[str] = None,
+        output_format: Optional[str] = None,
+        column: str = 'email',
+        checkpoint_path: Optional[str] = None,
+    ) -> BulkVerificationStats:
+        """Verify every address of input and write the results to output.
+
+        Args:
+            input: Input file path, ``-`` for stdin, or an open text stream
+            output: Output file path, ``-`` for stdout, or an open text stream
+            input_format: One of INPUT_FORMATS, detected from the file name if None
+            output_format: One of OUTPUT_FORMATS, detected from the file name if None
+            column: CSV column or JSONL field holding the address
+            checkpoint_path: File recording progress, or None to disable resuming;
+                requires output to be a file path. Removed when the job completes.
+
+        Returns:
+            Counters of the whole job, including rows done before resuming
+
+        Raises:
+            ValueError: If checkpointing is requested for a non-file output
+            HunterConnectionError: If the API is down; progress up to the last batch is kept
+            CircuitOpenError: If the API circuit opened; progress up to the last batch is kept
+        """
+        input_name = input if isinstance(input, str) else '-'
+        output_name = output if isinstance(output, str) else '-'
+        input_format = input_format or detect_format(input_name, INPUT_FORMATS, 'txt')
+        output_format = output_format or detect_format(output_name, OUTPUT_FORMATS, 'jsonl')
+        if checkpoint_path is not None and output_name == '-':
+            raise ValueError('Checkpointing requires the output to be a file')
+
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        stats = BulkVerificationStats(**checkpoint['stats']) if checkpoint else BulkVerificationStats()
+
+        with ExitStack() as stack:
+            in_stream = self._open_input(input, stack)
+            out_stream = self._open_output(output, checkpoint, stack)
+            writer = _ResultWriter(out_stream, output_format, write_header=checkpoint is None)
+
+            rows = iter_input(in_stream, input_format, column)
+            deque(islice(rows, stats.rows), maxlen=0)
+            seen: 'OrderedDict[str, None]' = OrderedDict.fromkeys(checkpoint.get('seen', ()) if checkpoint else ())
+
+            while True:
+                batch = list(islice(rows, self._batch_size))
+                if not batch:
+                    break
+                self._process_batch(batch, seen, writer, stats)
+                stats.rows += len(batch)
+                if checkpoint_path is not None:
+                    self._save_checkpoint(checkpoint_path, out_stream, stats, seen)
+            out_stream.flush()
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return stats
+
+    def _process_batch(
+        self,
+        batch: List[str],
+        seen: 'OrderedDict[str, None]',
+        writer: _ResultWriter,
+        stats: BulkVerificationStats,
+    ) -> None:
+        """Verify the new addresses of one batch and write their results."""
+        emails = []
+        for raw in batch:
+            try:
+                email = normalize_email(raw)
+            except ValidationError:
+                stats.invalid += 1
+                writer.write(raw.strip(), error=INVALID_EMAIL_ERROR)
+                continue
+            if email in seen:
+                stats.duplicates += 1
+                seen.move_to_end(email)
+            else:
+                seen[email] = None
+                if len(seen) > self._dedupe_window:
+                    seen.popitem(last=False)
+                emails.append(email)
+
+        for email, result in self._service.verify_many(emails, max_workers=self._max_workers):
+            if isinstance(result, Exception):
+                if isinstance(result, CircuitOpenError) or is_outage(result):
+                    # Stop instead of writing errors for the rest of the input
+                    raise result
+                stats.errors += 1
+                writer.write(email, error=str(result))
+            else:
+                if result.get('inferred_from_domain'):
+                    stats.inferred += 1
+                else:
+                    stats.verified += 1
+                writer.write(email, result)
+
+    @staticmethod
+    def _open_input(input: Union[str, TextIO], stack: ExitStack) -> TextIO:
+        """Open the input stream."""
+        if not isinstance(input, str):
+            return input
+        if input == '-':
+            return sys.stdin
+        return stack.enter_context(open(input, newline='', encoding='utf-8'))
+
+    @staticmethod
+    def _open_output(output: Union[str, TextIO], checkpoint: Optional[Dict[str, Any]], stack: ExitStack) -> TextIO:
+        """Open the output stream, dropping anything written after the checkpoint."""
+        if not isinstance(output, str):
+            return output
+        if output == '-':
+            return sys.stdout
+        if checkpoint is None:
+            return stack.enter_context(open(output, 'w', newline='', encoding='utf-8'))
+        with open(output, 'r+b') as partial:
+            partial.truncate(checkpoint['output_bytes'])
+        return stack.enter_context(open(output, 'a', newline='', encoding='utf-8'))
+
+    @staticmethod
+    def _load_checkpoint(path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Read the checkpoint of an interrupted run, if there is one."""
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as checkpoint_file:
+            return json.load(checkpoint_file)
+
+    @staticmethod
+    def _save_checkpoint(
+        path: str,
+        out_stream: TextIO,
+        stats: BulkVerificationStats,
+        seen: 'OrderedDict[str, None]',
+    ) -> None:
+        """Durably record the progress made so far and the deduplication window."""
+        out_stream.flush()
+        os.fsync(out_stream.fileno())
+        checkpoint = {
+            'output_bytes': os.fstat(out_stream.fileno()).st_size,
+            'stats': asdict(stats),
+            'seen': list(seen),
+        }
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, path)
@@ -0,0 +1,200 @@
+"""Resumable crawl of domain search results for many domains."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, Mapping, Optional
+
+from ..circuit_breaker import is_outage
+from ..exceptions import CircuitOpenError, ValidationError
+from ..storage.base import BaseStorage
+from ..utils.cache_keys import cache_key
+from ..utils.normalize import normalize_domain
+from .domain_search import DomainSearchService
+
+CRAWL_PENDING = 'pending'
+CRAWL_DONE = 'done'
+CRAWL_FAILED = 'failed'
+
+
+@dataclass
+class CrawlCursor:
+    """Persisted progress of one domain."""
+
+    offset: int = 0
+    pages: int = 0
+    total: Optional[int] = None
+    status: str = CRAWL_PENDING
+    error: Optional[str] = None
+
+
+class DomainCrawlJob:
+    """Crawls every page of domain search results for a list of domains.
+
+    Each domain is crawled page by page; after every page the page itself
+    and then the domain's cursor are written to ``state``, so a rerun after
+    a crash or API outage continues from the first unfinished page. Pages
+    that were fetched but not yet recorded are fetched again, which costs a
+    cache read in the search service rather than an API call.
+
+    Domains share up to ``max_workers`` threads through a round-robin
+    scheduler: a domain has at most one page in flight and goes to the back
+    of the queue after each page, so a domain with thousands of results
+    cannot starve small ones.
+    """
+
+    def __init__(
+        self,
+        service: DomainSearchService,
+        state: BaseStorage,
+        job_id: str = 'default',
+        type: Optional[str] = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            service: Domain search service used to fetch pages
+            state: Storage persisting cursors and crawled pages; use a persistent
+                backend such as SQLiteStorage to survive restarts
+            job_id: Name separating the state of different crawls in one storage
+            type: Type of emails to return (generic or personal)
+            batch_size: Number of results per page
+            max_workers: Maximum number of pages fetched concurrently
+        """
+        self._service = service
+        self._state = state
+        self._job_id = job_id
+        self._type = type
+        self._batch_size = batch_size
+        self._max_workers = max_workers
+
+    def _cursor_key(self, domain: str) -> str:
+        """Return the state key of a domain's cursor."""
+        return cache_key('crawl', self._job_id, normalize_domain(domain))
+
+    def _page_key(self, domain: str, page: int) -> str:
+        """Return the state key of a crawled page."""
+        return cache_key('crawl', self._job_id, normalize_domain(domain), 'page', page)
+
+    def cursor(self, domain: str) -> CrawlCursor:
+        """Return the persisted progress of a domain.
+
+        Args:
+            domain: Domain to look up
+
+        Returns:
+            Cursor of the domain; a fresh cursor if it was never crawled
+
+        Raises:
+            ValidationError: If the domain is malformed
+        """
+        stored = self._state.read(self._cursor_key(domain))
+        return CrawlCursor() if stored is None else CrawlCursor(**stored)
+
+    def pages(self, domain: str) -> Iterator[Mapping[str, Any]]:
+        """Iterate over the crawled pages of a domain in offset order.
+
+        Args:
+            domain: Crawled domain
+
+        Yields:
+            Pages of search results
+        """
+        for page in range(self.cursor(domain).pages):
+            result = self._state.read(self._page_key(domain, page))
+            if result is not None:
+                yield result
+
+    def reset(self, domain: str) -> None:
+        """Forget the progress and pages of a domain, so the next run crawls it again.
+
+        Args:
+            domain: Domain to reset
+        """
+        cursor = self.cursor(domain)
+        self._state.delete_many(
+            [self._cursor_key(domain)] + [self._page_key(domain, page) for page in range(cursor.pages)],
+        )
+
+    def run(self, domains: Iterable[str]) -> Dict[str, CrawlCursor]:
+        """Crawl all pages of every domain not finished by an earlier run.
+
+        Args:
+            domains: Domains to crawl
+
+        Returns:
+            Final cursor of every domain, keyed by normalized domain; malformed
+            domains are returned as given with a failed cursor and never crawled
+
+        Raises:
+            HunterConnectionError: If the API is down; finished pages are kept
+            CircuitOpenError: If the API circuit opened; finished pages are kept
+        """
+        cursors: Dict[str, CrawlCursor] = {}
+        for raw_domain in domains:
+            try:
+                domain = normalize_domain(raw_domain)
+            except ValidationError as exc:
+                cursors[raw_domain] = CrawlCursor(status=CRAWL_FAILED, error=str(exc))
+                continue
+            if domain not in cursors:
+                cursors[domain] = self.cursor(domain)
+        ready: Deque[str] = deque(domain for domain, cursor in cursors.items() if cursor.status == CRAWL_PENDING)
+        in_flight: Dict['Future[CrawlCursor]', str] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            while ready or in_flight:
+                while ready and len(in_flight) < self._max_workers:
+                    domain = ready.popleft()
+                    in_flight[executor.submit(copy_context().run, self._crawl_page, domain, cursors[domain])] = domain
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    domain = in_flight.pop(future)
+                    cursors[domain] = future.result()
+                    if cursors[domain].status == CRAWL_PENDING:
+                        ready.append(domain)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return cursors
+
+    def _crawl_page(self, domain: str, cursor: CrawlCursor) -> CrawlCursor:
+        """Fetch the next page of a domain and persist the page and cursor.
+
+        Args:
+            domain: Domain to crawl
+            cursor: Current progress of the domain
+
+        Returns:
+            Updated cursor
+        """
+        try:
+            result = self._service.search_page(domain, self._type, self._batch_size, cursor.offset)
+        except Exception as exc:
+            if isinstance(exc, CircuitOpenError) or is_outage(exc):
+                raise
+            # The API rejected this domain; record it and move on to the others
+            cursor = CrawlCursor(**{**asdict(cursor), 'status': CRAWL_FAILED, 'error': str(exc)})
+            self._state.upsert(self._cursor_key(domain), asdict(cursor))
+            return cursor
+
+        total = (result.get('meta') or {}).get('results', cursor.total)
+        offset = cursor.offset + self._batch_size
+        if total is not None:
+            finished = offset >= total
+        else:
+            finished = len(result.get('emails') or ()) < self._batch_size
+
+        self._state.upsert(self._page_key(domain, cursor.pages), result)
+        cursor = CrawlCursor(
+            offset=offset,
+            pages=cursor.pages + 1,
+            total=total,
+            status=CRAWL_DONE if finished else CRAWL_PENDING,
+        )
+        self._state.upsert(self._cursor_key(domain), asdict(cursor))
+        return cursor
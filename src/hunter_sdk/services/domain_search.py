@@ -1,80 +1,349 @@
 """Domain search service implementation."""
 
-from typing import Any, Dict, Iterator, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from types import TracebackType
+from typing import Any, Deque, Iterator, Mapping, Optional, Tuple, Type
 
 from ..client import HunterClient
+from ..exceptions import CircuitOpenError
+from ..models import DomainSearchResult
 from ..storage.base import BaseStorage
+from ..tracing import trace_span
+from ..utils.cache_keys import domain_search_cache_key
+from ..utils.frozen import freeze
+from ..utils.normalize import normalize_domain
+from ..utils.refresh import BackgroundRefresher
+from ..utils.singleflight import SingleFlight
+
+DEFAULT_DOMAIN_SEARCH_TTL = 7 * 24 * 60 * 60
 
 
 class DomainSearchService:
     """Service for domain search with caching."""
 
-    def __init__(self, client: HunterClient, storage: BaseStorage) -> None:
+    def __init__(
+        self,
+        client: HunterClient,
+        storage: BaseStorage,
+        ttl: Optional[float] = DEFAULT_DOMAIN_SEARCH_TTL,
+        typed_results: bool = False,
+        stale_ttl: Optional[float] = None,
+        stale_if_error_ttl: Optional[float] = None,
+    ) -> None:
         """Initialize domain search service.
 
         Args:
             client: Hunter API client instance
             storage: Storage implementation for caching results
+            ttl: Seconds to cache domain search results, or None to keep them indefinitely
+            typed_results: If True, return DomainSearchResult models instead of dicts
+            stale_ttl: Seconds past ttl during which an expired result is still
+                returned while it is refreshed in the background, or None to
+                always refresh expired results in the foreground
+            stale_if_error_ttl: Seconds past ttl and stale_ttl during which an
+                expired result is kept to be returned while the client's circuit
+                is open, or None to only fall back on unexpired results
         """
         self._client = client
         self._storage = storage
+        self._metrics = client.metrics
+        self._tracer = client.tracer
+        self._ttl = ttl
+        self._typed_results = typed_results
+        self._stale_ttl = stale_ttl
+        self._stale_if_error_ttl = stale_if_error_ttl
+        self._inflight: SingleFlight[Mapping[str, Any]] = SingleFlight()
+        self._refresher = BackgroundRefresher()
+
+    def __enter__(self) -> 'DomainSearchService':
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Stop background refreshes on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Wait for pending background refreshes and stop their threads.
+
+        The client and storage are not closed, since they may be shared.
+        """
+        self._refresher.shutdown()
+
+    @property
+    def _storage_ttl(self) -> Optional[float]:
+        """Seconds results are kept in storage, including the stale and error periods."""
+        if self._ttl is None:
+            return None
+        return self._ttl + (self._stale_ttl or 0) + (self._stale_if_error_ttl or 0)
+
+    def _read_unexpired(self, cache_key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Read a cached result unless it is only kept for the error period.
+
+        Args:
+            cache_key: Cache key of the result
+
+        Returns:
+            Tuple of the result and its seconds left before the error period
+            (None if it never expires), or None if not found or expired
+        """
+        entry = self._storage.read_with_ttl(cache_key)
+        if entry is None or self._stale_if_error_ttl is None:
+            return entry
+        cached_result, remaining = entry
+        if remaining is None:
+            return entry
+        if remaining <= self._stale_if_error_ttl:
+            return None
+        return cached_result, remaining - self._stale_if_error_ttl
+
+    def _read_cached(self, cache_key: str, **params: Any) -> Optional[Mapping[str, Any]]:
+        """Read a cached result, refreshing it in the background once stale.
+
+        Args:
+            cache_key: Cache key of the search
+            **params: Domain search parameters used to refresh the result
+
+        Returns:
+            Cached search result or None if not found
+        """
+        if self._stale_ttl is None and self._stale_if_error_ttl is None:
+            cached_result = self._storage.read(cache_key)
+        else:
+            entry = self._read_unexpired(cache_key)
+            if entry is None:
+                self._metrics.observe_cache('domain', hit=False)
+                return None
+            cached_result, remaining = entry
+            if self._stale_ttl is not None and remaining is not None and remaining <= self._stale_ttl:
+                self._refresher.submit(
+                    cache_key,
+                    lambda: self._inflight.do(cache_key, lambda: self._search(cache_key, **params)),
+                )
+        self._metrics.observe_cache('domain', hit=cached_result is not None)
+        return None if cached_result is None else self._to_result(cached_result)
+
+    def _search(self, cache_key: str, **params: Any) -> Mapping[str, Any]:
+        """Call the domain search API and cache the result.
+
+        Args:
+            cache_key: Cache key to store the result under
+            **params: Domain search parameters
+
+        Returns:
+            Mapping containing search results
+        """
+        result = self._to_result(freeze(self._client.domain_search(**params)))
+        self._storage.upsert(cache_key, result, ttl=self._storage_ttl)
+        return result
 
     def search_domain(
         self,
         domain: str,
         force_refresh: bool = False,
         type: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Search for email addresses in a domain with caching.
 
+        The domain is normalized first (case, trailing dot, punycode), and
+        malformed domains are rejected without an API call. Concurrent cache
+        misses for the same search share a single API call.
+
+        With stale_ttl set, an expired result is returned immediately while one
+        background thread refreshes it. While the client's circuit is open, a
+        cached result is returned even when force_refresh is set, including an
+        expired one kept for stale_if_error_ttl.
+
         Args:
             domain: Domain to search
             force_refresh: If True, bypass cache and fetch fresh data
             type: Type of emails to return (generic or personal)
 
         Returns:
-            Dict containing search results
+            Mapping containing search results
+
+        Raises:
+            ValidationError: If the domain is malformed
+            CircuitOpenError: If the API circuit is open and no result is cached
         """
-        cache_key = f"domain:{domain}"
-        if type:
-            cache_key += f":type:{type}"
+        domain = normalize_domain(domain)
+        with trace_span(self._tracer, 'hunter.search_domain', domain=domain, type=type, force_refresh=force_refresh):
+            cache_key = domain_search_cache_key(domain, type)
 
-        if not force_refresh:
-            cached_result = self._storage.read(cache_key)
-            if cached_result is not None:
-                return cached_result
+            if not force_refresh:
+                cached_result = self._read_cached(cache_key, domain=domain, type=type)
+                if cached_result is not None:
+                    return cached_result
 
-        result = self._client.domain_search(domain=domain, type=type)
-        self._storage.create(cache_key, result)
-        return result
+            def fetch() -> Mapping[str, Any]:
+                if not force_refresh:
+                    # A call that just finished may have filled the cache
+                    entry = self._read_unexpired(cache_key)
+                    if entry is not None:
+                        return self._to_result(entry[0])
+
+                return self._search(cache_key, domain=domain, type=type)
+
+            try:
+                return self._inflight.do(cache_key, fetch)
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
+
+    def _to_result(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Wrap data in DomainSearchResult when typed results are enabled.
+
+        Args:
+            data: Result data from the API or the cache
+
+        Returns:
+            The result in the configured representation
+        """
+        if self._typed_results and not isinstance(data, DomainSearchResult):
+            return DomainSearchResult(data)
+        return data
+
+    def search_page(
+        self,
+        domain: str,
+        type: Optional[str],
+        limit: int,
+        offset: int,
+        force_refresh: bool = False,
+    ) -> Mapping[str, Any]:
+        """Fetch one page of results, caching it under its offset.
+
+        Args:
+            domain: Domain to search
+            type: Type of emails to return (generic or personal)
+            limit: Number of results per page
+            offset: Number of results to skip
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Mapping containing the page of search results
+
+        Raises:
+            ValidationError: If the domain is malformed
+        """
+        domain = normalize_domain(domain)
+        with trace_span(
+            self._tracer,
+            'hunter.search_page',
+            domain=domain,
+            type=type,
+            limit=limit,
+            offset=offset,
+            force_refresh=force_refresh,
+        ):
+            cache_key = domain_search_cache_key(domain, type, limit=limit, offset=offset)
+            params = {'domain': domain, 'type': type, 'limit': limit, 'offset': offset}
+            if not force_refresh:
+                cached_result = self._read_cached(cache_key, **params)
+                if cached_result is not None:
+                    return cached_result
+
+            try:
+                return self._inflight.do(cache_key, lambda: self._search(cache_key, **params))
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
 
     def iter_all_results(
         self,
         domain: str,
         type: Optional[str] = None,
         batch_size: int = 100,
-    ) -> Iterator[Dict[str, Any]]:
+        max_workers: int = 4,
+        force_refresh: bool = False,
+    ) -> Iterator[Mapping[str, Any]]:
         """Iterate through all results for a domain search.
 
+        The total reported in the first page's ``meta.results`` is used to
+        fetch the remaining pages concurrently on up to max_workers threads,
+        through the client's rate limiter. Pages are still yielded in offset
+        order. Each page is cached, so repeating a crawl costs no API calls.
+        Without a reported total, pages are fetched one at a time until a
+        short page is returned.
+
         Args:
             domain: Domain to search
             type: Type of emails to return (generic or personal)
             batch_size: Number of results to fetch per request
+            max_workers: Maximum number of pages fetched concurrently
+            force_refresh: If True, bypass cache and fetch fresh data
 
         Yields:
             Search result batches
         """
-        offset = 0
-        while True:
-            result = self._client.domain_search(
-                domain=domain,
-                type=type,
-                limit=batch_size,
-                offset=offset,
+        first_page = self.search_page(domain, type, batch_size, 0, force_refresh)
+        yield first_page
+
+        total = (first_page.get('meta') or {}).get('results')
+        if total is None:
+            offset = 0
+            result = first_page
+            while len(result['emails']) >= batch_size:
+                offset += batch_size
+                result = self.search_page(domain, type, batch_size, offset, force_refresh)
+                yield result
+            return
+
+        offsets = iter(range(batch_size, total, batch_size))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(offset: int) -> 'Future[Mapping[str, Any]]':
+            # Run in a copy of the caller's context so page spans nest under its span
+            return executor.submit(
+                copy_context().run, self.search_page, domain, type, batch_size, offset, force_refresh,
             )
-            yield result
 
-            if len(result['emails']) < batch_size:
-                break
+        try:
+            pending: Deque['Future[Mapping[str, Any]]'] = deque(
+                submit(offset) for offset in islice(offsets, max_workers)
+            )
+            while pending:
+                result = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(submit(next_offset))
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            offset += batch_size 
\ No newline at end of file
+    def iter_emails(
+        self,
+        domain: str,
+        type: Optional[str] = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        force_refresh: bool = False,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Stream individual email entries for a domain search.
+
+        Args:
+            domain: Domain to search
+            type: Type of emails to return (generic or personal)
+            batch_size: Number of results to fetch per request
+            max_workers: Maximum number of pages fetched concurrently
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            Email entries, as EmailEntry models when typed results are enabled
+        """
+        for page in self.iter_all_results(domain, type, batch_size, max_workers, force_refresh):
+            yield from page.emails if isinstance(page, DomainSearchResult) else page['emails']
@@ -1,44 +1,414 @@
 """Email verification service implementation."""
 
-from typing import Any, Dict, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from types import TracebackType
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 from ..client import HunterClient
+from ..exceptions import CircuitOpenError, ValidationError
+from ..models import VerificationResult
 from ..storage.base import BaseStorage
+from ..tracing import trace_span
+from ..utils.cache_keys import domain_facts_cache_key, email_cache_key
+from ..utils.frozen import freeze
+from ..utils.normalize import email_domain, normalize_domain, normalize_email
+from ..utils.refresh import BackgroundRefresher
+from ..utils.singleflight import SingleFlight
+
+DEFAULT_VERIFICATION_TTL = 30 * 24 * 60 * 60
+DEFAULT_DOMAIN_FACTS_TTL = 24 * 60 * 60
+
+# Verifier response fields that hold for every address of a domain
+DOMAIN_FACT_FIELDS = ('accept_all', 'disposable', 'webmail', 'mx_records', 'smtp_server')
+
+
+def extract_domain_facts(result: Mapping[str, Any]) -> Dict[str, Any]:
+    """Collect the domain-wide facts of a verification result.
+
+    Args:
+        result: Verification result from the API
+
+    Returns:
+        Facts present in the result; empty if it carries none
+    """
+    return {field: result[field] for field in DOMAIN_FACT_FIELDS if result.get(field) is not None}
+
+
+def undeliverable_result(email: str, facts: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the result of an address whose domain cannot receive real mail.
+
+    Args:
+        email: Normalized email address
+        facts: Known facts about the address's domain
+
+    Returns:
+        Verification result marked ``inferred_from_domain`` if the domain is
+        disposable or has no MX records, otherwise None
+    """
+    if facts.get('disposable'):
+        status = 'disposable'
+    elif facts.get('mx_records') is False:
+        status = 'invalid'
+    else:
+        return None
+    return {
+        'email': email,
+        'status': status,
+        'result': 'undeliverable',
+        'score': 0,
+        **facts,
+        'inferred_from_domain': True,
+    }
 
 
 class EmailVerificationService:
     """Service for email verification with caching."""
 
-    def __init__(self, client: HunterClient, storage: BaseStorage) -> None:
+    def __init__(
+        self,
+        client: HunterClient,
+        storage: BaseStorage,
+        ttl: Optional[float] = DEFAULT_VERIFICATION_TTL,
+        typed_results: bool = False,
+        stale_ttl: Optional[float] = None,
+        stale_if_error_ttl: Optional[float] = None,
+        domain_facts_ttl: Optional[float] = DEFAULT_DOMAIN_FACTS_TTL,
+        skip_undeliverable_domains: bool = False,
+    ) -> None:
         """Initialize email verification service.
 
         Args:
             client: Hunter API client instance
             storage: Storage implementation for caching results
+            ttl: Seconds to cache verification results, or None to keep them indefinitely
+            typed_results: If True, return VerificationResult models instead of dicts
+            stale_ttl: Seconds past ttl during which an expired result is still
+                returned while it is refreshed in the background, or None to
+                always refresh expired results in the foreground
+            stale_if_error_ttl: Seconds past ttl and stale_ttl during which an
+                expired result is kept to be returned while the client's circuit
+                is open, or None to only fall back on unexpired results
+            domain_facts_ttl: Seconds to remember the domain-wide facts (accept-all,
+                disposable, webmail, MX) learned from a verification, or None to
+                keep them indefinitely
+            skip_undeliverable_domains: If True, addresses at domains known to be
+                disposable or without MX records get an inferred result instead of
+                an API call
         """
         self._client = client
         self._storage = storage
+        self._metrics = client.metrics
+        self._tracer = client.tracer
+        self._ttl = ttl
+        self._typed_results = typed_results
+        self._stale_ttl = stale_ttl
+        self._stale_if_error_ttl = stale_if_error_ttl
+        self._domain_facts_ttl = domain_facts_ttl
+        self._skip_undeliverable_domains = skip_undeliverable_domains
+        self._inflight: SingleFlight[Mapping[str, Any]] = SingleFlight()
+        self._refresher = BackgroundRefresher()
+
+    def __enter__(self) -> 'EmailVerificationService':
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Stop background refreshes on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Wait for pending background refreshes and stop their threads.
+
+        The client and storage are not closed, since they may be shared.
+        """
+        self._refresher.shutdown()
+
+    @property
+    def _storage_ttl(self) -> Optional[float]:
+        """Seconds results are kept in storage, including the stale and error periods."""
+        if self._ttl is None:
+            return None
+        return self._ttl + (self._stale_ttl or 0) + (self._stale_if_error_ttl or 0)
+
+    def _read_unexpired(self, cache_key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Read a cached result unless it is only kept for the error period.
+
+        Args:
+            cache_key: Cache key of the result
+
+        Returns:
+            Tuple of the result and its seconds left before the error period
+            (None if it never expires), or None if not found or expired
+        """
+        entry = self._storage.read_with_ttl(cache_key)
+        if entry is None or self._stale_if_error_ttl is None:
+            return entry
+        cached_result, remaining = entry
+        if remaining is None:
+            return entry
+        if remaining <= self._stale_if_error_ttl:
+            return None
+        return cached_result, remaining - self._stale_if_error_ttl
+
+    def _read_cached(self, email: str) -> Optional[Mapping[str, Any]]:
+        """Read a cached result, refreshing it in the background once stale.
+
+        Args:
+            email: Normalized email address to look up
 
-    def verify_email(self, email: str, force_refresh: bool = False) -> Dict[str, Any]:
+        Returns:
+            Cached verification result or None if not found
+        """
+        cache_key = email_cache_key(email)
+        if self._stale_ttl is None and self._stale_if_error_ttl is None:
+            cached_result = self._storage.read(cache_key)
+        else:
+            entry = self._read_unexpired(cache_key)
+            if entry is None:
+                self._metrics.observe_cache('email', hit=False)
+                return None
+            cached_result, remaining = entry
+            if self._stale_ttl is not None and remaining is not None and remaining <= self._stale_ttl:
+                self._refresher.submit(
+                    cache_key,
+                    lambda: self._inflight.do(cache_key, lambda: self._fetch(email, check_cache=False)),
+                )
+        self._metrics.observe_cache('email', hit=cached_result is not None)
+        return None if cached_result is None else self._to_result(cached_result)
+
+    def verify_email(self, email: str, force_refresh: bool = False) -> Mapping[str, Any]:
         """Verify email address with caching.
 
+        The address is normalized first, so differently cased or spaced
+        spellings share one cache entry, and malformed addresses are rejected
+        without an API call. With skip_undeliverable_domains set, addresses at
+        a domain already known to be disposable or without MX records are
+        answered from the domain facts. Concurrent cache misses for the same
+        email share a single API call.
+
+        With stale_ttl set, an expired result is returned immediately while one
+        background call refreshes it. While the client's circuit is open, a
+        cached result is returned even when force_refresh is set, including an
+        expired one kept for stale_if_error_ttl.
+
         Args:
             email: Email address to verify
             force_refresh: If True, bypass cache and fetch fresh data
 
         Returns:
-            Dict containing verification results
+            Mapping containing verification results
+
+        Raises:
+            ValidationError: If the email address is malformed
+            CircuitOpenError: If the API circuit is open and no result is cached
         """
-        if not force_refresh:
-            cached_result = self._storage.read(email)
-            if cached_result is not None:
-                return cached_result
+        email = normalize_email(email)
+        return self._verify_normalized(email, force_refresh)
+
+    def _verify_normalized(self, email: str, force_refresh: bool) -> Mapping[str, Any]:
+        """Verify an already normalized email address with caching.
+
+        Args:
+            email: Normalized email address
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Mapping containing verification results
+        """
+        with trace_span(self._tracer, 'hunter.verify_email', email=email, force_refresh=force_refresh):
+            if not force_refresh:
+                cached_result = self._read_cached(email)
+                if cached_result is not None:
+                    return cached_result
+                inferred = self._infer_from_domain(email, self._read_domain_facts(email))
+                if inferred is not None:
+                    return inferred
 
-        result = self._client.verify_email(email)
-        self._storage.create(email, result)
+            cache_key = email_cache_key(email)
+            try:
+                return self._inflight.do(cache_key, lambda: self._fetch(email, check_cache=not force_refresh))
+            except CircuitOpenError:
+                # Serve the last known result while the API is unhealthy
+                cached_result = self._storage.read(cache_key)
+                if cached_result is None:
+                    raise
+                return self._to_result(cached_result)
+
+    def _fetch(self, email: str, check_cache: bool) -> Mapping[str, Any]:
+        """Call the API and overwrite the cached result.
+
+        Args:
+            email: Normalized email address to verify
+            check_cache: If True, re-check the cache filled by a call that just finished
+
+        Returns:
+            Mapping containing verification results
+        """
+        cache_key = email_cache_key(email)
+        if check_cache:
+            entry = self._read_unexpired(cache_key)
+            if entry is not None:
+                return self._to_result(entry[0])
+
+        result = self._to_result(freeze(self._client.verify_email(email)))
+        self._storage.upsert(cache_key, result, ttl=self._storage_ttl)
+        facts = extract_domain_facts(result)
+        if facts:
+            self._storage.upsert(domain_facts_cache_key(email_domain(email)), facts, ttl=self._domain_facts_ttl)
         return result
 
-    def get_cached_result(self, email: str) -> Optional[Dict[str, Any]]:
+    def _read_domain_facts(self, email: str) -> Optional[Mapping[str, Any]]:
+        """Read the known facts about the domain of a normalized address."""
+        if not self._skip_undeliverable_domains:
+            return None
+        return self._storage.read(domain_facts_cache_key(email_domain(email)))
+
+    def _infer_from_domain(self, email: str, facts: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """Build an inferred result when skipping is enabled and the domain is undeliverable."""
+        if not self._skip_undeliverable_domains or facts is None:
+            return None
+        inferred = undeliverable_result(email, facts)
+        return None if inferred is None else self._to_result(freeze(inferred))
+
+    def domain_facts(self, domain: str) -> Optional[Mapping[str, Any]]:
+        """Return the domain-wide facts learned from earlier verifications.
+
+        Args:
+            domain: Domain to look up
+
+        Returns:
+            Known values of DOMAIN_FACT_FIELDS, or None if no address at the
+            domain was verified within domain_facts_ttl
+
+        Raises:
+            ValidationError: If the domain is malformed
+        """
+        return self._storage.read(domain_facts_cache_key(normalize_domain(domain)))
+
+    def _to_result(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Wrap data in VerificationResult when typed results are enabled.
+
+        Args:
+            data: Result data from the API or the cache
+
+        Returns:
+            The result in the configured representation
+        """
+        if self._typed_results and not isinstance(data, VerificationResult):
+            return VerificationResult(data)
+        return data
+
+    def verify_many(
+        self,
+        emails: Iterable[str],
+        max_workers: int = 8,
+        force_refresh: bool = False,
+    ) -> Iterator[Tuple[str, Union[Mapping[str, Any], Exception]]]:
+        """Verify many email addresses on a bounded thread pool.
+
+        Addresses are normalized and duplicates verified once; malformed
+        addresses are yielded with a ValidationError up front. Cached results
+        are yielded next, then cache misses are verified concurrently through
+        the shared client (and its rate limiter) and yielded as they complete.
+
+        With skip_undeliverable_domains set, misses are grouped by domain: for
+        a domain with no known facts, one address is verified first and the
+        rest wait for it, so a disposable or dead domain costs one API call.
+
+        Args:
+            emails: Email addresses to verify
+            max_workers: Maximum number of verifications in flight
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            Tuples of normalized email (or the malformed input) and its
+            verification result or the raised error
+        """
+        normalized: Dict[str, None] = {}
+        for raw_email in emails:
+            try:
+                normalized[normalize_email(raw_email)] = None
+            except ValidationError as exc:
+                yield raw_email, exc
+        unique_emails = list(normalized)
+
+        cached_results: Dict[str, Mapping[str, Any]] = {}
+        if not force_refresh:
+            if self._stale_ttl is None and self._stale_if_error_ttl is None:
+                keys = {email_cache_key(email): email for email in unique_emails}
+                cached_results = {
+                    keys[cache_key]: self._to_result(cached_result)
+                    for cache_key, cached_result in self._storage.read_many(keys).items()
+                }
+                self._metrics.observe_cache('email', hit=True, count=len(cached_results))
+                self._metrics.observe_cache('email', hit=False, count=len(keys) - len(cached_results))
+            else:
+                # Expiry is checked one by one, so stale entries get refreshed and error-period ones skipped
+                for email in unique_emails:
+                    cached_result = self._read_cached(email)
+                    if cached_result is not None:
+                        cached_results[email] = cached_result
+        yield from cached_results.items()
+
+        misses = [email for email in unique_emails if email not in cached_results]
+
+        if not misses:
+            return
+
+        use_facts = self._skip_undeliverable_domains and not force_refresh
+        facts: Dict[str, Optional[Mapping[str, Any]]] = {}
+        # Addresses waiting for the first verification at their domain
+        held: Dict[str, List[str]] = {}
+        ready: Deque[str] = deque()
+        for email in misses:
+            domain = email_domain(email)
+            if not use_facts:
+                ready.append(email)
+            elif domain in held:
+                held[domain].append(email)
+            else:
+                if domain not in facts:
+                    facts[domain] = self._read_domain_facts(email)
+                if facts[domain] is None:
+                    held[domain] = []
+                ready.append(email)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            in_flight: Dict['Future[Mapping[str, Any]]', str] = {}
+            while ready or in_flight:
+                while ready and len(in_flight) < max_workers:
+                    email = ready.popleft()
+                    inferred = self._infer_from_domain(email, facts.get(email_domain(email))) if use_facts else None
+                    if inferred is not None:
+                        yield email, inferred
+                    else:
+                        in_flight[executor.submit(copy_context().run, self._verify_normalized, email, True)] = email
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    email = in_flight.pop(future)
+                    domain = email_domain(email)
+                    if domain in held:
+                        facts[domain] = self._read_domain_facts(email)
+                        ready.extend(held.pop(domain))
+                    try:
+                        yield email, future.result()
+                    except Exception as exc:
+                        yield email, exc
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_cached_result(self, email: str) -> Optional[Mapping[str, Any]]:
         """Retrieve cached verification result.
 
         Args:
@@ -46,16 +416,23 @@ class EmailVerificationService:
 
         Returns:
             Cached verification result or None if not found
+
+        Raises:
+            ValidationError: If the email address is malformed
         """
-        return self._storage.read(email)
+        entry = self._read_unexpired(email_cache_key(normalize_email(email)))
+        return None if entry is None else self._to_result(entry[0])
 
     def clear_cache(self, email: str) -> None:
         """Clear cached verification result for an email.
 
         Args:
             email: Email address to clear from cache
+
+        Raises:
+            ValidationError: If the email address is malformed
         """
         try:
-            self._storage.delete(email)
+            self._storage.delete(email_cache_key(normalize_email(email)))
         except KeyError:
-            pass  # Ignore if email not in cache 
\ No newline at end of file
+            pass  # Ignore if email not in cache
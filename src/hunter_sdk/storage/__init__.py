@@ -1,4 +1,8 @@
 from .base import BaseStorage
+from .lru import CacheStats, LRUStorage
 from .memory import MemoryStorage
+from .redis import RedisStorage
+from .sqlite import SQLiteStorage
+from .tiered import TieredStorage
 
-__all__ = ['BaseStorage', 'MemoryStorage']
+__all__ = ['BaseStorage', 'MemoryStorage', 'LRUStorage', 'CacheStats', 'SQLiteStorage', 'RedisStorage', 'TieredStorage']
@@ -1,12 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+
+def ttl_kwargs(storage: 'BaseStorage', ttl: Optional[float]) -> Dict[str, float]:
+    """Return the ``ttl`` keyword to pass to a storage's create or update.
+
+    Args:
+        storage: Storage about to be written to
+        ttl: Seconds until the record expires, or None to keep it indefinitely
+
+    Returns:
+        ``{'ttl': ttl}`` if the storage supports expiry and ttl is set, otherwise no arguments
+    """
+    if ttl is None or not storage.supports_ttl:
+        return {}
+    return {'ttl': ttl}
 
 
 class BaseStorage(ABC):
-    """Abstract base class for storage implementations."""
+    """Abstract base class for storage implementations.
+
+    Backends that can expire records accept a ``ttl`` keyword in ``create``
+    and ``update`` and set ``supports_ttl``. Others are only ever called
+    with a key and a value, and keep records until they are deleted.
+    """
+
+    supports_ttl = False
 
     @abstractmethod
-    def create(self, key: str, value: Dict[str, Any]) -> None:
+    def create(self, key: str, value: Mapping[str, Any]) -> None:
         """Create a new record in storage.
 
         Args:
@@ -16,7 +38,7 @@ class BaseStorage(ABC):
         pass
 
     @abstractmethod
-    def read(self, key: str) -> Optional[Dict[str, Any]]:
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
         """Retrieve a record from storage.
 
         Args:
@@ -28,7 +50,7 @@ class BaseStorage(ABC):
         pass
 
     @abstractmethod
-    def update(self, key: str, value: Dict[str, Any]) -> None:
+    def update(self, key: str, value: Mapping[str, Any]) -> None:
         """Update an existing record in storage.
 
         Args:
@@ -44,4 +66,114 @@ class BaseStorage(ABC):
         Args:
             key: Unique identifier for the record
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record together with the time it has left to live.
+
+        The default cannot tell when records expire and reports None;
+        backends that track expiry should override this.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found
+        """
+        value = self.read(key)
+        return None if value is None else (value, None)
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or replace the existing one.
+
+        The default tries ``create`` and falls back to ``update``; backends
+        that can replace a record atomically should override this.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+        """
+        try:
+            self.create(key, value, **ttl_kwargs(self, ttl))
+        except KeyError:
+            self.update(key, value, **ttl_kwargs(self, ttl))
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Mapping[str, Any]],
+        ttl: Optional[float] = None,
+    ) -> Mapping[str, Any]:
+        """Return the stored record, creating it from factory if missing.
+
+        When another writer creates the record first, its value wins and is
+        returned instead of the one produced by factory.
+
+        Args:
+            key: Unique identifier for the record
+            factory: Callable producing the data to store on a miss
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Returns:
+            The stored data
+        """
+        value = self.read(key)
+        if value is not None:
+            return value
+
+        value = factory()
+        try:
+            self.create(key, value, **ttl_kwargs(self, ttl))
+        except KeyError:
+            existing = self.read(key)
+            if existing is not None:
+                return existing
+        return value
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records from storage.
+
+        Backends that can fetch many keys in one round trip should override this.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        found = {}
+        for key in keys:
+            value = self.read(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records in storage.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, or None to keep them indefinitely
+        """
+        for key, value in items.items():
+            self.upsert(key, value, ttl=ttl)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records from storage, ignoring missing keys.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        for key in keys:
+            try:
+                self.delete(key)
+            except KeyError:
+                continue
+            deleted += 1
+        return deleted
@@ -0,0 +1,311 @@
+"""Serialization of cached records for persistent and networked storage.
+
+Encoded records start with a three byte header: the format version, the
+codec and the compression used. Readers pick the decoder from the header,
+so a cache can be read by processes configured with a different codec,
+and records written before the header existed (plain JSON) still load.
+"""
+
+import json
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Union
+
+from ..exceptions import ConfigurationError
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+zstandard: Optional[ModuleType]
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+FORMAT_VERSION = 1
+_HEADER_SIZE = 3
+_NO_COMPRESSION = 0
+
+
+class Codec(ABC):
+    """Converts records to and from bytes."""
+
+    format_id: ClassVar[int]
+
+    @abstractmethod
+    def dumps(self, value: Mapping[str, Any]) -> bytes:
+        """Encode a record, including Mapping-based result models.
+
+        Args:
+            value: Record to encode
+
+        Returns:
+            Encoded record
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Dict[str, Any]:
+        """Decode a record.
+
+        Args:
+            data: Encoded record
+
+        Returns:
+            Decoded record
+        """
+
+
+class JSONCodec(Codec):
+    """Compact JSON using the standard library."""
+
+    format_id = 1
+
+    def dumps(self, value: Mapping[str, Any]) -> bytes:
+        """Encode a record as compact JSON."""
+        return json.dumps(value, separators=(',', ':'), default=dict).encode()
+
+    def loads(self, data: bytes) -> Dict[str, Any]:
+        """Decode a JSON record."""
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """JSON using orjson; output is interchangeable with JSONCodec."""
+
+    format_id = JSONCodec.format_id
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ConfigurationError: If orjson is not installed
+        """
+        if orjson is None:
+            raise ConfigurationError('OrjsonCodec requires the orjson package')
+        self._orjson = orjson
+
+    def dumps(self, value: Mapping[str, Any]) -> bytes:
+        """Encode a record as compact JSON."""
+        return self._orjson.dumps(value, default=dict)
+
+    def loads(self, data: bytes) -> Dict[str, Any]:
+        """Decode a JSON record."""
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack, smaller than JSON for numbers and repeated short strings."""
+
+    format_id = 2
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ConfigurationError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ConfigurationError('MsgpackCodec requires the msgpack package')
+
+    def dumps(self, value: Mapping[str, Any]) -> bytes:
+        """Encode a record as MessagePack."""
+        return msgpack.packb(value, default=dict)
+
+    def loads(self, data: bytes) -> Dict[str, Any]:
+        """Decode a MessagePack record."""
+        return msgpack.unpackb(data)
+
+
+class Compressor(ABC):
+    """Compresses encoded records."""
+
+    format_id: ClassVar[int]
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress data.
+
+        Args:
+            data: Encoded record
+
+        Returns:
+            Compressed data
+        """
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress data.
+
+        Args:
+            data: Compressed data
+
+        Returns:
+            Encoded record
+        """
+
+
+class ZlibCompressor(Compressor):
+    """zlib (deflate) compression from the standard library."""
+
+    format_id = 1
+
+    def __init__(self, level: int = 6) -> None:
+        """Initialize compressor.
+
+        Args:
+            level: Compression level from 1 (fastest) to 9 (smallest)
+        """
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data with zlib."""
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress zlib data."""
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard compression; faster than zlib at a similar ratio."""
+
+    format_id = 2
+
+    def __init__(self, level: int = 3) -> None:
+        """Initialize compressor.
+
+        Args:
+            level: Compression level from 1 (fastest) to 22 (smallest)
+
+        Raises:
+            ConfigurationError: If zstandard is not installed
+        """
+        if zstandard is None:
+            raise ConfigurationError('ZstdCompressor requires the zstandard package')
+        self._zstandard = zstandard
+        self._level = level
+        # zstandard contexts must not be shared between threads
+        self._local = threading.local()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data with zstd."""
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            compressor = self._local.compressor = self._zstandard.ZstdCompressor(level=self._level)
+        return compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress zstd data."""
+        decompressor = getattr(self._local, 'decompressor', None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = self._zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+
+
+def default_codec() -> Codec:
+    """Return the fastest installed JSON codec.
+
+    Returns:
+        OrjsonCodec if orjson is installed, JSONCodec otherwise
+    """
+    return JSONCodec() if orjson is None else OrjsonCodec()
+
+
+# Decoders for records written with another configuration, by header id
+_CODECS: Dict[int, Callable[[], Codec]] = {
+    JSONCodec.format_id: default_codec,
+    MsgpackCodec.format_id: MsgpackCodec,
+}
+_COMPRESSORS: Dict[int, Callable[[], Compressor]] = {
+    ZlibCompressor.format_id: ZlibCompressor,
+    ZstdCompressor.format_id: ZstdCompressor,
+}
+
+
+class Serializer:
+    """Encodes records with a codec, optional compression and a versioned header.
+
+    Only records of at least ``compress_threshold`` encoded bytes are
+    compressed; small verification results gain little and would pay the
+    CPU cost on every read.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[Codec] = None,
+        compressor: Optional[Compressor] = None,
+        compress_threshold: int = 1024,
+    ) -> None:
+        """Initialize serializer.
+
+        Args:
+            codec: Codec for new records, defaults to the fastest installed JSON codec
+            compressor: Compressor for large records, or None to store them uncompressed
+            compress_threshold: Minimum encoded size in bytes worth compressing
+        """
+        self._codec = codec or default_codec()
+        self._compressor = compressor
+        self._compress_threshold = compress_threshold
+        self._codecs: Dict[int, Codec] = {self._codec.format_id: self._codec}
+        self._compressors: Dict[int, Compressor] = {}
+        if compressor is not None:
+            self._compressors[compressor.format_id] = compressor
+
+    def dumps(self, value: Mapping[str, Any]) -> bytes:
+        """Encode a record.
+
+        Args:
+            value: Record to encode
+
+        Returns:
+            Header followed by the encoded, possibly compressed record
+        """
+        body = self._codec.dumps(value)
+        compression = _NO_COMPRESSION
+        if self._compressor is not None and len(body) >= self._compress_threshold:
+            body = self._compressor.compress(body)
+            compression = self._compressor.format_id
+        return bytes((FORMAT_VERSION, self._codec.format_id, compression)) + body
+
+    def loads(self, data: Union[bytes, str]) -> Dict[str, Any]:
+        """Decode a record written by any Serializer or as plain JSON.
+
+        Args:
+            data: Encoded record
+
+        Returns:
+            Decoded record
+
+        Raises:
+            ValueError: If the record uses an unknown format version, codec or compression
+        """
+        if isinstance(data, str) or data[:1] == b'{':
+            return json.loads(data)
+        if data[0] != FORMAT_VERSION:
+            raise ValueError(f'Unsupported record format version {data[0]}')
+
+        body = data[_HEADER_SIZE:]
+        if data[2] != _NO_COMPRESSION:
+            body = self._lookup(self._compressors, _COMPRESSORS, data[2], 'compression').decompress(body)
+        return self._lookup(self._codecs, _CODECS, data[1], 'codec').loads(body)
+
+    @staticmethod
+    def _lookup(cache: Dict[int, Any], factories: Dict[int, Callable[[], Any]], format_id: int, kind: str) -> Any:
+        """Return the codec or compressor for a header id, creating it on first use."""
+        instance = cache.get(format_id)
+        if instance is None:
+            factory = factories.get(format_id)
+            if factory is None:
+                raise ValueError(f'Unsupported record {kind} {format_id}')
+            instance = cache[format_id] = factory()
+        return instance
@@ -0,0 +1,313 @@
+"""Bounded LRU storage with per-key expiry."""
+
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..utils.frozen import freeze
+from .base import BaseStorage
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the deep memory footprint of a JSON-like value.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class _Entry:
+    """Stored value with its expiry deadline and estimated size."""
+
+    __slots__ = ('value', 'expires_at', 'size')
+
+    def __init__(self, value: Mapping[str, Any], expires_at: Optional[float], size: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class LRUStorage(BaseStorage):
+    """Thread-safe in-memory storage bounded by entry count and size.
+
+    The least recently used records are evicted once either limit is
+    exceeded. Expired records are dropped lazily on access and by a sweep
+    that runs at most once per ``sweep_interval`` during writes. Records are
+    stored frozen, so reads hand out shared read-only references.
+    """
+
+    supports_ttl = True
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        sweep_interval: float = 60.0,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        """Initialize empty storage.
+
+        Args:
+            max_entries: Maximum number of records, or None for no limit
+            max_bytes: Maximum estimated size of all records, or None for no limit
+            default_ttl: Expiry in seconds for records written without a ttl
+            sweep_interval: Minimum seconds between sweeps of expired records
+            sizeof: Function estimating the size of a record in bytes
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._sweep_interval = sweep_interval
+        self._sizeof = sizeof
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of hit, miss, eviction and size counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of stored records, including unswept expired ones."""
+        return len(self._entries)
+
+    def _live_entry(self, key: str, now: float) -> Optional[_Entry]:
+        """Return the entry for key, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+            self._remove(key)
+            self._stats.expirations += 1
+            return None
+        return entry
+
+    def _remove(self, key: str) -> _Entry:
+        """Remove an entry and release its size."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        return entry
+
+    def _set(self, key: str, value: Mapping[str, Any], ttl: Optional[float], now: float) -> None:
+        """Store a record as most recently used and enforce the bounds."""
+        if key in self._entries:
+            self._remove(key)
+        ttl = self._default_ttl if ttl is None else ttl
+        value = freeze(value)
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        self._entries[key] = _Entry(value, None if ttl is None else now + ttl, size)
+        self._bytes += size
+
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _sweep(self, now: float) -> int:
+        """Drop all expired records."""
+        expired = [
+            key for key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for key in expired:
+            self._remove(key)
+        self._stats.expirations += len(expired)
+        self._next_sweep = now + self._sweep_interval
+        return len(expired)
+
+    def sweep(self) -> int:
+        """Drop all expired records now.
+
+        Returns:
+            Number of records dropped
+        """
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def create(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a new record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, defaults to default_ttl
+
+        Raises:
+            KeyError: If key already exists in storage
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._live_entry(key, now) is not None:
+                raise KeyError(f"Key '{key}' already exists in storage")
+            self._set(key, value, ttl, now)
+
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve a record from storage and mark it as recently used.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            The stored data or None if not found or expired
+        """
+        with self._lock:
+            entry = self._live_entry(key, time.monotonic())
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record with its remaining lifetime and mark it as recently used.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found or expired
+        """
+        with self._lock:
+            now = time.monotonic()
+            entry = self._live_entry(key, now)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value, None if entry.expires_at is None else entry.expires_at - now
+
+    def update(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Update an existing record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: New data to store
+            ttl: Seconds until the record expires, defaults to default_ttl
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._live_entry(key, now) is None:
+                raise KeyError(f"Key '{key}' not found in storage")
+            self._set(key, value, ttl, now)
+
+    def delete(self, key: str) -> None:
+        """Delete a record from storage.
+
+        Args:
+            key: Unique identifier for the record
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        with self._lock:
+            if self._live_entry(key, time.monotonic()) is None:
+                raise KeyError(f"Key '{key}' not found in storage")
+            self._remove(key)
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or atomically replace the existing one.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, defaults to default_ttl
+        """
+        with self._lock:
+            self._set(key, value, ttl, time.monotonic())
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records under a single lock acquisition.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        found = {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                entry = self._live_entry(key, now)
+                if entry is None:
+                    self._stats.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                found[key] = entry.value
+        return found
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records under a single lock acquisition.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, defaults to default_ttl
+        """
+        with self._lock:
+            now = time.monotonic()
+            for key, value in items.items():
+                self._set(key, value, ttl, now)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records under a single lock acquisition.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                if self._live_entry(key, now) is not None:
+                    self._remove(key)
+                    deleted += 1
+        return deleted
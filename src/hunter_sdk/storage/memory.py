@@ -1,30 +1,60 @@
-from typing import Any, Dict, Optional
+import time
+from threading import Lock
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+from ..utils.frozen import freeze
 from .base import BaseStorage
 
 
 class MemoryStorage(BaseStorage):
-    """In-memory implementation of storage using a dictionary."""
+    """In-memory implementation of storage using a dictionary.
+
+    Records are stored frozen (see ``utils.frozen``), so reads hand out
+    shared read-only references instead of copies.
+    """
+
+    supports_ttl = True
 
     def __init__(self) -> None:
         """Initialize empty storage."""
-        self._storage: Dict[str, Dict[str, Any]] = {}
-
-    def create(self, key: str, value: Dict[str, Any]) -> None:
+        self._storage: Dict[str, Mapping[str, Any]] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def _contains(self, key: str) -> bool:
+        """Check whether key holds a live record, dropping it if expired."""
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._storage.pop(key, None)
+            self._expires_at.pop(key, None)
+            return False
+        return key in self._storage
+
+    def _set(self, key: str, value: Mapping[str, Any], ttl: Optional[float]) -> None:
+        """Store a record and its expiry."""
+        self._storage[key] = freeze(value)
+        if ttl is None:
+            self._expires_at.pop(key, None)
+        else:
+            self._expires_at[key] = time.monotonic() + ttl
+
+    def create(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
         """Create a new record in storage.
 
         Args:
             key: Unique identifier for the record
             value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
 
         Raises:
             KeyError: If key already exists in storage
         """
-        if key in self._storage:
-            raise KeyError(f"Key '{key}' already exists in storage")
-        self._storage[key] = value.copy()
+        with self._lock:
+            if self._contains(key):
+                raise KeyError(f"Key '{key}' already exists in storage")
+            self._set(key, value, ttl)
 
-    def read(self, key: str) -> Optional[Dict[str, Any]]:
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
         """Retrieve a record from storage.
 
         Args:
@@ -33,21 +63,43 @@ class MemoryStorage(BaseStorage):
         Returns:
             The stored data or None if not found
         """
-        return self._storage.get(key)
+        with self._lock:
+            if not self._contains(key):
+                return None
+            return self._storage[key]
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record together with the time it has left to live.
 
-    def update(self, key: str, value: Dict[str, Any]) -> None:
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found
+        """
+        with self._lock:
+            if not self._contains(key):
+                return None
+            expires_at = self._expires_at.get(key)
+            remaining = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+            return self._storage[key], remaining
+
+    def update(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
         """Update an existing record in storage.
 
         Args:
             key: Unique identifier for the record
             value: New data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
 
         Raises:
             KeyError: If key doesn't exist in storage
         """
-        if key not in self._storage:
-            raise KeyError(f"Key '{key}' not found in storage")
-        self._storage[key] = value.copy()
+        with self._lock:
+            if not self._contains(key):
+                raise KeyError(f"Key '{key}' not found in storage")
+            self._set(key, value, ttl)
 
     def delete(self, key: str) -> None:
         """Delete a record from storage.
@@ -58,6 +110,60 @@ class MemoryStorage(BaseStorage):
         Raises:
             KeyError: If key doesn't exist in storage
         """
-        if key not in self._storage:
-            raise KeyError(f"Key '{key}' not found in storage")
-        del self._storage[key] 
\ No newline at end of file
+        with self._lock:
+            if not self._contains(key):
+                raise KeyError(f"Key '{key}' not found in storage")
+            del self._storage[key]
+            self._expires_at.pop(key, None)
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or atomically replace the existing one.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+        """
+        with self._lock:
+            self._set(key, value, ttl)
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records from storage.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        with self._lock:
+            return {key: self._storage[key] for key in keys if self._contains(key)}
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records in storage.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, or None to keep them indefinitely
+        """
+        with self._lock:
+            for key, value in items.items():
+                self._set(key, value, ttl)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records from storage, ignoring missing keys.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        with self._lock:
+            for key in keys:
+                if self._contains(key):
+                    del self._storage[key]
+                    self._expires_at.pop(key, None)
+                    deleted += 1
+        return deleted
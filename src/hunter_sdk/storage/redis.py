@@ -0,0 +1,212 @@
+"""Redis storage shared by processes on many hosts."""
+
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..exceptions import ConfigurationError
+from .base import BaseStorage
+from .codecs import Serializer
+
+redis: Optional[ModuleType]
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+# Keys per MGET/DEL command, so one huge batch doesn't block the server
+_CHUNK_SIZE = 500
+
+
+def _ttl_ms(ttl: Optional[float]) -> Optional[int]:
+    """Convert a ttl in seconds to the millisecond expiry Redis expects."""
+    return None if ttl is None else max(1, int(ttl * 1000))
+
+
+def _chunks(keys: Sequence[str]) -> Iterable[Sequence[str]]:
+    """Split keys into command-sized chunks."""
+    for start in range(0, len(keys), _CHUNK_SIZE):
+        yield keys[start:start + _CHUNK_SIZE]
+
+
+class RedisStorage(BaseStorage):
+    """Storage backed by a Redis server, using native key expiry.
+
+    Requests go through a connection pool, so one instance can be shared
+    by all threads of a process. Batch operations are pipelined into a
+    single round trip. All keys are namespaced by ``prefix`` so the cache
+    can share a database with other data.
+    """
+
+    supports_ttl = True
+
+    def __init__(
+        self,
+        url: str = 'redis://localhost:6379/0',
+        prefix: str = 'hunter:',
+        max_connections: int = 50,
+        socket_timeout: Optional[float] = 5.0,
+        client: Optional[Any] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        """Initialize storage and its connection pool.
+
+        Args:
+            url: Redis server URL
+            prefix: Prefix added to every key
+            max_connections: Maximum number of pooled connections
+            socket_timeout: Seconds to wait for the server, or None to wait indefinitely
+            client: Existing ``redis.Redis`` compatible client to use instead of url
+            serializer: Serializer for stored records, defaults to uncompressed JSON
+
+        Raises:
+            ConfigurationError: If no client is given and redis is not installed
+        """
+        if client is None:
+            if redis is None:
+                raise ConfigurationError('RedisStorage requires the redis package')
+            client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+                url,
+                max_connections=max_connections,
+                socket_timeout=socket_timeout,
+            ))
+        self._client = client
+        self._prefix = prefix
+        self._serializer = serializer or Serializer()
+
+    def _key(self, key: str) -> str:
+        """Return the namespaced Redis key."""
+        return self._prefix + key
+
+    def create(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a new record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key already exists in storage
+        """
+        if not self._client.set(self._key(key), self._serializer.dumps(value), px=_ttl_ms(ttl), nx=True):
+            raise KeyError(f"Key '{key}' already exists in storage")
+
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve a record from storage.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            The stored data or None if not found or expired
+        """
+        raw = self._client.get(self._key(key))
+        return None if raw is None else self._serializer.loads(raw)
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record together with the time it has left to live.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found or expired
+        """
+        pipeline = self._client.pipeline(transaction=False)
+        pipeline.get(self._key(key))
+        pipeline.pttl(self._key(key))
+        raw, ttl_ms = pipeline.execute()
+        if raw is None:
+            return None
+        return self._serializer.loads(raw), None if ttl_ms < 0 else ttl_ms / 1000
+
+    def update(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Update an existing record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: New data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        if not self._client.set(self._key(key), self._serializer.dumps(value), px=_ttl_ms(ttl), xx=True):
+            raise KeyError(f"Key '{key}' not found in storage")
+
+    def delete(self, key: str) -> None:
+        """Delete a record from storage.
+
+        Args:
+            key: Unique identifier for the record
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        if not self._client.delete(self._key(key)):
+            raise KeyError(f"Key '{key}' not found in storage")
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or atomically replace the existing one.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+        """
+        self._client.set(self._key(key), self._serializer.dumps(value), px=_ttl_ms(ttl))
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records in one pipelined round trip.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        pipeline = self._client.pipeline(transaction=False)
+        for chunk in _chunks(keys):
+            pipeline.mget([self._key(key) for key in chunk])
+        values: List[Optional[bytes]] = [raw for chunk_values in pipeline.execute() for raw in chunk_values]
+        return {key: self._serializer.loads(raw) for key, raw in zip(keys, values) if raw is not None}
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records in one pipelined round trip.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, or None to keep them indefinitely
+        """
+        if not items:
+            return
+        ttl_ms = _ttl_ms(ttl)
+        pipeline = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self._key(key), self._serializer.dumps(value), px=ttl_ms)
+        pipeline.execute()
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records in one pipelined round trip.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+        pipeline = self._client.pipeline(transaction=False)
+        for chunk in _chunks(keys):
+            pipeline.delete(*(self._key(key) for key in chunk))
+        return sum(pipeline.execute())
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
@@ -0,0 +1,294 @@
+"""SQLite storage implementation."""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .base import BaseStorage
+from .codecs import Serializer
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS cache ('
+    ' key TEXT PRIMARY KEY,'
+    ' value BLOB NOT NULL,'
+    ' expires_at REAL'
+    ') WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at) WHERE expires_at IS NOT NULL',
+)
+# Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+_MAX_VARIABLES = 500
+_LIVE = '(expires_at IS NULL OR expires_at > ?)'
+_SELECT = f'SELECT value FROM cache WHERE key = ? AND {_LIVE}'
+_SELECT_WITH_EXPIRY = f'SELECT value, expires_at FROM cache WHERE key = ? AND {_LIVE}'
+_DELETE_EXPIRED_KEY = 'DELETE FROM cache WHERE key = ? AND expires_at <= ?'
+_INSERT = 'INSERT INTO cache (key, value, expires_at) VALUES (?, ?, ?)'
+_UPDATE = f'UPDATE cache SET value = ?, expires_at = ? WHERE key = ? AND {_LIVE}'
+_DELETE = f'DELETE FROM cache WHERE key = ? AND {_LIVE}'
+_UPSERT = (
+    'INSERT INTO cache (key, value, expires_at) VALUES (?, ?, ?) '
+    'ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at'
+)
+_PURGE = 'DELETE FROM cache WHERE expires_at <= ?'
+
+
+class SQLiteStorage(BaseStorage):
+    """Persistent storage backed by a SQLite database file.
+
+    The database runs in WAL mode so readers never block the writer, and
+    several processes on one host can share the same file. Each thread
+    gets its own connection. Expiry deadlines are stored as wall-clock
+    timestamps so they stay meaningful across processes and restarts.
+    """
+
+    supports_ttl = True
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout: float = 30.0,
+        synchronous: str = 'NORMAL',
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        """Open or create the database.
+
+        Args:
+            path: Path of the database file
+            busy_timeout: Seconds to wait for a lock held by another connection
+            synchronous: SQLite ``synchronous`` pragma; NORMAL is durable in WAL mode
+            serializer: Serializer for stored records, defaults to uncompressed JSON
+        """
+        self._path = path
+        self._busy_timeout = busy_timeout
+        self._synchronous = synchronous
+        self._serializer = serializer or Serializer()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        with self._transaction() as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(f'PRAGMA synchronous={self._synchronous}')
+            self._local.connection = connection
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a write transaction, joining an open batch."""
+        connection = self._connection
+        if self._local.depth:
+            yield connection
+            return
+
+        connection.execute('BEGIN IMMEDIATE')
+        self._local.depth = 1
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        else:
+            connection.execute('COMMIT')
+        finally:
+            self._local.depth = 0
+
+    @contextmanager
+    def batch(self) -> Iterator['SQLiteStorage']:
+        """Group writes made in this thread into a single transaction.
+
+        Example::
+
+            with storage.batch():
+                for email, result in results:
+                    storage.create(email, result)
+
+        Yields:
+            This storage instance
+        """
+        with self._transaction():
+            self._local.depth += 1
+            try:
+                yield self
+            finally:
+                self._local.depth -= 1
+
+    @staticmethod
+    def _expires_at(ttl: Optional[float]) -> Optional[float]:
+        """Convert a ttl into a wall-clock deadline."""
+        return None if ttl is None else time.time() + ttl
+
+    def create(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a new record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key already exists in storage
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(_DELETE_EXPIRED_KEY, (key, now))
+            try:
+                connection.execute(_INSERT, (key, self._serializer.dumps(value), self._expires_at(ttl)))
+            except sqlite3.IntegrityError:
+                raise KeyError(f"Key '{key}' already exists in storage") from None
+
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve a record from storage.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            The stored data or None if not found or expired
+        """
+        row = self._connection.execute(_SELECT, (key, time.time())).fetchone()
+        return None if row is None else self._serializer.loads(row[0])
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record together with the time it has left to live.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found or expired
+        """
+        now = time.time()
+        row = self._connection.execute(_SELECT_WITH_EXPIRY, (key, now)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        return self._serializer.loads(value), None if expires_at is None else expires_at - now
+
+    def update(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Update an existing record in storage.
+
+        Args:
+            key: Unique identifier for the record
+            value: New data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                _UPDATE,
+                (self._serializer.dumps(value), self._expires_at(ttl), key, time.time()),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(f"Key '{key}' not found in storage")
+
+    def delete(self, key: str) -> None:
+        """Delete a record from storage.
+
+        Args:
+            key: Unique identifier for the record
+
+        Raises:
+            KeyError: If key doesn't exist in storage
+        """
+        with self._transaction() as connection:
+            cursor = connection.execute(_DELETE, (key, time.time()))
+            if cursor.rowcount == 0:
+                raise KeyError(f"Key '{key}' not found in storage")
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or atomically replace the existing one.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+        """
+        with self._transaction() as connection:
+            connection.execute(_UPSERT, (key, self._serializer.dumps(value), self._expires_at(ttl)))
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records with one query per chunk of keys.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, Mapping[str, Any]] = {}
+        now = time.time()
+        for start in range(0, len(unique_keys), _MAX_VARIABLES):
+            chunk = unique_keys[start:start + _MAX_VARIABLES]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = self._connection.execute(
+                f'SELECT key, value FROM cache WHERE key IN ({placeholders}) AND {_LIVE}',
+                (*chunk, now),
+            )
+            found.update((key, self._serializer.loads(value)) for key, value in rows)
+        return found
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records in a single transaction.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, or None to keep them indefinitely
+        """
+        expires_at = self._expires_at(ttl)
+        with self._transaction() as connection:
+            connection.executemany(
+                _UPSERT,
+                ((key, self._serializer.dumps(value), expires_at) for key, value in items.items()),
+            )
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records in a single transaction, ignoring missing keys.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            return connection.executemany(_DELETE, ((key, now) for key in dict.fromkeys(keys))).rowcount
+
+    def purge_expired(self) -> int:
+        """Delete all expired records.
+
+        Returns:
+            Number of records deleted
+        """
+        with self._transaction() as connection:
+            return connection.execute(_PURGE, (time.time(),)).rowcount
+
+    def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,290 @@
+"""Two-tier storage: a small in-process cache in front of a shared backend."""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..utils.frozen import freeze
+from .base import BaseStorage, ttl_kwargs
+from .lru import CacheStats
+
+
+class _Entry:
+    """L1 copy of a record, or of a known miss when value is None."""
+
+    __slots__ = ('value', 'expires_at', 'record_expires_at')
+
+    def __init__(
+        self,
+        value: Optional[Mapping[str, Any]],
+        expires_at: Optional[float],
+        record_expires_at: Optional[float],
+    ) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.record_expires_at = record_expires_at
+
+
+class TieredStorage(BaseStorage):
+    """Read-through, write-through L1 cache around any L2 storage.
+
+    Reads are served from a bounded in-process LRU (L1) and fall through to
+    the wrapped storage (L2) on a miss, filling L1 on the way back. Writes
+    and deletes go to L2 first and then update L1, so this process never
+    reads its own stale data. Other processes sharing L2 can change records
+    behind L1's back; ``l1_ttl`` bounds how long such a change stays unseen.
+
+    Misses are remembered for ``negative_ttl`` seconds, so repeated lookups
+    of unknown keys don't each cost an L2 round trip.
+    """
+
+    supports_ttl = True
+
+    def __init__(
+        self,
+        l2: BaseStorage,
+        max_entries: int = 1024,
+        l1_ttl: Optional[float] = 60.0,
+        negative_ttl: Optional[float] = 5.0,
+    ) -> None:
+        """Initialize tiered storage with an empty L1.
+
+        Args:
+            l2: Shared storage holding the authoritative records
+            max_entries: Maximum number of records and known misses kept in L1
+            l1_ttl: Seconds L1 may serve a record before re-reading it from L2,
+                or None to keep it until the record expires
+            negative_ttl: Seconds to remember a miss, or None to disable negative caching
+        """
+        self._l2 = l2
+        self._max_entries = max_entries
+        self._l1_ttl = l1_ttl
+        self._negative_ttl = negative_ttl
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    @property
+    def l2(self) -> BaseStorage:
+        """Return the wrapped shared storage."""
+        return self._l2
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of L1 counters; misses include reads that reached L2."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+            )
+
+    def _lookup(self, key: str, now: float) -> Optional[_Entry]:
+        """Return the live L1 entry for key, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                del self._entries[key]
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry
+
+    def _fill(self, key: str, value: Mapping[str, Any], ttl: Optional[float], now: float) -> Mapping[str, Any]:
+        """Store an L1 copy of a record that expires in ttl seconds."""
+        value = freeze(value)
+        record_expires_at = None if ttl is None else now + ttl
+        expires_at = None if self._l1_ttl is None else now + self._l1_ttl
+        if record_expires_at is not None and (expires_at is None or record_expires_at < expires_at):
+            expires_at = record_expires_at
+        self._put(key, _Entry(value, expires_at, record_expires_at))
+        return value
+
+    def _fill_miss(self, key: str, now: float) -> None:
+        """Remember that key is missing from L2."""
+        if self._negative_ttl is not None:
+            self._put(key, _Entry(None, now + self._negative_ttl, None))
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        """Store an L1 entry as most recently used and enforce the bound."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop L1 copies so the next read goes to L2.
+
+        Args:
+            key: Key to drop, or None to clear all of L1
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def create(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a new record in L2 and L1.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key already exists in L2
+        """
+        try:
+            self._l2.create(key, value, **ttl_kwargs(self._l2, ttl))
+        except KeyError:
+            # Another process created it; our L1 view is outdated
+            self.invalidate(key)
+            raise
+        self._fill(key, value, ttl, time.monotonic())
+
+    def read(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Retrieve a record from L1, falling back to L2.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            The stored data or None if not found
+        """
+        entry = self.read_with_ttl(key)
+        return None if entry is None else entry[0]
+
+    def read_with_ttl(self, key: str) -> Optional[Tuple[Mapping[str, Any], Optional[float]]]:
+        """Retrieve a record and its remaining lifetime from L1, falling back to L2.
+
+        Args:
+            key: Unique identifier for the record
+
+        Returns:
+            Tuple of the stored data and its remaining seconds (None if it
+            never expires), or None if not found
+        """
+        now = time.monotonic()
+        entry = self._lookup(key, now)
+        if entry is not None:
+            if entry.value is None:
+                return None
+            remaining = None if entry.record_expires_at is None else entry.record_expires_at - now
+            return entry.value, remaining
+
+        found = self._l2.read_with_ttl(key)
+        if found is None:
+            self._fill_miss(key, now)
+            return None
+        value, remaining = found
+        return self._fill(key, value, remaining, now), remaining
+
+    def update(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Update an existing record in L2 and L1.
+
+        Args:
+            key: Unique identifier for the record
+            value: New data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+
+        Raises:
+            KeyError: If key doesn't exist in L2
+        """
+        try:
+            self._l2.update(key, value, **ttl_kwargs(self._l2, ttl))
+        except KeyError:
+            self.invalidate(key)
+            raise
+        self._fill(key, value, ttl, time.monotonic())
+
+    def delete(self, key: str) -> None:
+        """Delete a record from L1 and L2.
+
+        Args:
+            key: Unique identifier for the record
+
+        Raises:
+            KeyError: If key doesn't exist in L2
+        """
+        self.invalidate(key)
+        self._l2.delete(key)
+
+    def upsert(self, key: str, value: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Create a record or replace the existing one in L2 and L1.
+
+        Args:
+            key: Unique identifier for the record
+            value: Data to store
+            ttl: Seconds until the record expires, or None to keep it indefinitely
+        """
+        self._l2.upsert(key, value, ttl=ttl)
+        self._fill(key, value, ttl, time.monotonic())
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Retrieve several records, reading all L1 misses from L2 in one batch.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Mapping of found keys to their data; missing keys are omitted
+        """
+        now = time.monotonic()
+        found = {}
+        missing = []
+        for key in keys:
+            entry = self._lookup(key, now)
+            if entry is None:
+                missing.append(key)
+            elif entry.value is not None:
+                found[key] = entry.value
+
+        if missing:
+            from_l2 = self._l2.read_many(missing)
+            for key in missing:
+                value = from_l2.get(key)
+                if value is None:
+                    self._fill_miss(key, now)
+                elif self._l1_ttl is None:
+                    # Batch reads don't report expiry, so only l1_ttl could bound the copy
+                    found[key] = value
+                else:
+                    found[key] = self._fill(key, value, None, now)
+        return found
+
+    def write_many(self, items: Mapping[str, Mapping[str, Any]], ttl: Optional[float] = None) -> None:
+        """Create or replace several records in L2 and L1.
+
+        Args:
+            items: Mapping of unique identifiers to data to store
+            ttl: Seconds until the records expire, or None to keep them indefinitely
+        """
+        self._l2.write_many(items, ttl=ttl)
+        now = time.monotonic()
+        for key, value in items.items():
+            self._fill(key, value, ttl, now)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several records from L1 and L2, ignoring missing keys.
+
+        Args:
+            keys: Unique identifiers of the records
+
+        Returns:
+            Number of records deleted from L2
+        """
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        return self._l2.delete_many(keys)
@@ -0,0 +1,343 @@
+"""Tracing hooks for following individual calls through the SDK.
+
+Services open a span around each lookup and clients report every API
+call to the configured ``Tracer`` through four hooks: before each HTTP
+attempt, after each response, before each retry, and once after the call
+with its full timing breakdown. The default ``NoOpTracer`` is disabled, so
+untraced clients neither take timestamps nor build ``CallTrace`` objects.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from .exceptions import ConfigurationError
+
+otel_trace: Optional[ModuleType]
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None
+
+
+@dataclass
+class SpanInfo:
+    """A service-level operation, such as one email verification."""
+
+    name: str
+    attributes: Dict[str, Any]
+    started: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class CallTrace:
+    """Timing breakdown of one API call, including all of its attempts.
+
+    Durations are in seconds. ``queue_wait`` is the time between the
+    enclosing service span starting and the client taking the call (cache
+    reads, waiting on a shared in-flight call), or None outside a span.
+    ``server`` is wire time after connecting: sending the request, waiting
+    for the server and reading the response.
+    """
+
+    method: str
+    endpoint: str
+    span: Optional[SpanInfo] = None
+    started: float = field(default_factory=time.perf_counter)
+    started_ns: int = field(default_factory=time.time_ns)
+    attempts: int = 0
+    status: Optional[str] = None
+    error: Optional[BaseException] = None
+    queue_wait: Optional[float] = None
+    rate_limit_wait: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    decode: float = 0.0
+    backoff: float = 0.0
+    total: float = 0.0
+
+    def breakdown(self) -> Dict[str, float]:
+        """Return the measured phases of the call.
+
+        Returns:
+            Mapping of phase name to seconds, omitting queue_wait outside a span
+        """
+        phases = {
+            'queue_wait': self.queue_wait,
+            'rate_limit_wait': self.rate_limit_wait,
+            'connect': self.connect,
+            'server': self.server,
+            'decode': self.decode,
+            'backoff': self.backoff,
+        }
+        return {name: seconds for name, seconds in phases.items() if seconds is not None}
+
+
+_current_span: ContextVar[Optional[SpanInfo]] = ContextVar('hunter_sdk_span', default=None)
+
+
+def current_span() -> Optional[SpanInfo]:
+    """Return the innermost service span of the current context, if any."""
+    return _current_span.get()
+
+
+def start_call(tracer: 'Tracer', method: str, endpoint: str) -> Optional[CallTrace]:
+    """Begin tracing an API call in the current span.
+
+    Args:
+        tracer: Tracer of the client
+        method: HTTP method
+        endpoint: API endpoint
+
+    Returns:
+        Trace to fill in, or None if tracing is disabled
+    """
+    if not tracer.enabled:
+        return None
+    span = _current_span.get()
+    call = CallTrace(method, endpoint, span=span)
+    if span is not None:
+        call.queue_wait = call.started - span.started
+    return call
+
+
+def finish_call(tracer: 'Tracer', call: CallTrace, error: Optional[BaseException] = None) -> None:
+    """Complete a call trace and hand it to the tracer.
+
+    Args:
+        tracer: Tracer of the client
+        call: Trace returned by start_call
+        error: Error the call raised, if any
+    """
+    call.error = error
+    call.total = time.perf_counter() - call.started
+    tracer.after_call(call)
+
+
+class Tracer:
+    """Interface of tracers; every hook is a no-op by default.
+
+    Subclasses override the hooks they need. Hooks run on the calling
+    thread (or task) inside the enclosing span's context, and must not
+    raise.
+    """
+
+    enabled = True
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        """Wrap a service-level operation.
+
+        Args:
+            name: Operation name, e.g. ``hunter.verify_email``
+            attributes: Operation parameters, e.g. the email address
+        """
+        yield
+
+    def before_request(self, call: CallTrace) -> None:
+        """Run before each HTTP attempt; ``call.attempts`` is its number.
+
+        Args:
+            call: Trace of the call
+        """
+
+    def after_response(self, call: CallTrace) -> None:
+        """Run after each HTTP attempt; ``call.status`` is its status or ``error``.
+
+        Args:
+            call: Trace of the call
+        """
+
+    def on_retry(self, call: CallTrace, delay: float) -> None:
+        """Run before sleeping for a retry.
+
+        Args:
+            call: Trace of the call
+            delay: Seconds about to be slept
+        """
+
+    def after_call(self, call: CallTrace) -> None:
+        """Run once the call returned or failed; ``call.error`` is set on failure.
+
+        Args:
+            call: Complete trace of the call
+        """
+
+
+class NoOpTracer(Tracer):
+    """Traces nothing; the default."""
+
+    enabled = False
+
+
+@contextmanager
+def trace_span(tracer: Tracer, name: str, **attributes: Any) -> Iterator[None]:
+    """Run the enclosed service operation as a span of tracer.
+
+    Args:
+        tracer: Tracer of the service's client
+        name: Operation name
+        **attributes: Operation parameters
+    """
+    if not tracer.enabled:
+        yield
+        return
+    token = _current_span.set(SpanInfo(name, attributes))
+    try:
+        with tracer.span(name, attributes):
+            yield
+    finally:
+        _current_span.reset(token)
+
+
+class MultiTracer(Tracer):
+    """Forwards every hook to several tracers in order."""
+
+    def __init__(self, *tracers: Tracer) -> None:
+        """Initialize tracer.
+
+        Args:
+            *tracers: Tracers to forward to; disabled ones are skipped
+        """
+        self._tracers: Sequence[Tracer] = tuple(tracer for tracer in tracers if tracer.enabled)
+        self.enabled = bool(self._tracers)
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        """Open the span in every tracer, nesting them in order."""
+        with _nested_spans(self._tracers, name, attributes):
+            yield
+
+    def before_request(self, call: CallTrace) -> None:
+        """Forward to every tracer."""
+        for tracer in self._tracers:
+            tracer.before_request(call)
+
+    def after_response(self, call: CallTrace) -> None:
+        """Forward to every tracer."""
+        for tracer in self._tracers:
+            tracer.after_response(call)
+
+    def on_retry(self, call: CallTrace, delay: float) -> None:
+        """Forward to every tracer."""
+        for tracer in self._tracers:
+            tracer.on_retry(call, delay)
+
+    def after_call(self, call: CallTrace) -> None:
+        """Forward to every tracer."""
+        for tracer in self._tracers:
+            tracer.after_call(call)
+
+
+@contextmanager
+def _nested_spans(tracers: Sequence[Tracer], name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+    """Enter the span of each tracer inside the previous one."""
+    if not tracers:
+        yield
+        return
+    with tracers[0].span(name, attributes):
+        with _nested_spans(tracers[1:], name, attributes):
+            yield
+
+
+class SlowCallLogger(Tracer):
+    """Logs the timing breakdown of API calls slower than a threshold."""
+
+    def __init__(self, threshold: float = 1.0, logger: Optional[logging.Logger] = None) -> None:
+        """Initialize slow call logger.
+
+        Args:
+            threshold: Seconds a call must take to be logged
+            logger: Logger to write to, defaults to this module's logger
+        """
+        self._threshold = threshold
+        self._logger = logger or logging.getLogger(__name__)
+
+    def after_call(self, call: CallTrace) -> None:
+        """Log the call if it exceeded the threshold."""
+        if call.total < self._threshold:
+            return
+        phases = ', '.join(f'{name} {seconds:.3f}s' for name, seconds in call.breakdown().items())
+        operation = f' in {call.span.name} {call.span.attributes}' if call.span is not None else ''
+        outcome = f'failed ({call.error})' if call.error is not None else f'status {call.status}'
+        self._logger.warning(
+            'Slow Hunter call %s %s%s took %.3fs, %s after %d attempt(s): %s',
+            call.method,
+            call.endpoint,
+            operation,
+            call.total,
+            outcome,
+            call.attempts,
+            phases,
+        )
+
+
+class OpenTelemetryTracer(Tracer):
+    """Reports service spans and API calls to OpenTelemetry.
+
+    Service operations become spans named after the operation, and each
+    API call becomes a child span carrying the timing breakdown as
+    ``hunter.*`` attributes and one event per retry.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        """Initialize tracer.
+
+        Args:
+            tracer: OpenTelemetry tracer, defaults to one from the global provider
+
+        Raises:
+            ConfigurationError: If opentelemetry-api is not installed
+        """
+        if tracer is None:
+            if otel_trace is None:
+                raise ConfigurationError('OpenTelemetryTracer requires the opentelemetry-api package')
+            tracer = otel_trace.get_tracer('hunter_sdk')
+        self._tracer = tracer
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        """Run the operation as the current OpenTelemetry span."""
+        with self._tracer.start_as_current_span(name, attributes=_otel_attributes(attributes)):
+            yield
+
+    def after_call(self, call: CallTrace) -> None:
+        """Record the finished call as a span of the current context."""
+        span = self._tracer.start_span(
+            f'{call.method} {call.endpoint}',
+            start_time=call.started_ns,
+            attributes={
+                'http.request.method': call.method,
+                'hunter.endpoint': call.endpoint,
+                'hunter.attempts': call.attempts,
+                **({'http.response.status_code': int(call.status)} if call.status and call.status.isdigit() else {}),
+                **{f'hunter.{name}': seconds for name, seconds in call.breakdown().items()},
+            },
+        )
+        if call.error is not None:
+            span.record_exception(call.error)
+            if otel_trace is not None:
+                span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(call.error)))
+        span.end(end_time=call.started_ns + int(call.total * 1e9))
+
+    def on_retry(self, call: CallTrace, delay: float) -> None:
+        """Add a retry event to the enclosing service span."""
+        if otel_trace is not None:
+            otel_trace.get_current_span().add_event('hunter.retry', {
+                'hunter.endpoint': call.endpoint,
+                'hunter.attempt': call.attempts,
+                'hunter.delay': delay,
+            })
+
+
+def _otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Prefix attribute names and drop values OpenTelemetry cannot store."""
+    return {
+        f'hunter.{name}': value
+        for name, value in attributes.items()
+        if isinstance(value, (str, bool, int, float))
+    }
@@ -0,0 +1,383 @@
+"""HTTP transports of the sync client.
+
+``RequestsTransport``, the default, sends requests through a pooled
+``requests.Session``; ``HTTPXTransport`` uses httpx and can speak HTTP/2.
+Transports raise ``requests`` exceptions and return responses with the
+``requests.Response`` attributes the client reads (``ok``, ``status_code``,
+``headers``, ``content`` and ``json()``), so a custom transport can be
+plugged in through ``HunterConfig.transport``.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .exceptions import ConfigurationError
+
+# Seconds this thread spent opening connections, read around each traced attempt
+_connect_time = threading.local()
+
+
+def connect_seconds() -> float:
+    """Return the connection setup time accumulated by the current thread."""
+    return getattr(_connect_time, 'seconds', 0.0)
+
+
+@dataclass
+class PoolStats:
+    """Connection pool usage of a transport.
+
+    ``opened``, ``requests`` and ``discarded`` are totals since the
+    transport was created, or None when the transport cannot count them.
+    Frequent discards mean ``pool_maxsize`` is smaller than the number of
+    threads sharing the client.
+    """
+
+    maxsize: int
+    pools: int
+    open: int
+    idle: int
+    in_use: int
+    opened: Optional[int] = None
+    requests: Optional[int] = None
+    discarded: Optional[int] = None
+
+    @property
+    def reuse_ratio(self) -> Optional[float]:
+        """Share of requests sent on an already open connection, or None if unknown."""
+        if self.opened is None or not self.requests:
+            return None
+        return max(0.0, 1 - self.opened / self.requests)
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection recording its DNS lookup and connect time."""
+
+    def connect(self) -> None:
+        """Open the connection, adding the time taken to this thread's connect time."""
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = connect_seconds() + time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection recording its DNS lookup, connect and TLS handshake time."""
+
+    def connect(self) -> None:
+        """Open the connection and handshake, adding the time taken to this thread's connect time."""
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = connect_seconds() + time.perf_counter() - started
+
+
+class _PooledHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP pool counting the connections it opens, lends out and discards.
+
+    urllib3 has no public hooks for this, so this class is the one place
+    relying on its internals: the private ``_get_conn`` and ``_put_conn``
+    methods, called to lend out and take back a connection, and the
+    ``pool`` queue of idle connections. They behave the same from urllib3
+    1.26 through 2.x, the range pinned in requirements.txt; check them
+    again before widening it.
+    """
+
+    ConnectionCls: Type[HTTPConnection] = _TimedHTTPConnection
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize pool with zeroed counters."""
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.opened = 0
+        self.in_use = 0
+        self.discarded = 0
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        """Lend out a connection, counting it as opened if it has to connect first."""
+        conn = super()._get_conn(timeout)
+        with self._stats_lock:
+            self.in_use += 1
+            # New connections and ones dropped by the server connect before the request
+            if isinstance(conn, HTTPConnection) and conn.sock is None:
+                self.opened += 1
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        """Take back a connection, counting it as discarded if the pool is full."""
+        with self._stats_lock:
+            self.in_use = max(0, self.in_use - 1)
+            if conn is not None and self.pool is not None and self.pool.full():
+                self.discarded += 1
+            super()._put_conn(conn)
+
+    def idle(self) -> int:
+        """Return the number of open connections waiting in the pool."""
+        if self.pool is None:
+            return 0
+        with self.pool.mutex:
+            return sum(1 for conn in self.pool.queue if conn is not None and conn.sock is not None)
+
+
+class _PooledHTTPSConnectionPool(_PooledHTTPConnectionPool, HTTPSConnectionPool):
+    """HTTPS pool counting its connections like ``_PooledHTTPConnectionPool``."""
+
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose pools count their connections and time connection setup."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with counting, connection-timing pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _PooledHTTPConnectionPool,
+            'https': _PooledHTTPSConnectionPool,
+        }
+
+    def connection_pools(self) -> List[_PooledHTTPConnectionPool]:
+        """Return the per-host pools currently open."""
+        pools = self.poolmanager.pools
+        # A pool evicted since keys() was read is skipped
+        found = (pools.get(key) for key in pools.keys())
+        return [pool for pool in found if isinstance(pool, _PooledHTTPConnectionPool)]
+
+
+class Transport(ABC):
+    """Interface of the sync client's HTTP transports."""
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: ``params``, and ``timeout`` in seconds or as (connect, read)
+
+        Returns:
+            Response with ``ok``, ``status_code``, ``headers``, ``content`` and ``json()``
+
+        Raises:
+            requests.RequestException: If no response arrived; ConnectionError
+                and Timeout are retried by the client
+        """
+
+    @abstractmethod
+    def pool_stats(self) -> PoolStats:
+        """Return the connection pool usage.
+
+        Returns:
+            Current pool usage
+        """
+
+    def close(self) -> None:
+        """Close pooled connections."""
+
+
+class RequestsTransport(Transport):
+    """Transport sending requests through a pooled ``requests.Session``.
+
+    One pool of up to ``pool_maxsize`` keep-alive connections is kept per
+    host. Without ``pool_block``, threads finding the pool empty open extra
+    connections, which are closed (discarded) when returned to a full pool.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compression: bool = True,
+    ) -> None:
+        """Initialize transport.
+
+        Args:
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Connections kept open per host
+            pool_block: If True, wait for a free connection instead of opening extra ones
+            keep_alive: If False, close every connection after its response
+            compression: If False, ask for uncompressed responses
+        """
+        self.session = requests.Session()
+        self._adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._pool_maxsize = pool_maxsize
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+        if not compression:
+            self.session.headers['Accept-Encoding'] = 'identity'
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the session."""
+        return self.session.request(method, url, **kwargs)
+
+    def pool_stats(self) -> PoolStats:
+        """Return the usage of the session's connection pools."""
+        pools = self._adapter.connection_pools()
+        idle = sum(pool.idle() for pool in pools)
+        in_use = sum(pool.in_use for pool in pools)
+        return PoolStats(
+            maxsize=self._pool_maxsize,
+            pools=len(pools),
+            open=idle + in_use,
+            idle=idle,
+            in_use=in_use,
+            opened=sum(pool.opened for pool in pools),
+            requests=sum(pool.num_requests for pool in pools),
+            discarded=sum(pool.discarded for pool in pools),
+        )
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+
+class _HTTPXResponse:
+    """Exposes an httpx response through the ``requests.Response`` attributes the client reads."""
+
+    __slots__ = ('_response',)
+
+    def __init__(self, response: httpx.Response) -> None:
+        """Wrap an httpx response.
+
+        Args:
+            response: Response read in full
+        """
+        self._response = response
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is 2xx."""
+        return self._response.is_success
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code."""
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        """Case-insensitive response headers."""
+        return self._response.headers
+
+    @property
+    def content(self) -> bytes:
+        """Decompressed response body."""
+        return self._response.content
+
+    def json(self) -> Any:
+        """Parse the body as JSON."""
+        return self._response.json()
+
+
+def httpx_pool_stats(client: Union[httpx.Client, httpx.AsyncClient], maxsize: int) -> PoolStats:
+    """Return the connection usage of an httpx client's default transport.
+
+    Args:
+        client: httpx client
+        maxsize: Configured number of keep-alive connections
+
+    Returns:
+        Current pool usage; totals are not tracked by httpx and left unset
+    """
+    # httpx exposes no pool statistics; read them from its httpcore pool
+    pool = getattr(getattr(client, '_transport', None), '_pool', None)
+    connections = list(getattr(pool, 'connections', ()))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return PoolStats(
+        maxsize=maxsize,
+        pools=len({str(connection._origin) for connection in connections}),
+        open=len(connections),
+        idle=idle,
+        in_use=len(connections) - idle,
+    )
+
+
+class HTTPXTransport(Transport):
+    """Transport sending requests through ``httpx``, optionally over HTTP/2.
+
+    HTTP/2 multiplexes concurrent requests over one connection per host
+    and requires the h2 package (``pip install httpx[http2]``).
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compression: bool = True,
+    ) -> None:
+        """Initialize transport.
+
+        Args:
+            http2: If True, negotiate HTTP/2 with servers supporting it
+            pool_maxsize: Keep-alive connections kept open
+            pool_block: If True, never open more than pool_maxsize connections
+            keep_alive: If False, close every connection after its response
+            compression: If False, ask for uncompressed responses
+
+        Raises:
+            ConfigurationError: If HTTP/2 is requested without the h2 package
+        """
+        headers: Dict[str, str] = {} if compression else {'Accept-Encoding': 'identity'}
+        try:
+            self._client = httpx.Client(
+                http2=http2,
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize if pool_block else None,
+                    max_keepalive_connections=pool_maxsize if keep_alive else 0,
+                ),
+            )
+        except ImportError as e:
+            raise ConfigurationError('HTTP/2 requires the h2 package (pip install httpx[http2])') from e
+        self._pool_maxsize = pool_maxsize
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _HTTPXResponse:
+        """Send a request through httpx, raising requests exceptions on failure."""
+        timeout: Union[None, float, Tuple[float, float]] = kwargs.pop('timeout', None)
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is not None:
+            kwargs['timeout'] = timeout
+        with self._lock:
+            self._requests += 1
+        try:
+            return _HTTPXResponse(self._client.request(method, url, **kwargs))
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError) as e:
+            raise requests.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+
+    def pool_stats(self) -> PoolStats:
+        """Return the usage of the httpx connection pool."""
+        stats = httpx_pool_stats(self._client, self._pool_maxsize)
+        stats.requests = self._requests
+        return stats
+
+    def close(self) -> None:
+        """Close the httpx client and its pooled connections."""
+        self._client.close()
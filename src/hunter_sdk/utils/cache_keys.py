@@ -0,0 +1,73 @@
+"""Namespaced, versioned cache keys shared by all services.
+
+Keys look like ``hunter:v1:email:john@example.com``. Bump
+CACHE_KEY_VERSION when the layout or meaning of cached values changes,
+so old entries are ignored (and expire) instead of being misread.
+"""
+
+from typing import Optional, Union
+
+CACHE_KEY_PREFIX = 'hunter'
+CACHE_KEY_VERSION = 1
+
+
+def cache_key(namespace: str, *parts: Union[str, int]) -> str:
+    """Build a cache key.
+
+    Args:
+        namespace: Kind of cached value, e.g. ``email`` or ``domain``
+        *parts: Identifying parts of the value, already normalized
+
+    Returns:
+        Cache key
+    """
+    return ':'.join((CACHE_KEY_PREFIX, f'v{CACHE_KEY_VERSION}', namespace, *map(str, parts)))
+
+
+def email_cache_key(email: str) -> str:
+    """Build the cache key of an email verification.
+
+    Args:
+        email: Normalized email address
+
+    Returns:
+        Cache key
+    """
+    return cache_key('email', email)
+
+
+def domain_facts_cache_key(domain: str) -> str:
+    """Build the cache key of the facts known about a domain.
+
+    Args:
+        domain: Normalized domain
+
+    Returns:
+        Cache key
+    """
+    return cache_key('domain-facts', domain)
+
+
+def domain_search_cache_key(
+    domain: str,
+    type: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> str:
+    """Build the cache key for a domain search or one of its pages.
+
+    Args:
+        domain: Normalized domain
+        type: Type of emails to return (generic or personal)
+        limit: Number of results per page, for paginated searches
+        offset: Number of results skipped, for paginated searches
+
+    Returns:
+        Cache key
+    """
+    parts = [domain]
+    if type:
+        parts += ['type', type]
+    if limit is not None:
+        parts += ['limit', str(limit), 'offset', str(offset or 0)]
+    return cache_key('domain', *parts)
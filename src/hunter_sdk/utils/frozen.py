@@ -0,0 +1,101 @@
+"""Read-only containers for sharing cached results without copying."""
+
+from typing import Any, Dict, NoReturn, Tuple, Type
+
+
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    """Reject in-place modification."""
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class Immutable:
+    """Marker base for read-only values that freeze() can share as-is."""
+
+    __slots__ = ()
+
+
+class FrozenDict(dict, Immutable):
+    """Read-only dict.
+
+    Compares equal to plain dicts and serializes like one, but every
+    mutating method raises TypeError. ``copy()`` returns a mutable dict.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self) -> Tuple[Type['FrozenDict'], Tuple[Dict[Any, Any]]]:
+        """Pickle through the constructor, since __setitem__ is disabled."""
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> 'FrozenDict':
+        """Return self, as the dict cannot change."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenDict':
+        """Return self, as the dict and its frozen contents cannot change."""
+        return self
+
+
+class FrozenList(list, Immutable):
+    """Read-only list.
+
+    Compares equal to plain lists and serializes like one, but every
+    mutating method raises TypeError. ``copy()`` returns a mutable list.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __reduce__(self) -> Tuple[Type['FrozenList'], Tuple[list]]:
+        """Pickle through the constructor, since mutation is disabled."""
+        return (type(self), (list(self),))
+
+    def __copy__(self) -> 'FrozenList':
+        """Return self, as the list cannot change."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenList':
+        """Return self, as the list and its frozen contents cannot change."""
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Convert a JSON-like value into read-only containers.
+
+    Already frozen containers are returned as-is, so freezing a cached
+    result again costs nothing.
+
+    Args:
+        value: Value to freeze
+
+    Returns:
+        Value with dicts and lists replaced by FrozenDict and FrozenList
+    """
+    if isinstance(value, Immutable):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
@@ -0,0 +1,93 @@
+"""Normalization and syntactic validation of email addresses and domains."""
+
+import re
+
+from ..exceptions import ValidationError
+
+MAX_EMAIL_LENGTH = 254
+MAX_LOCAL_PART_LENGTH = 64
+
+# Unquoted dot-atom local part (RFC 5322); quoted local parts are not accepted
+_LOCAL_PART = re.compile(r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*")
+_LABEL = re.compile(r'(?!-)[a-z0-9-]{1,63}(?<!-)')
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain to its canonical ASCII form.
+
+    Surrounding whitespace and trailing dots are removed, the domain is
+    lowercased and internationalized names are converted to punycode, so
+    ``EXAMPLE.COM.`` and ``bücher.de`` map to ``example.com`` and
+    ``xn--bcher-kva.de``.
+
+    Args:
+        domain: Domain name
+
+    Returns:
+        Canonical domain
+
+    Raises:
+        ValidationError: If the domain is not a syntactically valid host name
+    """
+    normalized = domain.strip().rstrip('.').lower()
+    if not normalized.isascii():
+        try:
+            normalized = normalized.encode('idna').decode('ascii')
+        except UnicodeError:
+            raise ValidationError(f'Invalid domain: {domain!r}') from None
+
+    labels = normalized.split('.')
+    if (
+        len(labels) < 2
+        or len(normalized) > 253
+        or not all(_LABEL.fullmatch(label) for label in labels)
+        or labels[-1].isdigit()
+    ):
+        raise ValidationError(f'Invalid domain: {domain!r}')
+    return normalized
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address to its canonical form.
+
+    The address is trimmed and lowercased and its domain normalized with
+    normalize_domain. The syntax check is deliberately cheap: it rejects
+    addresses the API would reject anyway, without spending a request.
+
+    Args:
+        email: Email address
+
+    Returns:
+        Canonical email address
+
+    Raises:
+        ValidationError: If the address is malformed
+    """
+    local, separator, domain = email.strip().lower().rpartition('@')
+    if (
+        not separator
+        or len(local) > MAX_LOCAL_PART_LENGTH
+        or not _LOCAL_PART.fullmatch(local)
+    ):
+        raise ValidationError(f'Invalid email address: {email!r}')
+    try:
+        domain = normalize_domain(domain)
+    except ValidationError:
+        raise ValidationError(f'Invalid email address: {email!r}') from None
+
+    normalized = f'{local}@{domain}'
+    if len(normalized) > MAX_EMAIL_LENGTH:
+        raise ValidationError(f'Invalid email address: {email!r}')
+    return normalized
+
+
+def email_domain(email: str) -> str:
+    """Return the domain of a normalized email address.
+
+    Args:
+        email: Email address returned by normalize_email
+
+    Returns:
+        Domain of the address
+    """
+    return email.rpartition('@')[2]
@@ -1,9 +1,10 @@
 """Rate limiting implementation."""
 
+import asyncio
 import time
 from collections import deque
 from threading import Lock
-from typing import Deque
+from typing import Deque, Optional
 
 
 class RateLimiter:
@@ -25,20 +26,226 @@ class RateLimiter:
         """Acquire permission to make a request.
 
         This method blocks until a request can be made without
-        exceeding the rate limit.
+        exceeding the rate limit. The lock is released while sleeping,
+        so other threads can still claim slots as they free up.
         """
-        with self._lock:
-            now = time.time()
-            
-            # Remove expired timestamps
-            while self._requests and now - self._requests[0] > self._time_window:
-                self._requests.popleft()
-            
-            # If we've hit the limit, wait until we can make another request
-            if len(self._requests) >= self._max_requests:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+
+                # Remove expired timestamps
+                while self._requests and now - self._requests[0] >= self._time_window:
+                    self._requests.popleft()
+
+                if len(self._requests) < self._max_requests:
+                    self._requests.append(now)
+                    return
+
                 sleep_time = self._requests[0] + self._time_window - now
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+
+            time.sleep(sleep_time)
+
+
+class AsyncRateLimiter:
+    """Asyncio-aware sliding window rate limiter.
+
+    Waiting coroutines sleep outside the lock, so a full window never
+    blocks the event loop or other coroutines checking for a free slot.
+    """
+
+    def __init__(self, max_requests: int, time_window: float = 60.0) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            max_requests: Maximum number of requests allowed in time window
+            time_window: Time window in seconds
+        """
+        self._max_requests = max_requests
+        self._time_window = time_window
+        self._requests: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request.
+
+        This coroutine waits until a request can be made without
+        exceeding the rate limit.
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+
+                # Remove expired timestamps
+                while self._requests and now - self._requests[0] >= self._time_window:
                     self._requests.popleft()
-            
-            self._requests.append(now) 
\ No newline at end of file
+
+                if len(self._requests) < self._max_requests:
+                    self._requests.append(now)
+                    return
+
+                sleep_time = self._requests[0] + self._time_window - now
+
+            await asyncio.sleep(sleep_time)
+
+
+class _TokenBucket:
+    """Token bucket state shared by the sync and async limiters.
+
+    Not thread-safe on its own; callers serialize access with their lock.
+    """
+
+    def __init__(self, max_requests: int, time_window: float, burst: Optional[int]) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            max_requests: Number of tokens refilled per time window
+            time_window: Time window in seconds
+            burst: Bucket capacity, defaults to max_requests
+        """
+        self.capacity = float(burst if burst is not None else max_requests)
+        self.rate = max_requests / time_window
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def take(self, tokens: int) -> float:
+        """Take tokens if available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Zero if the tokens were taken, otherwise seconds until they will be
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity:g}")
+
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``max_requests / time_window`` per second
+    up to ``burst``, so idle capacity can be spent in bursts. Waiting threads
+    sleep outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: float = 60.0,
+        burst: Optional[int] = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            max_requests: Number of requests allowed per time window
+            time_window: Time window in seconds
+            burst: Bucket capacity, defaults to max_requests
+        """
+        self._bucket = _TokenBucket(max_requests, time_window, burst)
+        self._lock = Lock()
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Take tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            return self._bucket.take(tokens) == 0
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting for them to refill if necessary.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the tokens were taken, False if the timeout expired
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                wait = self._bucket.take(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            time.sleep(wait)
+
+
+class AsyncTokenBucketRateLimiter:
+    """Asyncio token bucket rate limiter.
+
+    Behaves like TokenBucketRateLimiter but waits with ``asyncio.sleep``.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: float = 60.0,
+        burst: Optional[int] = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            max_requests: Number of requests allowed per time window
+            time_window: Time window in seconds
+            burst: Bucket capacity, defaults to max_requests
+        """
+        self._bucket = _TokenBucket(max_requests, time_window, burst)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Take tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        return self._bucket.take(tokens) == 0
+
+    async def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting for them to refill if necessary.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the tokens were taken, False if the timeout expired
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._bucket.take(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            await asyncio.sleep(wait)
@@ -0,0 +1,119 @@
+"""Deduplicated background refreshes for stale cache entries."""
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Runs refreshes on a small thread pool, at most one per key at a time.
+
+    Failed refreshes are logged and dropped; the stale entry stays cached
+    until the next read schedules another attempt.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """Initialize refresher; threads are started on first use.
+
+        Args:
+            max_workers: Maximum number of refreshes running at once
+        """
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, 'Future[None]'] = {}
+        self._lock = Lock()
+
+    def submit(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Schedule fn unless a refresh of key is already pending.
+
+        Args:
+            key: Identifier of the entry to refresh
+            fn: Function refreshing the entry
+
+        Returns:
+            True if the refresh was scheduled
+        """
+        with self._lock:
+            if key in self._pending:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='hunter-refresh',
+                )
+            self._pending[key] = self._executor.submit(self._run, key, fn)
+            return True
+
+    def _run(self, key: str, fn: Callable[[], Any]) -> None:
+        """Run a refresh and release its key."""
+        try:
+            fn()
+        except Exception:
+            logger.warning('Background refresh of %r failed', key, exc_info=True)
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the refreshes scheduled so far.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        wait(pending, timeout=timeout)
+
+    def shutdown(self) -> None:
+        """Wait for pending refreshes and stop the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class AsyncBackgroundRefresher:
+    """Runs refreshes as event loop tasks, at most one per key at a time.
+
+    Failed refreshes are logged and dropped; the stale entry stays cached
+    until the next read schedules another attempt.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no refreshes pending."""
+        self._pending: Dict[str, 'asyncio.Task[None]'] = {}
+
+    def submit(self, key: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule fn on the running loop unless a refresh of key is pending.
+
+        Args:
+            key: Identifier of the entry to refresh
+            fn: Coroutine function refreshing the entry
+
+        Returns:
+            True if the refresh was scheduled
+        """
+        if key in self._pending:
+            return False
+        # Holding the task also keeps it from being garbage collected mid-run
+        self._pending[key] = asyncio.get_running_loop().create_task(self._run(key, fn))
+        return True
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> None:
+        """Await a refresh and release its key."""
+        try:
+            await fn()
+        except Exception:
+            logger.warning('Background refresh of %r failed', key, exc_info=True)
+        finally:
+            del self._pending[key]
+
+    async def join(self) -> None:
+        """Wait for the refreshes scheduled so far."""
+        pending: Set['asyncio.Task[None]'] = set(self._pending.values())
+        if pending:
+            await asyncio.wait(pending)
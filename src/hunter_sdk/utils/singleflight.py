@@ -0,0 +1,105 @@
+"""Request coalescing for concurrent cache misses."""
+
+import asyncio
+from concurrent.futures import Future
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class _LeaderCancelled(Exception):
+    """The call a follower was waiting on was cancelled by its own caller."""
+
+
+class SingleFlight(Generic[T]):
+    """Thread-safe request coalescer.
+
+    Concurrent calls for the same key share the outcome of the first call
+    instead of each running the function.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, 'Future[T]'] = {}
+        self._lock = Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identifier of the call to coalesce on
+            fn: Function producing the result
+
+        Returns:
+            The result of the call in flight for key
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Asyncio request coalescer.
+
+    Concurrent awaits for the same key share the outcome of the first call
+    instead of each running the coroutine. If the task running the call is
+    cancelled, a waiting task takes over and runs it again, so a
+    cancellation only reaches the task it was meant for.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, 'asyncio.Future[T]'] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identifier of the call to coalesce on
+            fn: Coroutine function producing the result
+
+        Returns:
+            The result of the call in flight for key
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue  # Take over the call, or join whoever already has
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as exc:
+            future.set_exception(_LeaderCancelled() if isinstance(exc, asyncio.CancelledError) else exc)
+            # Mark the exception retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
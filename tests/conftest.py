@@ -1,6 +1,10 @@
 """Test configuration and fixtures."""
 
-from typing import Any, Dict
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
 
 import pytest
 
@@ -38,10 +42,57 @@ def hunter_client(mocker, hunter_config, mock_email_verification_response) -> Hu
     client = HunterClient(hunter_config)
     mocker.patch.object(
         client._session,
-        'get',
+        'request',
         return_value=mocker.Mock(
             ok=True,
-            json=lambda: {'data': mock_email_verification_response},
+            status_code=200,
+            content=json.dumps({'data': mock_email_verification_response}).encode(),
         ),
     )
-    return client 
\ No newline at end of file
+    return client
+
+
+class LocalAPI:
+    """Email verifier served over HTTP/1.1 on localhost, recording request headers."""
+
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.headers: List[Dict[str, str]] = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802
+                api.headers.append(dict(self.headers))
+                time.sleep(api.delay)
+                body = json.dumps({'data': {'status': 'valid'}}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self._server.server_port}/v2'
+
+    def start(self) -> None:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def local_api() -> Iterator[LocalAPI]:
+    """Serve a minimal email verifier over HTTP on localhost."""
+    api = LocalAPI()
+    api.start()
+    yield api
+    api.stop()
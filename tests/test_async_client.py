@@ -0,0 +1,294 @@
+"""Tests for asyncio Hunter API client and services."""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Type
+
+import httpx
+import pytest
+
+from hunter_sdk import AsyncHunterClient, CircuitState, HunterConfig
+from hunter_sdk.exceptions import CircuitOpenError, ConfigurationError, HunterAPIError, HunterConnectionError
+from hunter_sdk.services import AsyncDomainSearchService, AsyncEmailVerificationService
+from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.utils.cache_keys import email_cache_key
+
+
+def make_client(handler: Callable[[httpx.Request], httpx.Response]) -> AsyncHunterClient:
+    """Create async client whose transport is served by handler."""
+    client = AsyncHunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, retry_delay=0))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_client_init_without_api_key() -> None:
+    """Test client initialization without API key raises error."""
+    with pytest.raises(ConfigurationError):
+        AsyncHunterClient(HunterConfig(api_key=''))
+
+
+def test_async_verify_email_success(mock_email_verification_response: Dict[str, Any]) -> None:
+    """Test successful async email verification."""
+    client = make_client(lambda request: httpx.Response(200, json={'data': mock_email_verification_response}))
+
+    result = asyncio.run(client.verify_email('test@example.com'))
+
+    assert result == mock_email_verification_response
+
+
+def test_async_retry_on_server_error() -> None:
+    """Test retry behavior on server errors."""
+    responses = [
+        httpx.Response(500),
+        httpx.Response(429),
+        httpx.Response(200, json={'data': {'status': 'valid'}}),
+    ]
+    client = make_client(lambda request: responses.pop(0))
+
+    result = asyncio.run(client._make_request('GET', 'test'))
+
+    assert result == {'status': 'valid'}
+    assert not responses
+
+
+def test_async_no_retry_on_client_error() -> None:
+    """Test that client errors are not retried."""
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(400, json={'errors': [{'details': 'Bad Request'}]})
+
+    client = make_client(handler)
+
+    with pytest.raises(HunterAPIError) as exc_info:
+        asyncio.run(client._make_request('GET', 'test'))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.message == 'Bad Request'
+    assert len(calls) == 1
+
+
+def test_async_verify_many_dedupes_and_caches(memory_storage: MemoryStorage) -> None:
+    """Test concurrent fan-out verifies each address once and caches results."""
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        email = request.url.params['email']
+        calls.append(email)
+        if email == 'bad@example.com':
+            return httpx.Response(400, json={'errors': [{'details': 'Invalid email'}]})
+        return httpx.Response(200, json={'data': {'email': email, 'status': 'valid'}})
+
+    service = AsyncEmailVerificationService(make_client(handler), memory_storage)
+    emails = ['a@example.com', 'b@example.com', 'a@example.com', 'bad@example.com']
+
+    async def collect() -> Dict[str, Any]:
+        return {email: result async for email, result in service.verify_many(emails, max_concurrency=2)}
+
+    results = asyncio.run(collect())
+
+    assert sorted(calls) == ['a@example.com', 'b@example.com', 'bad@example.com']
+    assert results['a@example.com'] == {'email': 'a@example.com', 'status': 'valid'}
+    assert isinstance(results['bad@example.com'], HunterAPIError)
+    assert memory_storage.read(email_cache_key('b@example.com')) == {'email': 'b@example.com', 'status': 'valid'}
+
+
+def test_async_verify_many_skips_undeliverable_domains(memory_storage: MemoryStorage) -> None:
+    """Test addresses at a domain without MX records cost one API call."""
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params['email'])
+        return httpx.Response(200, json={'data': {'status': 'invalid', 'mx_records': False}})
+
+    service = AsyncEmailVerificationService(make_client(handler), memory_storage, skip_undeliverable_domains=True)
+    emails = ['a@dead.com', 'b@dead.com', 'c@dead.com']
+
+    async def collect() -> Dict[str, Any]:
+        return {email: result async for email, result in service.verify_many(emails)}
+
+    results = asyncio.run(collect())
+
+    assert len(calls) == 1
+    assert all(results[email]['status'] == 'invalid' for email in emails)
+    assert service.domain_facts('dead.com') == {'mx_records': False}
+
+
+def test_async_iter_all_results(memory_storage: MemoryStorage) -> None:
+    """Test async iteration through paginated results."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params['offset'])
+        count = 2 if offset == 0 else 1
+        emails = [{'value': f'test{offset + i}@example.com'} for i in range(count)]
+        return httpx.Response(200, json={'data': {'domain': 'example.com', 'emails': emails}})
+
+    service = AsyncDomainSearchService(make_client(handler), memory_storage)
+
+    async def collect() -> List[Dict[str, Any]]:
+        return [page async for page in service.iter_all_results('example.com', batch_size=2)]
+
+    pages = asyncio.run(collect())
+
+    assert [len(page['emails']) for page in pages] == [2, 1]
+
+
+def test_async_iter_all_results_parallel(memory_storage: MemoryStorage) -> None:
+    """Test async pages are scheduled from meta.results and yielded in order."""
+    total = 9
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params['limit'])
+        offset = int(request.url.params['offset'])
+        emails = [{'value': f'test{offset + i}@example.com'} for i in range(min(limit, total - offset))]
+        return httpx.Response(200, json={
+            'data': {'domain': 'example.com', 'emails': emails},
+            'meta': {'results': total, 'limit': limit, 'offset': offset},
+        })
+
+    service = AsyncDomainSearchService(make_client(handler), memory_storage)
+
+    async def collect() -> List[str]:
+        return [entry['value'] async for entry in service.iter_emails('example.com', batch_size=2)]
+
+    assert asyncio.run(collect()) == [f'test{i}@example.com' for i in range(total)]
+
+
+def test_async_http_errors_raise_connection_error() -> None:
+    """Test httpx errors other than transport failures are wrapped like the sync client's."""
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.DecodingError('Malformed gzip body', request=request)
+
+    client = make_client(handler)
+    client._config.circuit_failure_threshold = 1
+
+    with pytest.raises(HunterConnectionError, match='Malformed gzip body'):
+        asyncio.run(client.verify_email('test@example.com'))
+
+    assert len(calls) == 1
+    assert client._circuit_breaker('email-verifier').state == CircuitState.OPEN
+
+
+@pytest.mark.parametrize('error', [httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError, httpx.ReadTimeout])
+def test_async_retry_on_transport_error(error: Type[httpx.TransportError]) -> None:
+    """Test the transport failures the sync client retries are retried."""
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise error('Network Error', request=request)
+        return httpx.Response(200, json={'data': {'status': 'valid'}})
+
+    client = make_client(handler)
+
+    assert asyncio.run(client._make_request('GET', 'test')) == {'status': 'valid'}
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('error', [httpx.UnsupportedProtocol, httpx.LocalProtocolError, httpx.ProxyError])
+def test_async_no_retry_on_configuration_error(error: Type[httpx.TransportError]) -> None:
+    """Test transport errors caused by the request or configuration fail immediately."""
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise error('Bad request', request=request)
+
+    client = make_client(handler)
+
+    with pytest.raises(HunterConnectionError, match='Bad request'):
+        asyncio.run(client._make_request('GET', 'test'))
+
+    assert len(calls) == 1
+
+
+def test_async_circuit_opens_and_fails_fast() -> None:
+    """Test an unhealthy endpoint is rejected without sending requests."""
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = make_client(handler)
+    client._config.circuit_failure_threshold = 2
+
+    async def run() -> None:
+        for _ in range(2):
+            with pytest.raises(HunterAPIError):
+                await client.verify_email('test@example.com')
+        with pytest.raises(CircuitOpenError):
+            await client.verify_email('test@example.com')
+
+    asyncio.run(run())
+
+    assert len(calls) == 2 * client._retry_policy.max_attempts
+
+
+def test_async_cancelled_trial_releases_circuit() -> None:
+    """Test a half-open trial cancelled by a timeout doesn't keep the circuit shut."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delays.pop(0))
+        return httpx.Response(200, json={'data': {'status': 'valid'}})
+
+    delays = [1.0, 0.0]
+    client = AsyncHunterClient(HunterConfig(
+        api_key='test-api-key',
+        rate_limit=None,
+        circuit_failure_threshold=1,
+        circuit_recovery_timeout=0.05,
+    ))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    breaker = client._circuit_breaker('email-verifier')
+    breaker.record_failure()
+
+    async def run() -> Dict[str, Any]:
+        await asyncio.sleep(0.06)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.verify_email('test@example.com'), timeout=0.05)
+        return await client.verify_email('test@example.com')
+
+    assert asyncio.run(run()) == {'status': 'valid'}
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_async_verify_email_serves_stale_result_while_refreshing(memory_storage: MemoryStorage) -> None:
+    """Test expired results within the grace period are served and refreshed once."""
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params['email'])
+        return httpx.Response(200, json={'data': {'status': 'new'}})
+
+    service = AsyncEmailVerificationService(make_client(handler), memory_storage, ttl=60, stale_ttl=300)
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'old'}, ttl=100)
+
+    async def run() -> List[Dict[str, Any]]:
+        results = [await service.verify_email('test@example.com') for _ in range(2)]
+        await service._refresher.join()
+        return results
+
+    assert asyncio.run(run()) == [{'status': 'old'}, {'status': 'old'}]
+    assert calls == ['test@example.com']
+    assert memory_storage.read(email_cache_key('test@example.com')) == {'status': 'new'}
+
+
+def test_async_service_aclose_waits_for_refreshes(memory_storage: MemoryStorage) -> None:
+    """Test leaving an async service's context waits for its background refreshes."""
+    service = AsyncEmailVerificationService(
+        make_client(lambda request: httpx.Response(200, json={'data': {'status': 'new'}})),
+        memory_storage,
+        ttl=60,
+        stale_ttl=300,
+    )
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'old'}, ttl=100)
+
+    async def run() -> Any:
+        async with service:
+            return await service.verify_email('test@example.com')
+
+    assert asyncio.run(run()) == {'status': 'old'}
+    assert memory_storage.read(email_cache_key('test@example.com')) == {'status': 'new'}
@@ -0,0 +1,172 @@
+"""Tests for bulk verification and the command-line interface."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from hunter_sdk import HunterClient
+from hunter_sdk.cli import main
+from hunter_sdk.exceptions import HunterAPIError, HunterConnectionError
+from hunter_sdk.services import BulkVerificationJob, EmailVerificationService
+from hunter_sdk.services.bulk_verification import iter_input
+from hunter_sdk.storage import MemoryStorage, SQLiteStorage
+from hunter_sdk.utils.cache_keys import email_cache_key
+
+
+def fake_verify(email: str) -> Dict[str, Any]:
+    """Return a verification result, rejecting addresses at bad.example."""
+    if email.endswith('@bad.example'):
+        raise HunterAPIError(400, 'Invalid email')
+    return {'email': email, 'status': 'valid', 'score': 90}
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Read all records of a JSONL file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_iter_input_formats() -> None:
+    """Test addresses are read from CSV, JSONL and plain text."""
+    csv_input = io.StringIO('name,Email\nA,a@example.com\nB,b@example.com\n')
+    headerless = io.StringIO('a@example.com,x\nb@example.com,y\n')
+    jsonl_input = io.StringIO('{"email": "a@example.com"}\n\n"b@example.com"\nnot json\n')
+
+    assert list(iter_input(csv_input, 'csv')) == ['a@example.com', 'b@example.com']
+    assert list(iter_input(headerless, 'csv')) == ['a@example.com', 'b@example.com']
+    assert list(iter_input(jsonl_input, 'jsonl')) == ['a@example.com', 'b@example.com', '']
+
+
+def test_bulk_verification_job(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    tmp_path: Path,
+    mocker,
+) -> None:
+    """Test rows are normalized, deduplicated, verified once and written."""
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=fake_verify)
+    memory_storage.create(email_cache_key('cached@example.com'), {'email': 'cached@example.com', 'status': 'cached'})
+    input_path = tmp_path / 'emails.csv'
+    input_path.write_text('email\nA@example.com\n a@example.com\ncached@example.com\nx@bad.example\nnope\n')
+    output_path = tmp_path / 'results.jsonl'
+
+    job = BulkVerificationJob(EmailVerificationService(hunter_client, memory_storage), batch_size=2)
+    stats = job.run(str(input_path), str(output_path))
+
+    records = {record['email']: record for record in read_jsonl(output_path)}
+    assert records['a@example.com']['result']['status'] == 'valid'
+    assert records['cached@example.com']['result']['status'] == 'cached'
+    assert records['x@bad.example']['error'] == '400: Invalid email'
+    assert records['nope']['error'] == 'Invalid email address'
+    assert (stats.rows, stats.verified, stats.errors, stats.invalid, stats.duplicates) == (5, 2, 1, 1, 1)
+    assert mock_verify.call_count == 2
+
+
+def test_bulk_verification_resumes_after_outage(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    tmp_path: Path,
+    mocker,
+) -> None:
+    """Test an interrupted job resumes from its checkpoint without duplicate output."""
+    emails = [f'user{i}@example.com' for i in range(10)]
+    input_path = tmp_path / 'emails.txt'
+    input_path.write_text('\n'.join(emails))
+    output_path = tmp_path / 'results.csv'
+    checkpoint_path = str(tmp_path / 'results.csv.checkpoint')
+
+    def flaky_verify(email: str) -> Dict[str, Any]:
+        if email == 'user7@example.com':
+            raise HunterConnectionError('down')
+        return fake_verify(email)
+
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=flaky_verify)
+    job = BulkVerificationJob(EmailVerificationService(hunter_client, memory_storage), batch_size=3, max_workers=1)
+    with pytest.raises(HunterConnectionError):
+        job.run(str(input_path), str(output_path), checkpoint_path=checkpoint_path)
+
+    assert json.loads(Path(checkpoint_path).read_text())['stats']['rows'] == 6
+
+    mock_verify.side_effect = fake_verify
+    mock_verify.reset_mock()
+    stats = job.run(str(input_path), str(output_path), checkpoint_path=checkpoint_path)
+
+    lines = output_path.read_text().splitlines()
+    assert lines[0] == 'email,status,result,score,error'
+    assert sorted(line.split(',')[0] for line in lines[1:]) == sorted(emails)
+    assert stats.rows == 10
+    assert stats.verified == 10
+    # Only the unfinished batches are retried; earlier results come from the cache
+    resumed = {call.args[0] for call in mock_verify.call_args_list}
+    assert {'user7@example.com', 'user9@example.com'} <= resumed <= set(emails[6:])
+    assert not Path(checkpoint_path).exists()
+
+
+def test_bulk_verification_resume_keeps_dedupe_window(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    tmp_path: Path,
+    mocker,
+) -> None:
+    """Test repeats of addresses finished before an interruption are still skipped after resuming."""
+    input_path = tmp_path / 'emails.txt'
+    input_path.write_text('a@example.com\nb@example.com\nc@example.com\na@example.com\n')
+    output_path = tmp_path / 'results.jsonl'
+    checkpoint_path = str(tmp_path / 'results.jsonl.checkpoint')
+
+    def flaky_verify(email: str) -> Dict[str, Any]:
+        if email == 'c@example.com':
+            raise HunterConnectionError('down')
+        return fake_verify(email)
+
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=flaky_verify)
+    job = BulkVerificationJob(EmailVerificationService(hunter_client, memory_storage), batch_size=2, max_workers=1)
+    with pytest.raises(HunterConnectionError):
+        job.run(str(input_path), str(output_path), checkpoint_path=checkpoint_path)
+
+    mock_verify.side_effect = fake_verify
+    stats = job.run(str(input_path), str(output_path), checkpoint_path=checkpoint_path)
+
+    emails = [record['email'] for record in read_jsonl(output_path)]
+    assert emails == ['a@example.com', 'b@example.com', 'c@example.com']
+    assert stats.duplicates == 1
+
+
+def test_cli_verify(tmp_path: Path, mocker, capsys) -> None:
+    """Test the verify command writes results and a summary."""
+    mocker.patch.object(HunterClient, 'verify_email', side_effect=fake_verify)
+    input_path = tmp_path / 'emails.jsonl'
+    input_path.write_text('{"email": "a@example.com"}\n{"email": "b@example.com"}\n')
+    output_path = tmp_path / 'results.jsonl'
+
+    exit_code = main(['verify', str(input_path), '-o', str(output_path), '--api-key', 'key'])
+
+    assert exit_code == 0
+    assert [record['email'] for record in read_jsonl(output_path)] == ['a@example.com', 'b@example.com']
+    assert json.loads(capsys.readouterr().err)['verified'] == 2
+
+
+def test_cli_verify_closes_client_and_cache(tmp_path: Path, mocker) -> None:
+    """Test the verify command closes the HTTP client and the SQLite cache."""
+    mocker.patch.object(HunterClient, 'verify_email', side_effect=fake_verify)
+    close_client = mocker.spy(HunterClient, 'close')
+    close_storage = mocker.spy(SQLiteStorage, 'close')
+    input_path = tmp_path / 'emails.txt'
+    input_path.write_text('a@example.com\n')
+    output_path = tmp_path / 'results.jsonl'
+    cache_path = tmp_path / 'cache.db'
+
+    main(['verify', str(input_path), '-o', str(output_path), '--cache', str(cache_path), '--api-key', 'key'])
+
+    close_client.assert_called_once()
+    close_storage.assert_called_once()
+
+
+def test_cli_requires_api_key(monkeypatch) -> None:
+    """Test the verify command refuses to run without an API key."""
+    monkeypatch.delenv('HUNTER_API_KEY', raising=False)
+
+    with pytest.raises(SystemExit):
+        main(['verify', '-'])
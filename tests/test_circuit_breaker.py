@@ -0,0 +1,104 @@
+"""Tests for the circuit breaker."""
+
+import time
+
+from hunter_sdk.circuit_breaker import CircuitBreaker, CircuitState, is_outage
+from hunter_sdk.exceptions import HunterAPIError, HunterConnectionError
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Test the circuit opens once the failure threshold is reached."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+    assert 0 < breaker.retry_after() <= 60
+
+
+def test_success_resets_failure_count() -> None:
+    """Test failures must be consecutive to open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_allows_limited_trial_requests() -> None:
+    """Test only half_open_max_calls trial requests pass after recovery."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_half_open_closes_on_success() -> None:
+    """Test a successful trial request closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_reopens_on_failure() -> None:
+    """Test a failed trial request re-opens the circuit."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_released_trial_slot_can_be_reused() -> None:
+    """Test a cancelled trial hands its slot back without changing the state."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    breaker.release()
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_unanswered_trial_reopens_circuit() -> None:
+    """Test trials that never report back re-open the circuit after trial_timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05, trial_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.state is CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+
+
+def test_is_outage() -> None:
+    """Test only connection failures and server errors count as outages."""
+    assert is_outage(HunterConnectionError('down'))
+    assert is_outage(HunterAPIError(503, 'unavailable'))
+    assert not is_outage(HunterAPIError(400, 'bad request'))
+    assert not is_outage(ValueError('bad json'))
@@ -1,12 +1,17 @@
 """Tests for Hunter API client."""
 
+import json
+import time
 from typing import Any, Dict
 
 import pytest
 import requests
 
 from hunter_sdk import HunterClient, HunterConfig
-from hunter_sdk.exceptions import ConfigurationError, HunterAPIError
+from hunter_sdk.circuit_breaker import CircuitState
+from hunter_sdk.exceptions import CircuitOpenError, ConfigurationError, HunterAPIError, HunterConnectionError
+from hunter_sdk.retry import RetryPolicy
+from hunter_sdk.utils.rate_limiter import RateLimiter
 
 
 def test_client_init_without_api_key() -> None:
@@ -30,41 +35,44 @@ def test_verify_email_api_error(hunter_client: HunterClient, mocker) -> None:
     error_response = {'errors': [{'details': 'API Error'}]}
     mocker.patch.object(
         hunter_client._session,
-        'get',
+        'request',
         return_value=mocker.Mock(
             ok=False,
             status_code=400,
-            json=lambda: error_response,
+            content=json.dumps(error_response).encode(),
         ),
     )
 
     with pytest.raises(HunterAPIError) as exc_info:
         hunter_client.verify_email('test@example.com')
-    
+
     assert exc_info.value.status_code == 400
     assert exc_info.value.message == 'API Error'
 
 
 def test_verify_email_network_error(hunter_client: HunterClient, mocker) -> None:
-    """Test handling of network errors in email verification."""
-    mocker.patch.object(
+    """Test network errors are retried and then raised as a typed error."""
+    hunter_client._retry_policy = RetryPolicy(base_delay=0)
+    mock_request = mocker.patch.object(
         hunter_client._session,
-        'get',
-        side_effect=requests.RequestException('Network Error'),
+        'request',
+        side_effect=requests.ConnectionError('Network Error'),
     )
 
-    with pytest.raises(requests.RequestException):
-        hunter_client.verify_email('test@example.com') 
+    with pytest.raises(HunterConnectionError):
+        hunter_client.verify_email('test@example.com')
+    assert mock_request.call_count == 3
 
 
 def test_rate_limiting(hunter_client: HunterClient, mocker) -> None:
     """Test rate limiting in client requests."""
+    hunter_client._rate_limiter = RateLimiter(2, time_window=1.0)
     start_time = time.time()
-    
+
     # Make multiple requests
     for _ in range(3):
         hunter_client.verify_email('test@example.com')
-    
+
     duration = time.time() - start_time
     # With rate limit of 2 per second, this should take at least 1 second
     assert duration >= 1.0
@@ -77,18 +85,18 @@ def test_retry_on_server_error(hunter_client: HunterClient, mocker) -> None:
         mocker.Mock(ok=False, status_code=500),
         mocker.Mock(
             ok=True,
-            json=lambda: {'data': {'status': 'valid'}},
+            content=json.dumps({'data': {'status': 'valid'}}).encode(),
         ),
     ]
-    
+
     mock_request = mocker.patch.object(
         hunter_client._session,
         'request',
         side_effect=responses,
     )
-    
+
     result = hunter_client._make_request('GET', 'test')
-    
+
     assert result == {'status': 'valid'}
     assert mock_request.call_count == 3
 
@@ -98,18 +106,18 @@ def test_no_retry_on_client_error(hunter_client: HunterClient, mocker) -> None:
     mock_response = mocker.Mock(
         ok=False,
         status_code=400,
-        json=lambda: {'errors': [{'details': 'Bad Request'}]},
+        content=json.dumps({'errors': [{'details': 'Bad Request'}]}).encode(),
     )
-    
+
     mocker.patch.object(
         hunter_client._session,
         'request',
         return_value=mock_response,
     )
-    
+
     with pytest.raises(HunterAPIError) as exc_info:
         hunter_client._make_request('GET', 'test')
-    
+
     assert exc_info.value.status_code == 400
     assert exc_info.value.message == 'Bad Request'
 
@@ -120,17 +128,120 @@ def test_retry_on_rate_limit(hunter_client: HunterClient, mocker) -> None:
         mocker.Mock(ok=False, status_code=429),
         mocker.Mock(
             ok=True,
-            json=lambda: {'data': {'status': 'valid'}},
+            content=json.dumps({'data': {'status': 'valid'}}).encode(),
         ),
     ]
-    
+
     mock_request = mocker.patch.object(
         hunter_client._session,
         'request',
         side_effect=responses,
     )
-    
+
     result = hunter_client._make_request('GET', 'test')
-    
+
     assert result == {'status': 'valid'}
-    assert mock_request.call_count == 2 
\ No newline at end of file
+    assert mock_request.call_count == 2
+
+
+def test_domain_search_includes_meta(hunter_client: HunterClient, mocker) -> None:
+    """Test domain search keeps the pagination meta from the response."""
+    mocker.patch.object(
+        hunter_client._session,
+        'request',
+        return_value=mocker.Mock(
+            ok=True,
+            content=json.dumps({'data': {'domain': 'example.com', 'emails': []}, 'meta': {'results': 0}}).encode(),
+        ),
+    )
+
+    result = hunter_client.domain_search('example.com')
+
+    assert result == {'domain': 'example.com', 'emails': [], 'meta': {'results': 0}}
+
+
+def test_retry_honors_retry_after(hunter_client: HunterClient, mocker) -> None:
+    """Test the client waits as long as Retry-After asks."""
+    responses = [
+        mocker.Mock(ok=False, status_code=429, headers={'Retry-After': '0.2'}),
+        mocker.Mock(ok=True, content=json.dumps({'data': {'status': 'valid'}}).encode()),
+    ]
+    mocker.patch.object(hunter_client._session, 'request', side_effect=responses)
+    mock_sleep = mocker.patch('hunter_sdk.client.time.sleep')
+
+    assert hunter_client._make_request('GET', 'test') == {'status': 'valid'}
+    mock_sleep.assert_called_once_with(0.2)
+
+
+def test_retry_gives_up_when_backoff_overshoots_deadline(hunter_client: HunterClient, mocker) -> None:
+    """Test the client gives up instead of sending a zero timeout once the deadline has passed."""
+    hunter_client._retry_policy = RetryPolicy(base_delay=0.01, max_delay=0.01, total_timeout=0.1)
+    mock_request = mocker.patch.object(
+        hunter_client._session,
+        'request',
+        return_value=mocker.Mock(ok=False, status_code=503, headers={}),
+    )
+    real_sleep = time.sleep
+    mocker.patch('hunter_sdk.client.time.sleep', side_effect=lambda delay: real_sleep(0.15))
+
+    with pytest.raises(HunterAPIError) as exc_info:
+        hunter_client._make_request('GET', 'test')
+
+    assert exc_info.value.status_code == 503
+    assert 'Total timeout (0.1s) exceeded' in str(exc_info.value)
+    assert mock_request.call_count == 1
+
+
+def test_no_retry_on_unretryable_server_error(hunter_client: HunterClient, mocker) -> None:
+    """Test server errors outside the retryable set fail immediately."""
+    mock_request = mocker.patch.object(
+        hunter_client._session,
+        'request',
+        return_value=mocker.Mock(ok=False, status_code=501, content=b'{}'),
+    )
+
+    with pytest.raises(HunterAPIError) as exc_info:
+        hunter_client._make_request('GET', 'test')
+
+    assert exc_info.value.status_code == 501
+    assert mock_request.call_count == 1
+
+
+def test_circuit_opens_and_fails_fast(hunter_config: HunterConfig, mocker) -> None:
+    """Test an unhealthy endpoint is rejected without sending requests."""
+    hunter_config.circuit_failure_threshold = 2
+    client = HunterClient(hunter_config)
+    client._retry_policy = RetryPolicy(max_attempts=1)
+    mock_request = mocker.patch.object(
+        client._session,
+        'request',
+        side_effect=requests.ConnectionError('Network Error'),
+    )
+
+    for _ in range(2):
+        with pytest.raises(HunterConnectionError):
+            client.verify_email('test@example.com')
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.verify_email('test@example.com')
+
+    assert exc_info.value.endpoint == 'email-verifier'
+    assert mock_request.call_count == 2
+    assert client.circuit_state('email-verifier') is CircuitState.OPEN
+    assert client.circuit_state('domain-search') is CircuitState.CLOSED
+
+
+def test_circuit_ignores_client_errors(hunter_config: HunterConfig, mocker) -> None:
+    """Test client errors do not open the circuit."""
+    hunter_config.circuit_failure_threshold = 1
+    client = HunterClient(hunter_config)
+    mocker.patch.object(
+        client._session,
+        'request',
+        return_value=mocker.Mock(ok=False, status_code=400, content=b'{}'),
+    )
+
+    for _ in range(3):
+        with pytest.raises(HunterAPIError):
+            client.verify_email('test@example.com')
+
+    assert client.circuit_state('email-verifier') is CircuitState.CLOSED
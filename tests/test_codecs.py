@@ -0,0 +1,94 @@
+"""Tests for record serialization."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from hunter_sdk.models import DomainSearchResult
+from hunter_sdk.storage import SQLiteStorage
+from hunter_sdk.storage.codecs import (
+    JSONCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    Serializer,
+    ZlibCompressor,
+    ZstdCompressor,
+)
+from hunter_sdk.utils.frozen import freeze
+
+RECORD = {
+    'domain': 'example.com',
+    'emails': [
+        {'value': f'user{i}@example.com', 'type': 'personal', 'confidence': 90, 'sources': []}
+        for i in range(50)
+    ],
+    'pattern': '{first}@example.com',
+}
+
+
+@pytest.mark.parametrize('codec_class', [JSONCodec, OrjsonCodec, MsgpackCodec])
+def test_codec_round_trip(codec_class) -> None:
+    """Test codecs round-trip plain, frozen and model records."""
+    pytest.importorskip({OrjsonCodec: 'orjson', MsgpackCodec: 'msgpack'}.get(codec_class, 'json'))
+    codec = codec_class()
+
+    for value in (RECORD, freeze(RECORD), DomainSearchResult(RECORD)):
+        assert codec.loads(codec.dumps(value)) == RECORD
+
+
+@pytest.mark.parametrize('compressor_class', [ZlibCompressor, ZstdCompressor])
+def test_serializer_compresses_large_records(compressor_class) -> None:
+    """Test records above the threshold are compressed and decoded."""
+    if compressor_class is ZstdCompressor:
+        pytest.importorskip('zstandard')
+    serializer = Serializer(JSONCodec(), compressor_class(), compress_threshold=256)
+
+    small = serializer.dumps({'status': 'valid'})
+    large = serializer.dumps(RECORD)
+
+    assert small[2] == 0
+    assert large[2] == compressor_class.format_id
+    assert len(large) < len(JSONCodec().dumps(RECORD)) / 4
+    assert serializer.loads(small) == {'status': 'valid'}
+    assert serializer.loads(large) == RECORD
+
+
+def test_serializer_reads_other_configurations() -> None:
+    """Test the header lets any serializer read records written by another."""
+    pytest.importorskip('msgpack')
+    writer = Serializer(MsgpackCodec(), ZlibCompressor(), compress_threshold=0)
+
+    assert Serializer().loads(writer.dumps(RECORD)) == RECORD
+
+
+def test_serializer_reads_plain_json() -> None:
+    """Test records written before the header existed still load."""
+    serializer = Serializer()
+
+    assert serializer.loads(json.dumps(RECORD)) == RECORD
+    assert serializer.loads(json.dumps(RECORD).encode()) == RECORD
+
+
+def test_serializer_rejects_unknown_formats() -> None:
+    """Test unknown versions and codecs raise ValueError."""
+    serializer = Serializer()
+
+    with pytest.raises(ValueError):
+        serializer.loads(b'\x09\x01\x00{}')
+    with pytest.raises(ValueError):
+        serializer.loads(b'\x01\x7f\x00{}')
+
+
+def test_sqlite_storage_reads_legacy_rows(tmp_path: Path) -> None:
+    """Test SQLite storage reads rows stored as JSON text."""
+    path = str(tmp_path / 'cache.db')
+    storage = SQLiteStorage(path, serializer=Serializer(JSONCodec(), ZlibCompressor()))
+    with sqlite3.connect(path) as connection:
+        connection.execute('INSERT INTO cache VALUES (?, ?, NULL)', ('legacy', json.dumps(RECORD)))
+
+    storage.upsert('new', RECORD)
+
+    assert storage.read_many(['legacy', 'new']) == {'legacy': RECORD, 'new': RECORD}
+    storage.close()
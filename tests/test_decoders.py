@@ -0,0 +1,104 @@
+"""Tests for response decoders."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from hunter_sdk import AsyncHunterClient, HunterClient, HunterConfig
+from hunter_sdk.decoders import JSONDecoder, OrjsonDecoder, ResponseDecoder, default_decoder
+from hunter_sdk.exceptions import HunterAPIError
+
+
+class CountingDecoder(JSONDecoder):
+    """JSON decoder counting the bodies it parses."""
+
+    def __init__(self) -> None:
+        self.bodies: List[bytes] = []
+
+    def loads(self, body: bytes) -> Any:
+        self.bodies.append(body)
+        return super().loads(body)
+
+
+def make_client(decoder: ResponseDecoder) -> HunterClient:
+    """Create a client using decoder."""
+    return HunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, decoder=decoder))
+
+
+def mock_response(mocker, status_code: int, body: Dict[str, Any]) -> Any:
+    """Build a response whose json() must not be used."""
+    return mocker.Mock(
+        ok=status_code < 400,
+        status_code=status_code,
+        content=json.dumps(body).encode(),
+        json=mocker.Mock(side_effect=AssertionError('decoded with response.json()')),
+    )
+
+
+@pytest.mark.parametrize('decoder', [JSONDecoder(), OrjsonDecoder()])
+def test_decoders_parse_bytes(decoder: ResponseDecoder) -> None:
+    """Test decoders parse raw UTF-8 bodies and reject malformed ones."""
+    assert decoder.decode('{"data": {"name": "Zoë"}}'.encode(), 'email-verifier') == {'data': {'name': 'Zoë'}}
+    with pytest.raises(ValueError):
+        decoder.loads(b'{"data": ')
+
+
+def test_default_decoder_prefers_orjson() -> None:
+    """Test orjson is used when installed."""
+    assert isinstance(default_decoder(), OrjsonDecoder)
+
+
+def test_body_is_parsed_once(mocker) -> None:
+    """Test successful and error bodies are parsed exactly once."""
+    decoder = CountingDecoder()
+    client = make_client(decoder)
+    mocker.patch.object(client._session, 'request', side_effect=[
+        mock_response(mocker, 200, {'data': {'domain': 'example.com', 'emails': []}, 'meta': {'results': 0}}),
+        mock_response(mocker, 400, {'errors': [{'details': 'Invalid domain'}]}),
+    ])
+
+    result = client.domain_search('example.com')
+    with pytest.raises(HunterAPIError, match='Invalid domain'):
+        client.domain_search('example')
+
+    assert result == {'domain': 'example.com', 'emails': [], 'meta': {'results': 0}}
+    assert len(decoder.bodies) == 2
+
+
+def test_typed_decoding(mocker) -> None:
+    """Test msgspec decodes listed endpoints into structs and others into dicts."""
+    msgspec = pytest.importorskip('msgspec')
+    from hunter_sdk.decoders import MsgspecDecoder
+
+    class Verification(msgspec.Struct):
+        status: str
+        score: int
+
+    client = make_client(MsgspecDecoder({'email-verifier': Verification}))
+    mocker.patch.object(client._session, 'request', side_effect=[
+        mock_response(mocker, 200, {'data': {'status': 'valid', 'score': 97, 'sources': []}, 'meta': {}}),
+        mock_response(mocker, 200, {'data': {'emails': []}, 'meta': {'results': 0}}),
+        mock_response(mocker, 200, {'data': {'status': 'valid', 'score': 'high'}}),
+    ])
+
+    assert client.verify_email('test@example.com') == Verification(status='valid', score=97)
+    assert client.domain_search('example.com') == {'emails': [], 'meta': {'results': 0}}
+    with pytest.raises(ValueError, match='score'):
+        client.verify_email('test@example.com')
+
+
+def test_async_client_uses_decoder() -> None:
+    """Test the async client parses bodies once through its decoder."""
+    decoder = CountingDecoder()
+    client = AsyncHunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, decoder=decoder))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={'data': {'emails': []}, 'meta': {'results': 0}}),
+    ))
+
+    result = asyncio.run(client.domain_search('example.com'))
+
+    assert result == {'emails': [], 'meta': {'results': 0}}
+    assert len(decoder.bodies) == 1
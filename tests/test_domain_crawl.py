@@ -0,0 +1,124 @@
+"""Tests for resumable domain crawls."""
+
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from hunter_sdk import HunterClient
+from hunter_sdk.exceptions import HunterAPIError, HunterConnectionError
+from hunter_sdk.services import DomainCrawlJob, DomainSearchService
+from hunter_sdk.services.domain_crawl import CRAWL_DONE, CRAWL_FAILED
+from hunter_sdk.storage import MemoryStorage, SQLiteStorage
+
+TOTALS = {'big.com': 10, 'small.com': 2, 'mid.com': 5}
+
+
+class FakeSearch:
+    """Domain search returning TOTALS[domain] results, two per page."""
+
+    def __init__(self, fail_at: Optional[tuple] = None) -> None:
+        self.calls: List[tuple] = []
+        self.fail_at = fail_at
+        self._lock = Lock()
+
+    def __call__(self, domain: str, type: Optional[str], limit: int, offset: int) -> Dict[str, Any]:
+        with self._lock:
+            self.calls.append((domain, offset))
+        if (domain, offset) == self.fail_at:
+            raise HunterConnectionError('down')
+        if domain == 'bad.com':
+            raise HunterAPIError(400, 'Invalid domain')
+        count = max(0, min(limit, TOTALS[domain] - offset))
+        emails = [{'value': f'user{offset + i}@{domain}'} for i in range(count)]
+        return {'domain': domain, 'emails': emails, 'meta': {'results': TOTALS[domain]}}
+
+
+@pytest.fixture
+def fake_search(hunter_client: HunterClient, mocker) -> FakeSearch:
+    """Route domain searches of the client to a FakeSearch."""
+    search = FakeSearch()
+    mocker.patch.object(
+        hunter_client,
+        'domain_search',
+        side_effect=lambda domain, type=None, limit=None, offset=None: search(domain, type, limit, offset),
+    )
+    return search
+
+
+def emails_of(job: DomainCrawlJob, domain: str) -> List[str]:
+    """Collect the crawled addresses of a domain."""
+    return [entry['value'] for page in job.pages(domain) for entry in page['emails']]
+
+
+def test_crawl_all_domains(hunter_client: HunterClient, fake_search: FakeSearch) -> None:
+    """Test every page of every domain is crawled and stored in order."""
+    service = DomainSearchService(hunter_client, MemoryStorage())
+    job = DomainCrawlJob(service, MemoryStorage(), batch_size=2, max_workers=2)
+
+    cursors = job.run(['big.com', 'small.com', 'mid.com', 'bad.com'])
+
+    assert {domain: cursor.status for domain, cursor in cursors.items()} == {
+        'big.com': CRAWL_DONE,
+        'small.com': CRAWL_DONE,
+        'mid.com': CRAWL_DONE,
+        'bad.com': CRAWL_FAILED,
+    }
+    assert cursors['bad.com'].error == '400: Invalid domain'
+    assert emails_of(job, 'big.com') == [f'user{i}@big.com' for i in range(10)]
+    assert cursors['mid.com'].pages == 3
+
+
+def test_crawl_is_fair(hunter_client: HunterClient, fake_search: FakeSearch) -> None:
+    """Test small domains finish without waiting for big ones."""
+    service = DomainSearchService(hunter_client, MemoryStorage())
+    job = DomainCrawlJob(service, MemoryStorage(), batch_size=2, max_workers=1)
+
+    job.run(['big.com', 'small.com'])
+
+    assert fake_search.calls[:3] == [('big.com', 0), ('small.com', 0), ('big.com', 2)]
+
+
+def test_crawl_resumes_after_outage(hunter_client: HunterClient, fake_search: FakeSearch, tmp_path: Path) -> None:
+    """Test a crawl stopped by an outage resumes at the first unfinished page."""
+    path = str(tmp_path / 'crawl.db')
+    fake_search.fail_at = ('big.com', 6)
+    service = DomainSearchService(hunter_client, MemoryStorage())
+
+    with pytest.raises(HunterConnectionError):
+        DomainCrawlJob(service, SQLiteStorage(path), batch_size=2, max_workers=1).run(['big.com', 'small.com'])
+
+    fake_search.fail_at = None
+    fake_search.calls.clear()
+    job = DomainCrawlJob(DomainSearchService(hunter_client, MemoryStorage()), SQLiteStorage(path), batch_size=2)
+    cursors = job.run(['big.com', 'small.com'])
+
+    assert fake_search.calls == [('big.com', 6), ('big.com', 8)]
+    assert cursors['big.com'].status == CRAWL_DONE
+    assert emails_of(job, 'big.com') == [f'user{i}@big.com' for i in range(10)]
+
+
+def test_crawl_reset(hunter_client: HunterClient, fake_search: FakeSearch) -> None:
+    """Test a reset domain is crawled again."""
+    state = MemoryStorage()
+    job = DomainCrawlJob(DomainSearchService(hunter_client, MemoryStorage()), state, batch_size=2)
+    job.run(['small.com'])
+
+    job.reset('small.com')
+
+    assert job.cursor('small.com').pages == 0
+    assert list(job.pages('small.com')) == []
+    assert job.run(['small.com'])['small.com'].status == CRAWL_DONE
+
+
+def test_crawl_normalizes_domains(hunter_client: HunterClient, fake_search: FakeSearch) -> None:
+    """Test spellings of one domain are crawled once and malformed ones never."""
+    job = DomainCrawlJob(DomainSearchService(hunter_client, MemoryStorage()), MemoryStorage(), batch_size=2)
+
+    cursors = job.run(['Small.com', 'small.com.', 'not a domain'])
+
+    assert cursors['small.com'].status == CRAWL_DONE
+    assert cursors['not a domain'].status == CRAWL_FAILED
+    assert fake_search.calls == [('small.com', 0)]
+    assert emails_of(job, 'SMALL.COM') == ['user0@small.com', 'user1@small.com']
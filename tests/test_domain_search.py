@@ -1,12 +1,14 @@
 """Tests for domain search service."""
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 import pytest
 
 from hunter_sdk import HunterClient
+from hunter_sdk.exceptions import CircuitOpenError
 from hunter_sdk.services import DomainSearchService
 from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.utils.cache_keys import domain_search_cache_key
 
 
 @pytest.fixture
@@ -56,10 +58,10 @@ def test_search_domain_cached(
     memory_storage: MemoryStorage,
 ) -> None:
     """Test subsequent domain search calls use cache."""
-    memory_storage.create('domain:example.com', mock_domain_search_response)
-    
+    memory_storage.create(domain_search_cache_key('example.com'), mock_domain_search_response)
+
     result = domain_search_service.search_domain('example.com')
-    
+
     assert result == mock_domain_search_response
     hunter_client.domain_search.assert_not_called()
 
@@ -72,10 +74,10 @@ def test_search_domain_force_refresh(
 ) -> None:
     """Test force refresh bypasses cache."""
     old_data = {'domain': 'example.com', 'emails': []}
-    memory_storage.create('domain:example.com', old_data)
-    
+    memory_storage.create(domain_search_cache_key('example.com'), old_data)
+
     result = domain_search_service.search_domain('example.com', force_refresh=True)
-    
+
     assert result == mock_domain_search_response
     hunter_client.domain_search.assert_called_once()
 
@@ -97,21 +99,108 @@ def test_iter_all_results(
             'domain': 'example.com',
         },
     ]
-    
+
     mock_search = mocker.patch.object(
         hunter_client,
         'domain_search',
         side_effect=responses,
     )
-    
+
     results = list(domain_search_service.iter_all_results('example.com', batch_size=2))
-    
+
     assert len(results) == 2
     assert results == responses
     assert mock_search.call_count == 2
-    
+
     # Verify pagination parameters
     mock_search.assert_has_calls([
         mocker.call(domain='example.com', type=None, limit=2, offset=0),
         mocker.call(domain='example.com', type=None, limit=2, offset=2),
-    ]) 
\ No newline at end of file
+    ])
+
+
+def paginated_search(total: int) -> Callable[..., Dict[str, Any]]:
+    """Create a domain_search stand-in serving total emails with meta."""
+    def search(domain: str, type: Optional[str] = None, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        count = max(0, min(limit, total - offset))
+        return {
+            'domain': domain,
+            'emails': [{'value': f'test{offset + i}@example.com'} for i in range(count)],
+            'meta': {'results': total, 'limit': limit, 'offset': offset},
+        }
+    return search
+
+
+def test_iter_all_results_parallel_in_order(
+    domain_search_service: DomainSearchService,
+    hunter_client: HunterClient,
+    mocker,
+) -> None:
+    """Test pages are scheduled from meta.results and yielded in order."""
+    mock_search = mocker.patch.object(hunter_client, 'domain_search', side_effect=paginated_search(9))
+
+    pages = list(domain_search_service.iter_all_results('example.com', batch_size=2, max_workers=3))
+
+    assert [page['meta']['offset'] for page in pages] == [0, 2, 4, 6, 8]
+    assert mock_search.call_count == 5
+
+
+def test_iter_all_results_caches_pages(
+    domain_search_service: DomainSearchService,
+    hunter_client: HunterClient,
+    mocker,
+) -> None:
+    """Test a repeated crawl is served from the page cache."""
+    mock_search = mocker.patch.object(hunter_client, 'domain_search', side_effect=paginated_search(5))
+
+    first = list(domain_search_service.iter_all_results('example.com', batch_size=2))
+    second = list(domain_search_service.iter_all_results('example.com', batch_size=2))
+
+    assert first == second
+    assert mock_search.call_count == 3
+
+
+def test_iter_emails(
+    domain_search_service: DomainSearchService,
+    hunter_client: HunterClient,
+    mocker,
+) -> None:
+    """Test email entries are streamed across pages."""
+    mocker.patch.object(hunter_client, 'domain_search', side_effect=paginated_search(5))
+
+    emails = [entry['value'] for entry in domain_search_service.iter_emails('example.com', batch_size=2)]
+
+    assert emails == [f'test{i}@example.com' for i in range(5)]
+
+
+def test_search_domain_serves_stale_result_while_refreshing(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mock_domain_search_response: Dict[str, Any],
+    mocker,
+) -> None:
+    """Test an expired search within the grace period is served and refreshed."""
+    mock_search = mocker.patch.object(hunter_client, 'domain_search', return_value=mock_domain_search_response)
+    service = DomainSearchService(hunter_client, memory_storage, ttl=60, stale_ttl=300)
+    memory_storage.create(domain_search_cache_key('example.com'), {'domain': 'example.com', 'emails': []}, ttl=100)
+
+    assert service.search_domain('example.com') == {'domain': 'example.com', 'emails': []}
+    service._refresher.join()
+
+    mock_search.assert_called_once_with(domain='example.com', type=None)
+    assert memory_storage.read(domain_search_cache_key('example.com')) == mock_domain_search_response
+
+
+def test_search_domain_serves_expired_result_while_circuit_open(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test an expired search kept for stale_if_error_ttl is served while the circuit is open."""
+    mocker.patch.object(hunter_client, 'domain_search', side_effect=CircuitOpenError('domain-search', 10.0))
+    service = DomainSearchService(hunter_client, memory_storage, ttl=60, stale_if_error_ttl=3600)
+    memory_storage.create(domain_search_cache_key('example.com'), {'domain': 'example.com', 'emails': []}, ttl=1000)
+
+    assert service.search_domain('example.com') == {'domain': 'example.com', 'emails': []}
+    with pytest.raises(CircuitOpenError):
+        service.search_domain('other.com')
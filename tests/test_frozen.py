@@ -0,0 +1,47 @@
+"""Tests for read-only result containers."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from hunter_sdk.utils.frozen import FrozenDict, FrozenList, freeze
+
+
+def test_freeze_nested_value() -> None:
+    """Test freezing converts nested containers and keeps equality."""
+    value = {'email': 'test@example.com', 'sources': [{'domain': 'example.com'}]}
+
+    frozen = freeze(value)
+
+    assert frozen == value
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen['sources'], FrozenList)
+    assert isinstance(frozen['sources'][0], FrozenDict)
+    assert freeze(frozen) is frozen
+
+
+def test_frozen_containers_reject_mutation() -> None:
+    """Test mutating methods raise TypeError."""
+    frozen = freeze({'sources': [1]})
+
+    with pytest.raises(TypeError):
+        frozen['new'] = 1
+    with pytest.raises(TypeError):
+        frozen.update({'new': 1})
+    with pytest.raises(TypeError):
+        frozen['sources'].append(2)
+
+    mutable = frozen.copy()
+    mutable['new'] = 1
+    assert 'new' not in frozen
+
+
+def test_frozen_containers_serialize() -> None:
+    """Test frozen values round trip through json, pickle and copy."""
+    frozen = freeze({'sources': [{'domain': 'example.com'}]})
+
+    assert json.loads(json.dumps(frozen)) == frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert copy.deepcopy(frozen) is frozen
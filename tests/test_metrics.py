@@ -0,0 +1,124 @@
+"""Tests for metrics sinks and instrumentation."""
+
+import asyncio
+import json
+import math
+
+import httpx
+import requests
+
+from hunter_sdk import AsyncHunterClient, HunterClient, HunterConfig
+from hunter_sdk.metrics import (
+    CACHE_LOOKUPS,
+    RATE_LIMIT_WAIT,
+    REQUEST_DURATION,
+    RETRIES,
+    RETRY_BACKOFF,
+    InMemoryMetrics,
+    NoOpMetrics,
+    PrometheusMetrics,
+)
+from hunter_sdk.services import EmailVerificationService
+from hunter_sdk.storage import LRUStorage, MemoryStorage
+
+
+def test_in_memory_histogram_buckets() -> None:
+    """Test observations land in cumulative buckets."""
+    metrics = InMemoryMetrics(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.5, 0.7, 3.0):
+        metrics.observe_request('email-verifier', '200', duration)
+
+    snapshot = metrics.histogram(REQUEST_DURATION, endpoint='email-verifier', status='200')
+
+    assert snapshot.buckets == ((0.1, 1), (1.0, 3), (math.inf, 4))
+    assert snapshot.count == 4
+    assert snapshot.sum == 4.25
+    assert metrics.histogram(REQUEST_DURATION, endpoint='email-verifier', status='500') is None
+
+
+def test_client_records_attempts_retries_and_rate_limit_wait(mocker) -> None:
+    """Test every attempt, retry and rate limiter wait is recorded per endpoint."""
+    metrics = InMemoryMetrics()
+    client = HunterClient(HunterConfig(api_key='test-api-key', retry_delay=0, metrics=metrics))
+    mocker.patch.object(client._session, 'request', side_effect=[
+        requests.ConnectionError('reset'),
+        mocker.Mock(ok=False, status_code=503, headers={}),
+        mocker.Mock(ok=True, status_code=200, content=json.dumps({'data': {'status': 'valid'}}).encode()),
+    ])
+
+    client.verify_email('test@example.com')
+
+    for status in ('error', '503', '200'):
+        assert metrics.histogram(REQUEST_DURATION, endpoint='email-verifier', status=status).count == 1
+    assert metrics.counter(RETRIES, endpoint='email-verifier') == 2
+    assert metrics.counter(RETRY_BACKOFF, endpoint='email-verifier') >= 0
+    assert metrics.histogram(RATE_LIMIT_WAIT, endpoint='email-verifier').count == 1
+
+
+def test_async_client_records_attempts() -> None:
+    """Test the async client reports to the same interface."""
+    metrics = InMemoryMetrics()
+    client = AsyncHunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, metrics=metrics))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(400, json={'errors': [{'details': 'Invalid email'}]}),
+    ))
+
+    async def verify() -> None:
+        try:
+            await client.verify_email('test@example.com')
+        except Exception:
+            pass
+
+    asyncio.run(verify())
+
+    assert metrics.histogram(REQUEST_DURATION, endpoint='email-verifier', status='400').count == 1
+    assert metrics.counter(RETRIES, endpoint='email-verifier') == 0
+
+
+def test_services_record_cache_hits(mocker) -> None:
+    """Test service cache lookups are counted as hits and misses."""
+    metrics = InMemoryMetrics()
+    client = HunterClient(HunterConfig(api_key='test-api-key', metrics=metrics))
+    mocker.patch.object(client, 'verify_email', side_effect=lambda email: {'email': email})
+    service = EmailVerificationService(client, MemoryStorage())
+
+    service.verify_email('a@example.com')
+    service.verify_email('a@example.com')
+    list(service.verify_many(['a@example.com', 'b@example.com']))
+
+    assert metrics.counter(CACHE_LOOKUPS, cache='email', result='hit') == 2
+    assert metrics.counter(CACHE_LOOKUPS, cache='email', result='miss') == 2
+    assert metrics.cache_hit_ratio('email') == 0.5
+    assert metrics.cache_hit_ratio('domain') is None
+
+
+def test_prometheus_render() -> None:
+    """Test metrics and tracked storage stats render in exposition format."""
+    metrics = PrometheusMetrics(buckets=(0.5,))
+    metrics.observe_request('domain-search', '200', 0.25)
+    metrics.observe_retry('domain-search', 1.5)
+    storage = LRUStorage(max_entries=1)
+    storage.create('a', {'data': 1})
+    storage.create('b', {'data': 2})
+    storage.read('b')
+    metrics.track_storage('l1"cache', storage)
+
+    text = metrics.render()
+
+    assert '# TYPE hunter_request_duration_seconds histogram' in text
+    assert 'hunter_request_duration_seconds_bucket{endpoint="domain-search",status="200",le="0.5"} 1' in text
+    assert 'hunter_request_duration_seconds_bucket{endpoint="domain-search",status="200",le="+Inf"} 1' in text
+    assert 'hunter_request_duration_seconds_sum{endpoint="domain-search",status="200"} 0.25' in text
+    assert 'hunter_retries_total{endpoint="domain-search"} 1' in text
+    assert 'hunter_retry_backoff_seconds_total{endpoint="domain-search"} 1.5' in text
+    assert 'hunter_storage_evictions_total{storage="l1\\"cache"} 1' in text
+    assert 'hunter_storage_hits_total{storage="l1\\"cache"} 1' in text
+    assert 'hunter_storage_entries{storage="l1\\"cache"} 1' in text
+    assert 'hunter_cache_lookups_total' not in text
+
+
+def test_noop_metrics_is_default() -> None:
+    """Test clients without metrics use the disabled no-op sink."""
+    client = HunterClient(HunterConfig(api_key='test-api-key'))
+    assert isinstance(client.metrics, NoOpMetrics)
+    assert not client.metrics.enabled
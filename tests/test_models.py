@@ -0,0 +1,101 @@
+"""Tests for typed response models."""
+
+import json
+import pickle
+import sys
+from typing import Any, Dict
+
+import pytest
+
+from hunter_sdk.models import DomainSearchResult, EmailEntry, Source, VerificationResult
+
+
+@pytest.fixture
+def verification_data() -> Dict[str, Any]:
+    """Create full email verifier response data."""
+    return {
+        'status': 'valid',
+        'result': 'deliverable',
+        'score': 95,
+        'email': 'test@example.com',
+        'regexp': True,
+        'gibberish': False,
+        'disposable': False,
+        'webmail': False,
+        'mx_records': True,
+        'smtp_server': True,
+        'smtp_check': True,
+        'accept_all': False,
+        'block': False,
+        'sources': [{'domain': 'example.com', 'uri': 'http://example.com/team', 'still_on_page': True}],
+    }
+
+
+def test_verification_result_dict_compatibility(verification_data: Dict[str, Any]) -> None:
+    """Test models compare equal to and behave like the response dict."""
+    result = VerificationResult(verification_data)
+
+    assert result == verification_data
+    assert result['status'] == 'valid'
+    assert result.get('missing') is None
+    assert dict(result) == verification_data
+    assert json.loads(json.dumps(result, default=dict)) == verification_data
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_verification_result_typed_access(verification_data: Dict[str, Any]) -> None:
+    """Test typed attributes and lazily parsed sources."""
+    result = VerificationResult(verification_data)
+
+    assert result.score == 95
+    assert result.sources == (Source(verification_data['sources'][0]),)
+    assert result.sources[0].still_on_page is True
+    assert result.sources[0].last_seen_on is None
+
+
+def test_missing_and_unknown_fields() -> None:
+    """Test missing fields read as None and unknown fields are preserved."""
+    result = VerificationResult({'status': 'valid', 'new_field': 1})
+
+    assert result.score is None
+    assert 'score' not in result
+    assert result['new_field'] == 1
+    assert len(result) == 2
+    with pytest.raises(KeyError):
+        result['score']
+
+
+def test_models_are_read_only(verification_data: Dict[str, Any]) -> None:
+    """Test models reject attribute assignment and nested mutation."""
+    result = VerificationResult(verification_data)
+
+    with pytest.raises(TypeError):
+        result.score = 10
+    with pytest.raises(TypeError):
+        result['sources'].append({})
+
+
+def test_models_are_compact(verification_data: Dict[str, Any]) -> None:
+    """Test slotted models are smaller than the response dict."""
+    assert sys.getsizeof(VerificationResult(verification_data)) < sys.getsizeof(verification_data)
+
+
+def test_domain_search_result_emails() -> None:
+    """Test domain search emails are parsed into entries on access."""
+    result = DomainSearchResult({
+        'domain': 'example.com',
+        'emails': [{'value': 'test@example.com', 'type': 'personal', 'sources': []}],
+    })
+
+    assert result.emails == (EmailEntry({'value': 'test@example.com', 'type': 'personal', 'sources': []}),)
+    assert result.emails[0].value == 'test@example.com'
+    assert result.emails[0].sources == ()
+
+
+def test_nested_models_are_parsed_once() -> None:
+    """Test the typed view of a nested list is built on first access and reused."""
+    result = DomainSearchResult({'emails': [{'value': 'test@example.com'}]})
+
+    assert result.emails is result.emails
+    assert result['emails'] == [{'value': 'test@example.com'}]
+    assert pickle.loads(pickle.dumps(result)).emails == result.emails
@@ -0,0 +1,102 @@
+"""Tests for normalization and cache keys."""
+
+import pytest
+
+from hunter_sdk import HunterClient
+from hunter_sdk.exceptions import ValidationError
+from hunter_sdk.services import DomainSearchService, EmailVerificationService
+from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.utils.cache_keys import CACHE_KEY_VERSION, domain_search_cache_key, email_cache_key
+from hunter_sdk.utils.normalize import normalize_domain, normalize_email
+
+
+def test_normalize_domain() -> None:
+    """Test domains are trimmed, lowercased, undotted and punycoded."""
+    assert normalize_domain(' Example.COM. ') == 'example.com'
+    assert normalize_domain('Bücher.de') == 'xn--bcher-kva.de'
+    assert normalize_domain('xn--bcher-kva.de') == 'xn--bcher-kva.de'
+
+
+@pytest.mark.parametrize('domain', ['', 'localhost', 'exa mple.com', '-example.com', 'example..com', '1.2.3.4'])
+def test_normalize_domain_invalid(domain: str) -> None:
+    """Test malformed domains are rejected."""
+    with pytest.raises(ValidationError):
+        normalize_domain(domain)
+
+
+def test_normalize_email() -> None:
+    """Test addresses are trimmed and lowercased with a normalized domain."""
+    assert normalize_email(' John.Doe@Example.COM. ') == 'john.doe@example.com'
+    assert normalize_email('jane+tag@bücher.de') == 'jane+tag@xn--bcher-kva.de'
+
+
+@pytest.mark.parametrize('email', [
+    'no-at-sign',
+    '@example.com',
+    'john@',
+    'john@localhost',
+    'john doe@example.com',
+    '.john@example.com',
+    'john..doe@example.com',
+    'a' * 65 + '@example.com',
+    'john@' + 'a' * 250 + '.com',
+])
+def test_normalize_email_invalid(email: str) -> None:
+    """Test malformed addresses are rejected."""
+    with pytest.raises(ValidationError):
+        normalize_email(email)
+
+
+def test_validation_error_is_value_error() -> None:
+    """Test ValidationError can be handled as a ValueError."""
+    with pytest.raises(ValueError):
+        normalize_email('invalid')
+
+
+def test_cache_keys_are_namespaced_and_versioned() -> None:
+    """Test keys of different services cannot collide."""
+    assert email_cache_key('john@example.com') == f'hunter:v{CACHE_KEY_VERSION}:email:john@example.com'
+    assert domain_search_cache_key('example.com') == f'hunter:v{CACHE_KEY_VERSION}:domain:example.com'
+    assert domain_search_cache_key('example.com', 'personal', limit=10, offset=20) == (
+        f'hunter:v{CACHE_KEY_VERSION}:domain:example.com:type:personal:limit:10:offset:20'
+    )
+
+
+def test_verify_email_normalizes_before_caching(hunter_client: HunterClient, mocker) -> None:
+    """Test spellings of one address share an API call and a cache entry."""
+    verify = mocker.patch.object(hunter_client, 'verify_email', return_value={'status': 'valid'})
+    storage = MemoryStorage()
+    service = EmailVerificationService(hunter_client, storage)
+
+    service.verify_email('John@Example.com')
+    service.verify_email(' john@example.COM. ')
+
+    verify.assert_called_once_with('john@example.com')
+    assert storage.read(email_cache_key('john@example.com')) == {'status': 'valid'}
+    assert service.get_cached_result('JOHN@example.com') == {'status': 'valid'}
+
+
+def test_verify_email_rejects_malformed_address(hunter_client: HunterClient, mocker) -> None:
+    """Test malformed addresses never reach the client."""
+    verify = mocker.patch.object(hunter_client, 'verify_email')
+    service = EmailVerificationService(hunter_client, MemoryStorage())
+
+    with pytest.raises(ValidationError):
+        service.verify_email('not an email')
+
+    results = dict(service.verify_many(['bad', 'ok@example.com'], max_workers=1))
+    assert isinstance(results['bad'], ValidationError)
+    verify.assert_called_once_with('ok@example.com')
+
+
+def test_search_domain_normalizes_before_caching(hunter_client: HunterClient, mocker) -> None:
+    """Test spellings of one domain share an API call and a cache entry."""
+    search = mocker.patch.object(hunter_client, 'domain_search', return_value={'emails': []})
+    storage = MemoryStorage()
+    service = DomainSearchService(hunter_client, storage)
+
+    service.search_domain('Bücher.DE.')
+    service.search_domain('xn--bcher-kva.de')
+
+    search.assert_called_once_with(domain='xn--bcher-kva.de', type=None)
+    assert storage.read(domain_search_cache_key('xn--bcher-kva.de')) == {'emails': []}
@@ -1,26 +1,32 @@
 """Tests for rate limiter implementation."""
 
+import asyncio
 import time
 from threading import Thread
 from typing import List
 
 import pytest
 
-from hunter_sdk.utils.rate_limiter import RateLimiter
+from hunter_sdk.utils.rate_limiter import (
+    AsyncRateLimiter,
+    AsyncTokenBucketRateLimiter,
+    RateLimiter,
+    TokenBucketRateLimiter,
+)
 
 
 def test_rate_limiter_basic() -> None:
     """Test basic rate limiting functionality."""
     limiter = RateLimiter(max_requests=2, time_window=1.0)
-    
+
     start_time = time.time()
-    
+
     # First two requests should be immediate
     limiter.acquire()
     limiter.acquire()
     first_duration = time.time() - start_time
     assert first_duration < 0.1  # Should be near-instant
-    
+
     # Third request should wait
     limiter.acquire()
     total_duration = time.time() - start_time
@@ -31,39 +37,108 @@ def test_rate_limiter_threaded() -> None:
     """Test rate limiter in multi-threaded environment."""
     limiter = RateLimiter(max_requests=3, time_window=1.0)
     results: List[float] = []
-    
+
     def worker() -> None:
         start = time.time()
         limiter.acquire()
         results.append(time.time() - start)
-    
+
     threads = [Thread(target=worker) for _ in range(5)]
-    start_time = time.time()
-    
+
     for thread in threads:
         thread.start()
-    
+
     for thread in threads:
         thread.join()
-    
+
     # First 3 requests should be quick
     assert len([t for t in results if t < 0.1]) == 3
-    # Last 2 should wait
-    assert len([t for t in results if t >= 1.0]) == 2
+    # Last 2 should wait for the window opened by the first requests, which
+    # started slightly before these threads did
+    assert len([t for t in results if t >= 0.9]) == 2
 
 
 def test_rate_limiter_window_reset() -> None:
     """Test that rate limit resets after time window."""
     limiter = RateLimiter(max_requests=1, time_window=0.5)
-    
+
     # First request
     limiter.acquire()
-    
+
     # Wait for window to reset
     time.sleep(0.6)
-    
+
     # Second request should be immediate
     start_time = time.time()
     limiter.acquire()
     duration = time.time() - start_time
-    assert duration < 0.1 
\ No newline at end of file
+    assert duration < 0.1
+
+
+def test_async_rate_limiter() -> None:
+    """Test async rate limiter waits for a free slot without blocking the loop."""
+    limiter = AsyncRateLimiter(max_requests=2, time_window=0.5)
+
+    async def run() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.5
+
+
+def test_token_bucket_burst_and_refill() -> None:
+    """Test token bucket allows a burst and then refills at the configured rate."""
+    limiter = TokenBucketRateLimiter(max_requests=10, time_window=1.0, burst=3)
+
+    assert all(limiter.try_acquire() for _ in range(3))
+    assert not limiter.try_acquire()
+
+    start = time.monotonic()
+    assert limiter.acquire(2)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_token_bucket_timeout() -> None:
+    """Test acquire gives up when tokens cannot refill before the timeout."""
+    limiter = TokenBucketRateLimiter(max_requests=1, time_window=10.0)
+    limiter.acquire()
+
+    start = time.monotonic()
+    assert not limiter.acquire(timeout=0.1)
+    assert time.monotonic() - start < 0.1
+
+
+def test_token_bucket_rejects_oversized_request() -> None:
+    """Test requesting more tokens than the bucket holds raises error."""
+    limiter = TokenBucketRateLimiter(max_requests=2, time_window=1.0)
+    with pytest.raises(ValueError):
+        limiter.acquire(3)
+
+
+def test_token_bucket_threaded_throughput() -> None:
+    """Test many threads share the bucket at the configured rate."""
+    limiter = TokenBucketRateLimiter(max_requests=20, time_window=1.0, burst=5)
+    threads = [Thread(target=limiter.acquire) for _ in range(15)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.monotonic() - start
+
+    # 5 burst tokens, then 10 more at 20/s
+    assert 0.45 <= duration < 1.0
+
+
+def test_async_token_bucket() -> None:
+    """Test async token bucket waits for refill."""
+    limiter = AsyncTokenBucketRateLimiter(max_requests=10, time_window=1.0, burst=2)
+
+    async def run() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.15
@@ -0,0 +1,98 @@
+"""Tests for Redis storage, run against an in-process fake server."""
+
+import time
+from typing import Iterator
+
+import pytest
+
+from hunter_sdk.models import VerificationResult
+from hunter_sdk.storage import RedisStorage, TieredStorage
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+@pytest.fixture
+def server() -> 'fakeredis.FakeServer':
+    """Create a fake Redis server shared by all clients of a test."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_storage(server: 'fakeredis.FakeServer') -> Iterator[RedisStorage]:
+    """Create Redis storage connected to the fake server."""
+    storage = RedisStorage(client=fakeredis.FakeRedis(server=server))
+    yield storage
+    storage.close()
+
+
+def test_redis_storage_crud(redis_storage: RedisStorage) -> None:
+    """Test create, read, update and delete."""
+    redis_storage.create('key', {'data': 1})
+    assert redis_storage.read('key') == {'data': 1}
+
+    redis_storage.update('key', {'data': 2})
+    assert redis_storage.read('key') == {'data': 2}
+
+    redis_storage.delete('key')
+    assert redis_storage.read('key') is None
+
+
+def test_redis_storage_key_errors(redis_storage: RedisStorage) -> None:
+    """Test duplicate creates and missing keys raise KeyError."""
+    redis_storage.create('key', {'data': 1})
+    with pytest.raises(KeyError):
+        redis_storage.create('key', {'data': 2})
+    with pytest.raises(KeyError):
+        redis_storage.update('missing', {'data': 1})
+    with pytest.raises(KeyError):
+        redis_storage.delete('missing')
+
+
+def test_redis_storage_ttl(redis_storage: RedisStorage) -> None:
+    """Test records expire natively and report their remaining lifetime."""
+    redis_storage.create('short', {'data': 1}, ttl=0.05)
+    redis_storage.upsert('long', {'data': 2}, ttl=60)
+    redis_storage.upsert('forever', {'data': 3})
+
+    value, remaining = redis_storage.read_with_ttl('long')
+    assert value == {'data': 2}
+    assert 59 < remaining <= 60
+    assert redis_storage.read_with_ttl('forever') == ({'data': 3}, None)
+
+    time.sleep(0.1)
+    assert redis_storage.read('short') is None
+    assert redis_storage.read_with_ttl('short') is None
+    redis_storage.create('short', {'data': 4})
+
+
+def test_redis_storage_batch_operations(redis_storage: RedisStorage, mocker) -> None:
+    """Test batch operations are pipelined into one round trip each."""
+    items = {f'key{i}': {'data': i} for i in range(1200)}
+    execute = mocker.spy(type(redis_storage._client.pipeline()), 'execute')
+
+    redis_storage.write_many(items, ttl=60)
+    found = redis_storage.read_many([*items, 'missing'])
+    deleted = redis_storage.delete_many(['key0', 'key1', 'missing'])
+
+    assert found == items
+    assert deleted == 2
+    assert execute.call_count == 3
+    assert redis_storage.read_many(['key0', 'key2']) == {'key2': {'data': 2}}
+
+
+def test_redis_storage_prefix(server: 'fakeredis.FakeServer') -> None:
+    """Test keys are namespaced by prefix."""
+    client = fakeredis.FakeRedis(server=server)
+    RedisStorage(client=client, prefix='test:').upsert('key', {'data': 1})
+
+    assert client.keys('*') == [b'test:key']
+
+
+def test_redis_storage_shared_between_nodes(server: 'fakeredis.FakeServer') -> None:
+    """Test a record written by one node is a hit on another."""
+    node_a = TieredStorage(RedisStorage(client=fakeredis.FakeRedis(server=server)))
+    node_b = TieredStorage(RedisStorage(client=fakeredis.FakeRedis(server=server)))
+
+    node_a.upsert('test@example.com', VerificationResult({'status': 'valid'}), ttl=60)
+
+    assert node_b.read('test@example.com') == {'status': 'valid'}
@@ -0,0 +1,62 @@
+"""Tests for background refreshers."""
+
+import asyncio
+from threading import Event
+from typing import List
+
+from hunter_sdk.utils.refresh import AsyncBackgroundRefresher, BackgroundRefresher
+
+
+def test_background_refresher_dedupes_pending_keys() -> None:
+    """Test a key is refreshed only once while its refresh is pending."""
+    refresher = BackgroundRefresher()
+    release = Event()
+    calls: List[str] = []
+
+    def refresh() -> None:
+        calls.append('key')
+        release.wait(5)
+
+    assert refresher.submit('key', refresh)
+    assert not refresher.submit('key', refresh)
+    release.set()
+    refresher.join()
+
+    assert calls == ['key']
+    assert refresher.submit('key', lambda: None)
+    refresher.shutdown()
+
+
+def test_background_refresher_swallows_errors() -> None:
+    """Test a failed refresh releases its key."""
+    refresher = BackgroundRefresher()
+
+    def fail() -> None:
+        raise RuntimeError('boom')
+
+    refresher.submit('key', fail)
+    refresher.join()
+
+    assert refresher.submit('key', lambda: None)
+    refresher.shutdown()
+
+
+def test_async_background_refresher_dedupes_pending_keys() -> None:
+    """Test a key is refreshed only once while its refresh is pending."""
+    calls: List[str] = []
+
+    async def refresh() -> None:
+        calls.append('key')
+        await asyncio.sleep(0.01)
+
+    async def run() -> None:
+        refresher = AsyncBackgroundRefresher()
+        assert refresher.submit('key', refresh)
+        assert not refresher.submit('key', refresh)
+        await refresher.join()
+        assert refresher.submit('key', refresh)
+        await refresher.join()
+
+    asyncio.run(run())
+
+    assert calls == ['key', 'key']
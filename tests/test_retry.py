@@ -0,0 +1,86 @@
+"""Tests for retry policies."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from hunter_sdk.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After parsing for seconds, HTTP dates and garbage."""
+    assert parse_retry_after({'Retry-After': '3'}) == 3.0
+    assert parse_retry_after({'RateLimit-Reset': '1.5'}) == 1.5
+    assert 8 < parse_retry_after({'Retry-After': formatdate(time.time() + 10, usegmt=True)}) <= 10
+    assert parse_retry_after({'Retry-After': 'soon'}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_decorrelated_jitter_bounds() -> None:
+    """Test delays stay between the base and maximum delay."""
+    policy = RetryPolicy(max_attempts=50, base_delay=0.1, max_delay=2.0)
+    retry = policy.start()
+
+    delays = [retry.next_delay() for _ in range(49)]
+
+    assert all(0.1 <= delay <= 2.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert retry.next_delay() is None
+    assert retry.exhausted_reason == 'Max retries (50) exceeded'
+
+
+def test_retry_after_overrides_backoff() -> None:
+    """Test server-requested delays are honored when enabled."""
+    assert RetryPolicy().start().next_delay({'Retry-After': '7'}) == 7.0
+    assert RetryPolicy(respect_retry_after=False, max_delay=1.0).start().next_delay({'Retry-After': '7'}) <= 1.0
+
+
+def test_retry_after_beyond_max_delay_gives_up() -> None:
+    """Test a server asking for a longer wait than max_delay ends the retries."""
+    retry = RetryPolicy(max_delay=30.0).start()
+
+    assert retry.next_delay({'Retry-After': '3600'}) is None
+    assert retry.exhausted_reason == 'Retry-After (3600s) exceeds max delay (30s)'
+
+
+def test_total_timeout() -> None:
+    """Test retries stop when the backoff would pass the deadline."""
+    retry = RetryPolicy(base_delay=1.0, total_timeout=0.5).start()
+
+    assert retry.timeout(30) <= 0.5
+    assert retry.next_delay() is None
+    assert retry.exhausted_reason == 'Total timeout (0.5s) exceeded'
+
+
+def test_deadline_passed_after_backoff_overshoots() -> None:
+    """Test a deadline that ran out while backing off is reported, not turned into a zero timeout."""
+    retry = RetryPolicy(total_timeout=0.05).start()
+    assert not retry.deadline_passed()
+
+    time.sleep(0.06)
+
+    assert retry.deadline_passed()
+    assert retry.exhausted_reason == 'Total timeout (0.05s) exceeded'
+    assert not RetryPolicy().start().deadline_passed()
+
+
+def test_retry_budget_caps_retries() -> None:
+    """Test the budget only allows retries while tokens remain."""
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    policy = RetryPolicy(max_attempts=10, base_delay=0, budget=budget)
+
+    retry = policy.start()
+    assert retry.next_delay() is not None
+    assert retry.next_delay() is None
+    assert retry.exhausted_reason == 'Retry budget exhausted'
+
+    policy.start()
+    policy.start()
+    assert budget.withdraw()
+
+
+@pytest.mark.parametrize('status_code,retryable', [(429, True), (503, True), (400, False), (501, False)])
+def test_retryable_statuses(status_code: int, retryable: bool) -> None:
+    """Test the default retryable status codes."""
+    assert RetryPolicy().is_retryable_status(status_code) is retryable
@@ -1,12 +1,18 @@
 """Tests for service layer implementations."""
 
-from typing import Any, Dict
+import threading
+import time
+from threading import Thread
+from typing import Any, Dict, List
 
 import pytest
 
 from hunter_sdk import HunterClient
+from hunter_sdk.exceptions import CircuitOpenError
+from hunter_sdk.models import VerificationResult
 from hunter_sdk.services import EmailVerificationService
-from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.storage import BaseStorage, MemoryStorage
+from hunter_sdk.utils.cache_keys import email_cache_key
 
 
 def test_verify_email_first_call(
@@ -17,9 +23,9 @@ def test_verify_email_first_call(
     """Test first email verification call uses API."""
     service = EmailVerificationService(hunter_client, memory_storage)
     result = service.verify_email('test@example.com')
-    
+
     assert result == mock_email_verification_response
-    assert memory_storage.read('test@example.com') == mock_email_verification_response
+    assert memory_storage.read(email_cache_key('test@example.com')) == mock_email_verification_response
 
 
 def test_verify_email_cached(
@@ -30,13 +36,13 @@ def test_verify_email_cached(
 ) -> None:
     """Test subsequent email verification calls use cache."""
     service = EmailVerificationService(hunter_client, memory_storage)
-    memory_storage.create('test@example.com', mock_email_verification_response)
-    
+    memory_storage.create(email_cache_key('test@example.com'), mock_email_verification_response)
+
     # Mock the client to ensure it's not called
     mock_verify = mocker.patch.object(hunter_client, 'verify_email')
-    
+
     result = service.verify_email('test@example.com')
-    
+
     assert result == mock_email_verification_response
     mock_verify.assert_not_called()
 
@@ -48,12 +54,12 @@ def test_verify_email_force_refresh(
 ) -> None:
     """Test force refresh bypasses cache."""
     service = EmailVerificationService(hunter_client, memory_storage)
-    memory_storage.create('test@example.com', {'old': 'data'})
-    
+    memory_storage.create(email_cache_key('test@example.com'), {'old': 'data'})
+
     result = service.verify_email('test@example.com', force_refresh=True)
-    
+
     assert result == mock_email_verification_response
-    assert memory_storage.read('test@example.com') == mock_email_verification_response
+    assert memory_storage.read(email_cache_key('test@example.com')) == mock_email_verification_response
 
 
 def test_clear_cache(
@@ -62,11 +68,11 @@ def test_clear_cache(
 ) -> None:
     """Test clearing cache for specific email."""
     service = EmailVerificationService(hunter_client, memory_storage)
-    memory_storage.create('test@example.com', {'data': 'test'})
-    
+    memory_storage.create(email_cache_key('test@example.com'), {'data': 'test'})
+
     service.clear_cache('test@example.com')
-    
-    assert memory_storage.read('test@example.com') is None
+
+    assert memory_storage.read(email_cache_key('test@example.com')) is None
 
 
 def test_clear_cache_nonexistent(
@@ -75,4 +81,267 @@ def test_clear_cache_nonexistent(
 ) -> None:
     """Test clearing cache for nonexistent email doesn't raise error."""
     service = EmailVerificationService(hunter_client, memory_storage)
-    service.clear_cache('nonexistent@example.com')  # Should not raise 
\ No newline at end of file
+    service.clear_cache('nonexistent@example.com')  # Should not raise
+
+
+def test_verify_many(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test bulk verification dedupes input and only verifies cache misses."""
+    service = EmailVerificationService(hunter_client, memory_storage)
+    memory_storage.create(email_cache_key('cached@example.com'), {'status': 'valid'})
+    error = ValueError('boom')
+
+    def verify(email: str) -> Dict[str, Any]:
+        if email == 'bad@example.com':
+            raise error
+        return {'email': email}
+
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=verify)
+
+    results = dict(service.verify_many(
+        ['new@example.com', 'cached@example.com', 'new@example.com', 'bad@example.com'],
+        max_workers=2,
+    ))
+
+    assert results == {
+        'cached@example.com': {'status': 'valid'},
+        'new@example.com': {'email': 'new@example.com'},
+        'bad@example.com': error,
+    }
+    assert sorted(call.args[0] for call in mock_verify.call_args_list) == ['bad@example.com', 'new@example.com']
+    assert memory_storage.read(email_cache_key('new@example.com')) == {'email': 'new@example.com'}
+
+
+def test_verify_email_concurrent_misses_call_api_once(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test concurrent cache misses for one email share a single API call."""
+    service = EmailVerificationService(hunter_client, memory_storage)
+
+    def verify(email: str) -> Dict[str, Any]:
+        time.sleep(0.1)
+        return {'email': email}
+
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=verify)
+    results: List[Dict[str, Any]] = []
+    threads = [
+        Thread(target=lambda: results.append(service.verify_email('test@example.com')))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_verify.call_count == 1
+    assert results == [{'email': 'test@example.com'}] * 5
+
+
+def test_verify_email_typed_results(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mock_email_verification_response: Dict[str, Any],
+    mocker,
+) -> None:
+    """Test typed results are returned for API calls and cache hits."""
+    service = EmailVerificationService(hunter_client, memory_storage, typed_results=True)
+    mocker.patch.object(hunter_client, 'verify_email', return_value=mock_email_verification_response)
+
+    result = service.verify_email('test@example.com')
+    cached = service.verify_email('test@example.com')
+
+    assert isinstance(result, VerificationResult)
+    assert cached is result
+    assert result == mock_email_verification_response
+    assert result.score == 95
+
+
+def test_verify_email_serves_cached_result_while_circuit_open(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test a cached result is served when the circuit is open."""
+    service = EmailVerificationService(hunter_client, memory_storage)
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'valid'})
+    mocker.patch.object(
+        hunter_client,
+        'verify_email',
+        side_effect=CircuitOpenError('email-verifier', 10.0),
+    )
+
+    assert service.verify_email('test@example.com', force_refresh=True) == {'status': 'valid'}
+    with pytest.raises(CircuitOpenError):
+        service.verify_email('other@example.com')
+
+
+def test_verify_email_serves_expired_result_while_circuit_open(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test results kept for stale_if_error_ttl are only served while the circuit is open."""
+    service = EmailVerificationService(hunter_client, memory_storage, ttl=60, stale_if_error_ttl=3600)
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'old'}, ttl=1000)
+    mock_verify = mocker.patch.object(
+        hunter_client,
+        'verify_email',
+        side_effect=[CircuitOpenError('email-verifier', 10.0), {'status': 'new'}],
+    )
+
+    assert service.get_cached_result('test@example.com') is None
+    assert service.verify_email('test@example.com') == {'status': 'old'}
+    assert service.verify_email('test@example.com') == {'status': 'new'}
+    assert mock_verify.call_count == 2
+    _, remaining = memory_storage.read_with_ttl(email_cache_key('test@example.com'))
+    assert remaining > 3600
+
+
+def test_verify_email_serves_stale_result_while_refreshing(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test expired results within the grace period are served and refreshed once."""
+    service = EmailVerificationService(hunter_client, memory_storage, ttl=60, stale_ttl=300)
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'old'}, ttl=100)
+    mock_verify = mocker.patch.object(
+        hunter_client,
+        'verify_email',
+        side_effect=lambda email: time.sleep(0.05) or {'status': 'new'},
+    )
+
+    assert service.verify_email('test@example.com') == {'status': 'old'}
+    assert service.verify_email('test@example.com') == {'status': 'old'}
+    service._refresher.join()
+
+    mock_verify.assert_called_once_with('test@example.com')
+    value, remaining = memory_storage.read_with_ttl(email_cache_key('test@example.com'))
+    assert value == {'status': 'new'}
+    assert remaining > 300
+    assert service.verify_email('test@example.com') == {'status': 'new'}
+
+
+def test_close_stops_refresh_threads(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test closing a service finishes pending refreshes and stops their threads."""
+    mocker.patch.object(hunter_client, 'verify_email', side_effect=lambda email: time.sleep(0.05) or {'status': 'new'})
+    memory_storage.create(email_cache_key('test@example.com'), {'status': 'old'}, ttl=100)
+    existing = set(threading.enumerate())
+
+    with EmailVerificationService(hunter_client, memory_storage, ttl=60, stale_ttl=300) as service:
+        assert service.verify_email('test@example.com') == {'status': 'old'}
+        threads = set(threading.enumerate()) - existing
+
+    assert memory_storage.read(email_cache_key('test@example.com')) == {'status': 'new'}
+    assert threads
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_verify_email_records_domain_facts(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test domain-wide facts of a response are indexed by domain."""
+    service = EmailVerificationService(hunter_client, memory_storage)
+    mocker.patch.object(hunter_client, 'verify_email', return_value={
+        'status': 'valid',
+        'accept_all': True,
+        'disposable': False,
+        'webmail': False,
+        'mx_records': True,
+        'smtp_check': True,
+    })
+
+    service.verify_email('john@example.com')
+
+    assert service.domain_facts('Example.COM') == {
+        'accept_all': True,
+        'disposable': False,
+        'webmail': False,
+        'mx_records': True,
+    }
+    assert service.domain_facts('other.com') is None
+
+
+def test_verify_many_skips_undeliverable_domains(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test one call per disposable domain answers its remaining addresses."""
+    service = EmailVerificationService(hunter_client, memory_storage, skip_undeliverable_domains=True)
+
+    def verify(email: str) -> Dict[str, Any]:
+        disposable = email.endswith('@trash.com')
+        return {'email': email, 'status': 'disposable' if disposable else 'valid', 'disposable': disposable}
+
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', side_effect=verify)
+    emails = [f'user{i}@trash.com' for i in range(5)] + ['a@example.com', 'b@example.com']
+
+    results = dict(service.verify_many(emails, max_workers=4))
+
+    called = [call.args[0] for call in mock_verify.call_args_list]
+    assert sum(email.endswith('@trash.com') for email in called) == 1
+    assert sorted(email for email in called if email.endswith('@example.com')) == ['a@example.com', 'b@example.com']
+    assert all(results[email]['status'] == 'disposable' for email in emails[:5])
+    assert sum(bool(results[email].get('inferred_from_domain')) for email in emails[:5]) == 4
+    assert service.verify_email('later@trash.com')['inferred_from_domain'] is True
+    assert mock_verify.call_count == 3
+
+
+def test_domain_facts_ignored_unless_enabled(
+    hunter_client: HunterClient,
+    memory_storage: MemoryStorage,
+    mocker,
+) -> None:
+    """Test addresses at dead domains are still verified by default."""
+    service = EmailVerificationService(hunter_client, memory_storage)
+    mock_verify = mocker.patch.object(hunter_client, 'verify_email', return_value={'mx_records': False})
+
+    service.verify_email('a@dead.com')
+    service.verify_email('b@dead.com')
+
+    assert mock_verify.call_count == 2
+
+
+def test_verify_email_with_storage_without_ttl_support(
+    hunter_client: HunterClient,
+    mock_email_verification_response: Dict[str, Any],
+) -> None:
+    """Test storages implementing only the original create/update signatures keep working."""
+    class KeyValueStorage(BaseStorage):
+        def __init__(self) -> None:
+            self.data: Dict[str, Dict[str, Any]] = {}
+
+        def create(self, key: str, value: Dict[str, Any]) -> None:
+            if key in self.data:
+                raise KeyError(key)
+            self.data[key] = value
+
+        def read(self, key: str) -> Any:
+            return self.data.get(key)
+
+        def update(self, key: str, value: Dict[str, Any]) -> None:
+            if key not in self.data:
+                raise KeyError(key)
+            self.data[key] = value
+
+        def delete(self, key: str) -> None:
+            del self.data[key]
+
+    storage = KeyValueStorage()
+    service = EmailVerificationService(hunter_client, storage, ttl=60)
+
+    assert service.verify_email('test@example.com') == mock_email_verification_response
+    assert service.verify_email('test@example.com', force_refresh=True) == mock_email_verification_response
+    assert storage.data[email_cache_key('test@example.com')] == mock_email_verification_response
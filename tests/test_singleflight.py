@@ -0,0 +1,87 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import time
+from threading import Barrier, Thread
+from typing import List
+
+import pytest
+
+from hunter_sdk.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls() -> None:
+    """Test concurrent calls for one key run the function once."""
+    flight: SingleFlight[int] = SingleFlight()
+    calls: List[int] = []
+    results: List[int] = []
+    barrier = Barrier(5)
+
+    def fn() -> int:
+        calls.append(1)
+        time.sleep(0.1)
+        return 42
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(flight.do('key', fn))
+
+    threads = [Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [42] * 5
+
+
+def test_single_flight_shares_errors_and_forgets_key() -> None:
+    """Test errors propagate and the key can be retried afterwards."""
+    flight: SingleFlight[int] = SingleFlight()
+
+    with pytest.raises(ValueError):
+        flight.do('key', lambda: int('not a number'))
+
+    assert flight.do('key', lambda: 1) == 1
+
+
+def test_async_single_flight_coalesces_concurrent_calls() -> None:
+    """Test concurrent awaits for one key run the coroutine once."""
+    flight: AsyncSingleFlight[int] = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def fn() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> List[int]:
+        return await asyncio.gather(*(flight.do('key', fn) for _ in range(5)))
+
+    assert asyncio.run(run()) == [42] * 5
+    assert len(calls) == 1
+
+
+def test_async_single_flight_follower_takes_over_cancelled_call() -> None:
+    """Test cancelling the task running the call doesn't cancel the tasks waiting on it."""
+    flight: AsyncSingleFlight[int] = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def fn() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> List[int]:
+        leader = asyncio.ensure_future(flight.do('key', fn))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do('key', fn)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(run()) == [42] * 3
+    assert len(calls) == 2
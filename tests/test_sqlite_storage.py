@@ -0,0 +1,136 @@
+"""Tests for SQLite storage implementation."""
+
+import time
+from pathlib import Path
+from threading import Thread
+from typing import Iterator
+
+import pytest
+
+from hunter_sdk.models import VerificationResult
+from hunter_sdk.storage import SQLiteStorage
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path: Path) -> Iterator[SQLiteStorage]:
+    """Create SQLite storage in a temporary database file."""
+    storage = SQLiteStorage(str(tmp_path / 'cache.db'))
+    yield storage
+    storage.close()
+
+
+def test_sqlite_storage_crud(sqlite_storage: SQLiteStorage) -> None:
+    """Test create, read, update and delete round trip."""
+    sqlite_storage.create('test', {'status': 'valid', 'sources': [{'domain': 'example.com'}]})
+    assert sqlite_storage.read('test') == {'status': 'valid', 'sources': [{'domain': 'example.com'}]}
+
+    sqlite_storage.update('test', {'status': 'invalid'})
+    assert sqlite_storage.read('test') == {'status': 'invalid'}
+
+    sqlite_storage.delete('test')
+    assert sqlite_storage.read('test') is None
+
+
+def test_sqlite_storage_key_errors(sqlite_storage: SQLiteStorage) -> None:
+    """Test SQLite storage matches MemoryStorage key semantics."""
+    sqlite_storage.create('test', {'data': 1})
+    with pytest.raises(KeyError):
+        sqlite_storage.create('test', {'data': 2})
+    with pytest.raises(KeyError):
+        sqlite_storage.update('missing', {'data': 1})
+    with pytest.raises(KeyError):
+        sqlite_storage.delete('missing')
+
+
+def test_sqlite_storage_ttl(sqlite_storage: SQLiteStorage) -> None:
+    """Test expired records are hidden, replaceable and purged."""
+    sqlite_storage.create('short', {'data': 1}, ttl=0.05)
+    sqlite_storage.create('gone', {'data': 2}, ttl=0.05)
+    sqlite_storage.create('long', {'data': 3}, ttl=60)
+
+    time.sleep(0.06)
+
+    assert sqlite_storage.read('short') is None
+    sqlite_storage.create('short', {'data': 4})
+    assert sqlite_storage.read('short') == {'data': 4}
+    assert sqlite_storage.purge_expired() == 1
+    assert sqlite_storage.read('long') == {'data': 3}
+
+
+def test_sqlite_storage_survives_reopen(tmp_path: Path) -> None:
+    """Test records persist across storage instances."""
+    path = str(tmp_path / 'cache.db')
+    storage = SQLiteStorage(path)
+    storage.create('test', {'data': 1})
+    storage.close()
+
+    reopened = SQLiteStorage(path)
+    assert reopened.read('test') == {'data': 1}
+    reopened.close()
+
+
+def test_sqlite_storage_batch(sqlite_storage: SQLiteStorage) -> None:
+    """Test batched writes commit together and roll back together."""
+    with sqlite_storage.batch():
+        for index in range(100):
+            sqlite_storage.create(str(index), {'data': index})
+    assert sqlite_storage.read('99') == {'data': 99}
+
+    with pytest.raises(KeyError):
+        with sqlite_storage.batch():
+            sqlite_storage.create('new', {'data': 1})
+            sqlite_storage.create('0', {'data': 1})
+    assert sqlite_storage.read('new') is None
+
+
+def test_sqlite_storage_threads(sqlite_storage: SQLiteStorage) -> None:
+    """Test concurrent writers each use their own connection."""
+    def worker(thread_index: int) -> None:
+        for index in range(20):
+            sqlite_storage.create(f'{thread_index}:{index}', {'data': index})
+
+    threads = [Thread(target=worker, args=(thread_index,)) for thread_index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(sqlite_storage.read(f'{thread_index}:19') == {'data': 19} for thread_index in range(4))
+
+
+def test_sqlite_storage_batch_operations(sqlite_storage: SQLiteStorage) -> None:
+    """Test native read_many, write_many and delete_many."""
+    sqlite_storage.create('0', {'data': 'old'})
+
+    sqlite_storage.write_many({str(index): {'data': index} for index in range(1200)})
+
+    found = sqlite_storage.read_many([str(index) for index in range(1200)] + ['missing'])
+    assert len(found) == 1200
+    assert found['0'] == {'data': 0}
+    assert sqlite_storage.delete_many(['0', '1', 'missing']) == 2
+    assert sqlite_storage.read_many(['0', '2']) == {'2': {'data': 2}}
+
+
+def test_sqlite_storage_upsert(sqlite_storage: SQLiteStorage) -> None:
+    """Test upsert creates missing records and overwrites existing ones."""
+    sqlite_storage.upsert('test', {'data': 1})
+    sqlite_storage.upsert('test', {'data': 2})
+    assert sqlite_storage.read('test') == {'data': 2}
+
+
+def test_sqlite_storage_accepts_models(sqlite_storage: SQLiteStorage) -> None:
+    """Test typed result models are stored as their response data."""
+    sqlite_storage.create('test', VerificationResult({'status': 'valid', 'sources': []}))
+    assert sqlite_storage.read('test') == {'status': 'valid', 'sources': []}
+
+
+def test_sqlite_storage_read_with_ttl(sqlite_storage: SQLiteStorage) -> None:
+    """Test reads report the remaining lifetime of records."""
+    sqlite_storage.create('short', {'data': 1}, ttl=60)
+    sqlite_storage.create('forever', {'data': 2})
+
+    value, remaining = sqlite_storage.read_with_ttl('short')
+    assert value == {'data': 1}
+    assert 59 < remaining <= 60
+    assert sqlite_storage.read_with_ttl('forever') == ({'data': 2}, None)
+    assert sqlite_storage.read_with_ttl('missing') is None
@@ -1,8 +1,10 @@
 """Tests for storage implementations."""
 
+import time
+
 import pytest
 
-from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.storage import BaseStorage, LRUStorage, MemoryStorage
 
 
 def test_memory_storage_create(memory_storage: MemoryStorage) -> None:
@@ -47,4 +49,175 @@ def test_memory_storage_delete(memory_storage: MemoryStorage) -> None:
 def test_memory_storage_delete_nonexistent(memory_storage: MemoryStorage) -> None:
     """Test deleting nonexistent records raises KeyError."""
     with pytest.raises(KeyError):
-        memory_storage.delete('nonexistent') 
\ No newline at end of file
+        memory_storage.delete('nonexistent')
+
+
+def test_memory_storage_ttl_expiry(memory_storage: MemoryStorage) -> None:
+    """Test records written with a ttl expire."""
+    memory_storage.create('test', {'data': 1}, ttl=0.05)
+    assert memory_storage.read('test') == {'data': 1}
+
+    time.sleep(0.06)
+
+    assert memory_storage.read('test') is None
+    memory_storage.create('test', {'data': 2})  # Expired key can be created again
+
+
+def test_lru_storage_evicts_least_recently_used() -> None:
+    """Test LRU storage evicts the least recently used record when full."""
+    storage = LRUStorage(max_entries=2)
+    storage.create('a', {'data': 1})
+    storage.create('b', {'data': 2})
+    storage.read('a')
+    storage.create('c', {'data': 3})
+
+    assert storage.read('b') is None
+    assert storage.read('a') == {'data': 1}
+    assert storage.read('c') == {'data': 3}
+    assert storage.stats.evictions == 1
+
+
+def test_lru_storage_max_bytes() -> None:
+    """Test LRU storage evicts records to stay under the byte limit."""
+    storage = LRUStorage(max_entries=None, max_bytes=250, sizeof=lambda value: 100)
+    for index in range(3):
+        storage.create(str(index), {'data': index})
+
+    assert storage.read('0') is None
+    assert storage.stats.entries == 2
+    assert storage.stats.bytes == 200
+
+
+def test_lru_storage_ttl() -> None:
+    """Test per-key and default ttl expire lazily and by sweep."""
+    storage = LRUStorage(default_ttl=0.05)
+    storage.create('default', {'data': 1})
+    storage.create('long', {'data': 2}, ttl=60)
+    storage.create('swept', {'data': 3})
+
+    time.sleep(0.06)
+
+    assert storage.read('default') is None
+    assert storage.sweep() == 1
+    assert storage.read('long') == {'data': 2}
+    assert storage.stats.expirations == 2
+
+
+def test_lru_storage_stats() -> None:
+    """Test hit and miss counters."""
+    storage = LRUStorage()
+    storage.create('test', {'data': 1})
+    storage.read('test')
+    storage.read('missing')
+
+    stats = storage.stats
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_lru_storage_key_errors() -> None:
+    """Test LRU storage matches MemoryStorage key semantics."""
+    storage = LRUStorage()
+    storage.create('test', {'data': 1})
+    with pytest.raises(KeyError):
+        storage.create('test', {'data': 2})
+    with pytest.raises(KeyError):
+        storage.update('missing', {'data': 1})
+    storage.delete('test')
+    with pytest.raises(KeyError):
+        storage.delete('test')
+
+
+@pytest.mark.parametrize('storage_factory', [MemoryStorage, LRUStorage])
+def test_batch_operations(storage_factory) -> None:
+    """Test read_many, write_many and delete_many on in-memory backends."""
+    storage = storage_factory()
+    storage.create('a', {'data': 1})
+
+    storage.write_many({'a': {'data': 2}, 'b': {'data': 3}})
+
+    assert storage.read_many(['a', 'b', 'missing']) == {'a': {'data': 2}, 'b': {'data': 3}}
+    assert storage.delete_many(['a', 'missing']) == 1
+    assert storage.read_many(['a', 'b']) == {'b': {'data': 3}}
+
+
+def test_base_storage_batch_defaults() -> None:
+    """Test BaseStorage batch defaults built on single-key operations."""
+    class DictStorage(BaseStorage):
+        def __init__(self) -> None:
+            self.data = {}
+
+        def create(self, key, value, ttl=None) -> None:
+            if key in self.data:
+                raise KeyError(key)
+            self.data[key] = value
+
+        def read(self, key):
+            return self.data.get(key)
+
+        def update(self, key, value, ttl=None) -> None:
+            if key not in self.data:
+                raise KeyError(key)
+            self.data[key] = value
+
+        def delete(self, key) -> None:
+            del self.data[key]
+
+    storage = DictStorage()
+    storage.create('a', {'data': 1})
+
+    storage.write_many({'a': {'data': 2}, 'b': {'data': 3}})
+
+    assert storage.read_many(['a', 'b', 'missing']) == {'a': {'data': 2}, 'b': {'data': 3}}
+    assert storage.delete_many(['a', 'missing']) == 1
+
+
+@pytest.mark.parametrize('storage_factory', [MemoryStorage, LRUStorage])
+def test_upsert(storage_factory) -> None:
+    """Test upsert creates missing records and overwrites existing ones."""
+    storage = storage_factory()
+    storage.upsert('test', {'data': 1})
+    storage.upsert('test', {'data': 2})
+    assert storage.read('test') == {'data': 2}
+
+
+def test_get_or_set(memory_storage: MemoryStorage) -> None:
+    """Test get_or_set only calls the factory on a miss."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {'data': len(calls)}
+
+    assert memory_storage.get_or_set('test', factory) == {'data': 1}
+    assert memory_storage.get_or_set('test', factory) == {'data': 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('storage_factory', [MemoryStorage, LRUStorage])
+def test_reads_share_read_only_records(storage_factory) -> None:
+    """Test reads return the same read-only object without copying."""
+    storage = storage_factory()
+    value = {'sources': [{'domain': 'example.com'}]}
+    storage.create('test', value)
+    value['sources'].append({'domain': 'changed.com'})
+
+    first = storage.read('test')
+
+    assert first is storage.read('test')
+    assert first == {'sources': [{'domain': 'example.com'}]}
+    with pytest.raises(TypeError):
+        first['sources'].append({})
+
+
+@pytest.mark.parametrize('storage_factory', [MemoryStorage, LRUStorage])
+def test_read_with_ttl(storage_factory) -> None:
+    """Test reads report the remaining lifetime of records."""
+    storage = storage_factory()
+    storage.create('short', {'data': 1}, ttl=60)
+    storage.create('forever', {'data': 2})
+
+    value, remaining = storage.read_with_ttl('short')
+    assert value == {'data': 1}
+    assert 59 < remaining <= 60
+    assert storage.read_with_ttl('forever') == ({'data': 2}, None)
+    assert storage.read_with_ttl('missing') is None
@@ -0,0 +1,119 @@
+"""Tests for two-tier storage."""
+
+import time
+
+import pytest
+
+from hunter_sdk.storage import MemoryStorage, TieredStorage
+
+
+@pytest.fixture
+def l2(mocker) -> MemoryStorage:
+    """Create shared storage whose reads can be counted."""
+    storage = MemoryStorage()
+    mocker.spy(storage, 'read_with_ttl')
+    mocker.spy(storage, 'read_many')
+    return storage
+
+
+def test_read_through_fills_l1(l2: MemoryStorage) -> None:
+    """Test repeated reads are served from L1 after the first L2 read."""
+    l2.create('key', {'data': 1}, ttl=60)
+    storage = TieredStorage(l2)
+
+    assert storage.read('key') == {'data': 1}
+    assert storage.read('key') == {'data': 1}
+
+    assert l2.read_with_ttl.call_count == 1
+    assert storage.stats.hits == 1
+    value, remaining = storage.read_with_ttl('key')
+    assert value == {'data': 1}
+    assert 59 < remaining <= 60
+
+
+def test_write_through(l2: MemoryStorage) -> None:
+    """Test writes reach L2 and are readable without an L2 round trip."""
+    storage = TieredStorage(l2)
+
+    storage.create('a', {'data': 1})
+    storage.upsert('b', {'data': 2})
+    storage.update('a', {'data': 3})
+    storage.write_many({'c': {'data': 4}})
+
+    assert l2.read_many(['a', 'b', 'c']) == {'a': {'data': 3}, 'b': {'data': 2}, 'c': {'data': 4}}
+    assert storage.read_many(['a', 'b', 'c']) == {'a': {'data': 3}, 'b': {'data': 2}, 'c': {'data': 4}}
+    assert l2.read_with_ttl.call_count == 0
+    with pytest.raises(KeyError):
+        storage.create('a', {'data': 5})
+
+
+def test_negative_caching(l2: MemoryStorage) -> None:
+    """Test known misses skip L2 until negative_ttl passes."""
+    storage = TieredStorage(l2, negative_ttl=0.05)
+
+    assert storage.read('missing') is None
+    l2.create('missing', {'data': 1})
+    assert storage.read('missing') is None
+    assert l2.read_with_ttl.call_count == 1
+
+    time.sleep(0.06)
+    assert storage.read('missing') == {'data': 1}
+
+
+def test_writes_replace_negative_entries(l2: MemoryStorage) -> None:
+    """Test a write through the tier is visible despite a cached miss."""
+    storage = TieredStorage(l2)
+
+    assert storage.read('key') is None
+    storage.upsert('key', {'data': 1})
+
+    assert storage.read('key') == {'data': 1}
+
+
+def test_l1_ttl_bounds_staleness(l2: MemoryStorage) -> None:
+    """Test changes made directly in L2 are seen once the L1 copy expires."""
+    storage = TieredStorage(l2, l1_ttl=0.05)
+    storage.create('key', {'data': 1})
+    l2.update('key', {'data': 2})
+
+    assert storage.read('key') == {'data': 1}
+    time.sleep(0.06)
+    assert storage.read('key') == {'data': 2}
+
+
+def test_delete_propagates(l2: MemoryStorage) -> None:
+    """Test deletes remove records from both tiers."""
+    storage = TieredStorage(l2)
+    storage.write_many({'a': {'data': 1}, 'b': {'data': 2}, 'c': {'data': 3}})
+
+    storage.delete('a')
+    assert storage.delete_many(['b', 'missing']) == 1
+
+    assert storage.read_many(['a', 'b', 'c']) == {'c': {'data': 3}}
+    assert l2.read_many(['a', 'b', 'c']) == {'c': {'data': 3}}
+    with pytest.raises(KeyError):
+        storage.delete('a')
+
+
+def test_read_many_batches_l1_misses(l2: MemoryStorage) -> None:
+    """Test L1 misses are read from L2 in one batch."""
+    l2.write_many({'a': {'data': 1}, 'b': {'data': 2}})
+    storage = TieredStorage(l2)
+    storage.read('a')
+
+    assert storage.read_many(['a', 'b', 'c']) == {'a': {'data': 1}, 'b': {'data': 2}}
+    l2.read_many.assert_called_once_with(['b', 'c'])
+    assert storage.read_many(['a', 'b', 'c']) == {'a': {'data': 1}, 'b': {'data': 2}}
+    assert l2.read_many.call_count == 1
+
+
+def test_l1_is_bounded(l2: MemoryStorage) -> None:
+    """Test L1 evicts the least recently used entries."""
+    storage = TieredStorage(l2, max_entries=2)
+    for key in 'abc':
+        storage.upsert(key, {'key': key})
+
+    assert storage.stats.entries == 2
+    assert storage.stats.evictions == 1
+    assert storage.read('a') == {'key': 'a'}
+    assert l2.read_with_ttl.call_count == 1
@@ -0,0 +1,204 @@
+"""Tests for tracing hooks, the slow call logger and the OpenTelemetry adapter."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+import requests
+
+from hunter_sdk import AsyncHunterClient, HunterClient, HunterConfig
+from hunter_sdk.services import AsyncEmailVerificationService, DomainSearchService, EmailVerificationService
+from hunter_sdk.storage import MemoryStorage
+from hunter_sdk.tracing import CallTrace, MultiTracer, NoOpTracer, SlowCallLogger, Tracer
+
+
+class RecordingTracer(Tracer):
+    """Tracer recording every hook call."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, Any]] = []
+        self.calls: List[CallTrace] = []
+
+    def before_request(self, call: CallTrace) -> None:
+        self.events.append(('before_request', call.attempts))
+
+    def after_response(self, call: CallTrace) -> None:
+        self.events.append(('after_response', call.status))
+
+    def on_retry(self, call: CallTrace, delay: float) -> None:
+        self.events.append(('on_retry', delay))
+
+    def after_call(self, call: CallTrace) -> None:
+        self.events.append(('after_call', call.error))
+        self.calls.append(call)
+
+
+def ok_response(mocker, data: Dict[str, Any]) -> Any:
+    """Build a successful mocked response."""
+    return mocker.Mock(ok=True, status_code=200, content=json.dumps({'data': data}).encode())
+
+
+def make_client(tracer: Tracer, **options: Any) -> HunterClient:
+    """Create a client without rate limiting or retry delays."""
+    return HunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, retry_delay=0, tracer=tracer, **options))
+
+
+def test_hooks_follow_attempts_and_retries(mocker) -> None:
+    """Test hooks run per attempt, per retry and once per call."""
+    tracer = RecordingTracer()
+    client = make_client(tracer)
+    mocker.patch.object(client._session, 'request', side_effect=[
+        requests.ConnectionError('reset'),
+        ok_response(mocker, {'status': 'valid'}),
+    ])
+    mocker.patch('hunter_sdk.retry.RetryState.next_delay', return_value=0.0)
+
+    client.verify_email('test@example.com')
+
+    assert tracer.events == [
+        ('before_request', 1),
+        ('after_response', 'error'),
+        ('on_retry', 0.0),
+        ('before_request', 2),
+        ('after_response', '200'),
+        ('after_call', None),
+    ]
+    call = tracer.calls[0]
+    assert (call.method, call.endpoint, call.attempts, call.status) == ('GET', 'email-verifier', 2, '200')
+    assert call.queue_wait is None
+    assert call.total >= call.server + call.decode
+
+
+def test_failed_call_is_reported(mocker) -> None:
+    """Test after_call receives the error of a failed call."""
+    tracer = RecordingTracer()
+    client = make_client(tracer)
+    mocker.patch.object(client._session, 'request', return_value=mocker.Mock(
+        ok=False,
+        status_code=400,
+        content=json.dumps({'errors': [{'details': 'Invalid email'}]}).encode(),
+    ))
+
+    with pytest.raises(Exception):
+        client.verify_email('test@example.com')
+
+    assert tracer.calls[0].status == '400'
+    assert 'Invalid email' in str(tracer.calls[0].error)
+
+
+def test_service_spans_reach_the_client(mocker) -> None:
+    """Test calls made inside a service span carry it and its queue wait."""
+    tracer = RecordingTracer()
+    client = make_client(tracer)
+    mocker.patch.object(client._session, 'request', return_value=ok_response(mocker, {'status': 'valid'}))
+    service = EmailVerificationService(client, MemoryStorage())
+
+    service.verify_email('John@Example.com')
+    dict(service.verify_many(['other@example.com']))
+
+    spans = [(call.span.name, call.span.attributes['email']) for call in tracer.calls]
+    assert spans == [('hunter.verify_email', 'john@example.com'), ('hunter.verify_email', 'other@example.com')]
+    assert all(call.queue_wait is not None and call.queue_wait >= 0 for call in tracer.calls)
+
+
+def test_slow_call_logger(mocker, caplog) -> None:
+    """Test only calls over the threshold are logged with their breakdown."""
+    client = make_client(MultiTracer(SlowCallLogger(threshold=0.0), NoOpTracer()))
+    mocker.patch.object(client._session, 'request', return_value=ok_response(mocker, {'emails': []}))
+    service = DomainSearchService(client, MemoryStorage())
+
+    with caplog.at_level(logging.WARNING, logger='hunter_sdk.tracing'):
+        service.search_domain('example.com')
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert 'GET domain-search in hunter.search_domain' in message
+    assert 'status 200 after 1 attempt(s)' in message
+    for phase in ('queue_wait', 'rate_limit_wait', 'connect', 'server', 'decode', 'backoff'):
+        assert phase in message
+
+
+def test_slow_call_logger_threshold(mocker, caplog) -> None:
+    """Test fast calls are not logged."""
+    client = make_client(SlowCallLogger(threshold=60.0))
+    mocker.patch.object(client._session, 'request', return_value=ok_response(mocker, {'status': 'valid'}))
+
+    with caplog.at_level(logging.WARNING, logger='hunter_sdk.tracing'):
+        client.verify_email('test@example.com')
+
+    assert not caplog.records
+
+
+def test_async_client_traces_spans_and_retries() -> None:
+    """Test the async client reports attempts and service spans across tasks."""
+    tracer = RecordingTracer()
+    client = AsyncHunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, retry_delay=0, tracer=tracer))
+    responses = {'a@example.com': [httpx.Response(503)]}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pending = responses.get(request.url.params['email'])
+        if pending:
+            return pending.pop()
+        return httpx.Response(200, json={'data': {'status': 'valid'}})
+
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = AsyncEmailVerificationService(client, MemoryStorage())
+
+    async def verify() -> None:
+        async for _ in service.verify_many(['a@example.com', 'b@example.com']):
+            pass
+
+    asyncio.run(verify())
+
+    calls = {call.span.attributes['email']: call for call in tracer.calls}
+    assert calls['a@example.com'].attempts == 2
+    assert calls['b@example.com'].attempts == 1
+    assert tracer.events.count(('after_response', '503')) == 1
+    assert all(call.span.name == 'hunter.verify_email' for call in tracer.calls)
+
+
+def test_connect_time_is_measured_once_per_connection(local_api) -> None:
+    """Test new connections report setup time and reused ones do not."""
+    tracer = RecordingTracer()
+    client = make_client(tracer, base_url=local_api.base_url)
+
+    client.verify_email('a@example.com')
+    client.verify_email('b@example.com')
+
+    first, second = tracer.calls
+    assert first.connect > 0
+    assert second.connect == 0
+    assert first.server > 0
+
+
+def test_opentelemetry_tracer(mocker) -> None:
+    """Test service spans parent the API call spans, across verify_many threads."""
+    sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from hunter_sdk.tracing import OpenTelemetryTracer
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    otel_tracer = provider.get_tracer('test')
+    client = make_client(OpenTelemetryTracer(otel_tracer))
+    mocker.patch.object(client._session, 'request', return_value=ok_response(mocker, {'status': 'valid'}))
+    service = EmailVerificationService(client, MemoryStorage())
+
+    with otel_tracer.start_as_current_span('batch'):
+        dict(service.verify_many(['a@example.com', 'b@example.com'], max_workers=2))
+
+    spans = {span.name: span for span in exporter.get_finished_spans() if span.name != 'hunter.verify_email'}
+    service_spans = [span for span in exporter.get_finished_spans() if span.name == 'hunter.verify_email']
+    assert len(service_spans) == 2
+    assert all(span.parent.span_id == spans['batch'].context.span_id for span in service_spans)
+    call_spans = [span for span in exporter.get_finished_spans() if span.name == 'GET email-verifier']
+    assert {span.parent.span_id for span in call_spans} == {span.context.span_id for span in service_spans}
+    assert call_spans[0].attributes['http.response.status_code'] == 200
+    assert call_spans[0].attributes['hunter.attempts'] == 1
+    assert 'hunter.server' in call_spans[0].attributes
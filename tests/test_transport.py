@@ -0,0 +1,181 @@
+"""Tests for HTTP transports, connection pooling and timeouts."""
+
+import asyncio
+import importlib.util
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from hunter_sdk import AsyncHunterClient, HunterClient, HunterConfig
+from hunter_sdk.exceptions import ConfigurationError, HunterConnectionError
+from hunter_sdk.transport import HTTPXTransport, RequestsTransport, Transport
+
+
+def make_client(**options: Any) -> HunterClient:
+    """Create a client without rate limiting or retry delays."""
+    return HunterClient(HunterConfig(api_key='test-api-key', rate_limit=None, retry_delay=0, **options))
+
+
+def verify_concurrently(client: HunterClient, calls: int, workers: int) -> None:
+    """Verify calls addresses on workers threads sharing client."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(client.verify_email, [f'user{index}@example.com' for index in range(calls)]))
+
+
+def test_default_transport_is_pooled_requests_session() -> None:
+    """Test the default transport uses the configured pool size."""
+    client = make_client(pool_connections=4, pool_maxsize=32)
+
+    assert isinstance(client._session, RequestsTransport)
+    adapter = client._session.session.get_adapter('https://api.hunter.io')
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+
+
+def test_small_pool_discards_connections(local_api) -> None:
+    """Test threads outnumbering the pool open connections that get discarded."""
+    local_api.delay = 0.02
+    client = make_client(base_url=local_api.base_url, pool_maxsize=2)
+
+    verify_concurrently(client, calls=32, workers=8)
+
+    stats = client.pool_stats()
+    assert (stats.pools, stats.maxsize, stats.requests, stats.in_use) == (1, 2, 32, 0)
+    assert stats.opened > 2
+    assert stats.discarded > 0
+    assert stats.idle == stats.open == 2
+
+
+def test_sized_pool_reuses_connections(local_api) -> None:
+    """Test a pool as large as the thread count keeps every connection."""
+    local_api.delay = 0.02
+    client = make_client(base_url=local_api.base_url, pool_maxsize=8)
+
+    verify_concurrently(client, calls=32, workers=8)
+
+    stats = client.pool_stats()
+    assert stats.discarded == 0
+    assert stats.opened <= 8
+    assert stats.reuse_ratio >= 0.75
+
+
+def test_blocking_pool_never_exceeds_maxsize(local_api) -> None:
+    """Test a blocking pool makes threads wait for a connection."""
+    local_api.delay = 0.01
+    client = make_client(base_url=local_api.base_url, pool_maxsize=2, pool_block=True)
+
+    verify_concurrently(client, calls=16, workers=8)
+
+    stats = client.pool_stats()
+    assert stats.opened <= 2
+    assert stats.discarded == 0
+
+
+def test_keep_alive_and_compression_headers(local_api) -> None:
+    """Test keep-alive and compression can be turned off."""
+    client = make_client(base_url=local_api.base_url)
+    client.verify_email('a@example.com')
+    plain = make_client(base_url=local_api.base_url, keep_alive=False, compression=False)
+    plain.verify_email('a@example.com')
+    plain.verify_email('b@example.com')
+
+    default_headers, *plain_headers = local_api.headers
+    assert 'gzip' in default_headers['Accept-Encoding']
+    assert default_headers['Connection'] == 'keep-alive'
+    assert all(headers['Connection'] == 'close' for headers in plain_headers)
+    assert all(headers['Accept-Encoding'] == 'identity' for headers in plain_headers)
+    assert plain.pool_stats().opened == 2
+
+
+@pytest.mark.parametrize('options, timeout', [
+    ({}, 30),
+    ({'connect_timeout': 2.0}, (2.0, 30)),
+    ({'connect_timeout': 2.0, 'read_timeout': 10.0}, (2.0, 10.0)),
+    ({'read_timeout': 10.0, 'total_timeout': 5.0}, (5.0, 5.0)),
+])
+def test_attempt_timeouts(mocker, options, timeout) -> None:
+    """Test connect and read timeouts fall back to timeout and fit the deadline."""
+    client = make_client(**options)
+    request = mocker.patch.object(client._session, 'request', return_value=mocker.Mock(
+        ok=True,
+        status_code=200,
+        content=json.dumps({'data': {}}).encode(),
+    ))
+
+    client.verify_email('test@example.com')
+
+    sent = request.call_args.kwargs['timeout']
+    assert sent == pytest.approx(timeout, abs=0.1)
+
+
+def test_httpx_transport(local_api) -> None:
+    """Test requests sent through httpx reach the API and are counted."""
+    transport = HTTPXTransport(compression=False)
+    with make_client(base_url=local_api.base_url, transport=transport) as client:
+        verify_concurrently(client, calls=8, workers=4)
+        stats = client.pool_stats()
+
+    assert stats.requests == 8
+    assert 1 <= stats.open <= 4
+    assert local_api.headers[0]['Accept-Encoding'] == 'identity'
+
+
+def test_httpx_transport_errors_are_retried() -> None:
+    """Test httpx connection failures are retried like requests ones."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    client = make_client(base_url=f'http://127.0.0.1:{port}/v2', transport=HTTPXTransport())
+
+    with pytest.raises(HunterConnectionError, match='Max retries'):
+        client.verify_email('test@example.com')
+
+
+def test_httpx_transport_configuration_errors_are_not_retried() -> None:
+    """Test httpx errors caused by the request itself fail without retries."""
+    client = make_client(base_url='ftp://127.0.0.1/v2', transport=HTTPXTransport())
+
+    with pytest.raises(HunterConnectionError) as exc_info:
+        client.verify_email('test@example.com')
+
+    assert 'Max retries' not in str(exc_info.value)
+
+
+def test_incomplete_transport_cannot_be_created() -> None:
+    """Test a custom transport missing part of the interface fails when created."""
+    class RequestOnlyTransport(Transport):
+        def request(self, method: str, url: str, **kwargs: Any) -> Any:
+            """Send nothing."""
+
+    with pytest.raises(TypeError, match='pool_stats'):
+        RequestOnlyTransport()
+
+
+@pytest.mark.skipif(importlib.util.find_spec('h2') is not None, reason='h2 is installed')
+def test_http2_requires_h2() -> None:
+    """Test HTTP/2 without the h2 package is a configuration error."""
+    with pytest.raises(ConfigurationError, match='h2'):
+        make_client(http2=True)
+    with pytest.raises(ConfigurationError, match='h2'):
+        AsyncHunterClient(HunterConfig(api_key='test-api-key', http2=True))
+
+
+def test_async_client_pool_and_timeouts(local_api) -> None:
+    """Test the async client applies timeouts and reports its pool."""
+    config = HunterConfig(api_key='test-api-key', base_url=local_api.base_url, rate_limit=None, connect_timeout=2.0)
+
+    async def run() -> Any:
+        async with AsyncHunterClient(config, max_connections=4) as client:
+            await asyncio.gather(*(client.verify_email(f'user{index}@example.com') for index in range(8)))
+            return client.pool_stats(), client._attempt_timeout(client._retry_policy.start())
+
+    stats, timeout = asyncio.run(run())
+
+    assert stats.maxsize == 4
+    assert 1 <= stats.open <= 4
+    assert stats.idle == stats.open
+    assert timeout == httpx.Timeout(30, connect=2.0)